@@ -0,0 +1,536 @@
+import argparse
+import contextlib
+import itertools
+import os
+import tempfile
+import time
+import tracemalloc
+from io import StringIO
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from indicators import compute_indicators
+from screener_parser import parse_screener_stream
+from data_collector import MarketDataCollector, SCREENER_PATHS, normalize_screener_frame
+from mock_naver import MockNaverServer
+from mock_news import MockNewsServer, RECORDED_FEEDS
+from mock_screener import MockScreenerServer
+from news_sources import DEFAULT_QUERIES, FeedStateStore, GoogleNewsSource, NewsQueryCache, RssNewsSource, ticker_queries
+from feed_parser import parse_feed_stream
+from http_client import HttpClient, RetryPolicy
+from editor_insertion import count_visible_chars
+from markdown_html import markdown_to_text
+from keyword_matcher import KeywordMatcher
+from news_dedupe import dedupe_news, headline_tokens, shingles
+
+
+def _reference_indicators(hist: pd.DataFrame, change_pct: float, volume: float) -> dict:
+    """기존 종목별 calculate_technical_indicators 와 같은 계산 (비교 기준)"""
+    delta = hist['Close'].diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    rs = gain / loss
+    rsi = 100 - (100 / (1 + rs))
+    current_rsi = rsi.iloc[-1]
+
+    exp1 = hist['Close'].ewm(span=12, adjust=False).mean()
+    exp2 = hist['Close'].ewm(span=26, adjust=False).mean()
+    macd = exp1 - exp2
+    signal = macd.ewm(span=9, adjust=False).mean()
+    current_macd = macd.iloc[-1]
+
+    score = 0
+    if change_pct > 0:
+        score += change_pct * 0.5
+    if volume > hist['Volume'].mean():
+        score += 10
+    if 30 <= current_rsi <= 70:
+        score += 15
+    elif current_rsi < 30:
+        score += 20
+    if current_macd > signal.iloc[-1]:
+        score += 15
+    return {'rsi': current_rsi, 'macd': current_macd, 'score': score}
+
+
+def _synthetic_universe(num_symbols: int, num_days: int = 22, seed: int = 0):
+    """임의의 (날짜 × 종목) 종가/거래량 행렬과 스크리너 값을 만듭니다. 일부 종목은 상장일이 늦습니다."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=num_days)
+    symbols = [f"SYM{i}" for i in range(num_symbols)]
+    close = 100 + rng.normal(0, 1.5, (num_days, num_symbols)).cumsum(axis=0)
+    volume = rng.integers(100_000, 5_000_000, (num_days, num_symbols)).astype(float)
+    late_listed = rng.random(num_symbols) < 0.1
+    close[:5, late_listed] = np.nan
+    volume[:5, late_listed] = np.nan
+    close_df = pd.DataFrame(close, index=dates, columns=symbols)
+    volume_df = pd.DataFrame(volume, index=dates, columns=symbols)
+    change_pct = pd.Series(rng.normal(0, 5, num_symbols), index=symbols)
+    screener_volume = pd.Series(rng.integers(100_000, 5_000_000, num_symbols).astype(float), index=symbols)
+    return close_df, volume_df, change_pct, screener_volume
+
+
+def bench_indicators(sizes):
+    """종목 수별로 행렬 엔진과 기존 종목별 계산의 소요 시간을 비교하고 결과 일치를 확인합니다."""
+    print(f"{'symbols':>8} {'engine(ms)':>12} {'per-symbol(ms)':>15} {'speedup':>8}  match")
+    for size in sizes:
+        close, volume, change_pct, screener_volume = _synthetic_universe(size)
+
+        start = time.perf_counter()
+        engine = compute_indicators(close, volume, change_pct, screener_volume)
+        engine_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        reference = {}
+        for symbol in close.columns:
+            hist = pd.DataFrame({'Close': close[symbol], 'Volume': volume[symbol]}).dropna(how='all')
+            reference[symbol] = _reference_indicators(hist, change_pct[symbol], screener_volume[symbol])
+        reference_ms = (time.perf_counter() - start) * 1000
+
+        reference = pd.DataFrame(reference).T
+        match = (
+            np.allclose(engine['rsi'], reference['rsi'].astype(float), rtol=1e-12, equal_nan=True)
+            and np.array_equal(engine['macd'].to_numpy(), reference['macd'].astype(float).to_numpy())
+            and np.array_equal(engine['score'].to_numpy(), reference['score'].astype(float).to_numpy())
+        )
+        print(f"{size:>8} {engine_ms:>12.1f} {reference_ms:>15.1f} {reference_ms / engine_ms:>7.1f}x  {'OK' if match else 'MISMATCH'}")
+
+
+def _synthetic_screener_page(num_rows: int = 100, extra_tables: int = 5, script_kb: int = 1500) -> bytes:
+    """Yahoo 스크리너와 비슷한 구조(큰 스크립트 + 첫 번째 표 + 추가 표들)의 HTML 을 만듭니다."""
+    rng = np.random.default_rng(0)
+    header = ''.join(f"<th><span>{name}</span></th>" for name in
+                     ['Symbol', 'Name', 'Price', 'Change', 'Change %', 'Volume', 'Avg Vol (3M)', 'Market Cap'])
+    rows = []
+    for i in range(num_rows):
+        price = rng.uniform(1, 500)
+        change = rng.normal(0, 5)
+        rows.append(
+            f"<tr><td><a href='/quote/S{i}'><span>S{i}</span></a></td><td><div title='Company {i}'>Company {i} Inc.</div></td>"
+            f"<td><fin-streamer>{price:,.2f}</fin-streamer> <span>{change:+.2f}</span> <span>({change:+.2f}%)</span></td>"
+            f"<td>{change:+.2f}</td><td><span>{change:+.2f}%</span></td><td>{rng.uniform(1, 900):.3f}M</td>"
+            f"<td>{rng.uniform(1, 900):.3f}M</td><td>{rng.uniform(1, 900):.3f}B</td></tr>"
+        )
+    table = f"<table><thead><tr>{header}</tr></thead><tbody>{''.join(rows)}</tbody></table>"
+    script = "<script>window.__DATA__=" + ('{"k":"' + 'x' * 1000 + '"},') * script_kb + "{}</script>"
+    tail = table * extra_tables
+    return f"<html><head>{script}</head><body><div>{table}</div><div>{tail}</div>{script}</body></html>".encode('utf-8')
+
+
+def _measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed_ms, peak / (1024 * 1024)
+
+
+def bench_screener(html_files):
+    """스트리밍 첫 번째 표 파서와 pandas.read_html 의 파싱 시간과 최대 메모리를 비교합니다."""
+    pages = [(Path(path).name, Path(path).read_bytes()) for path in html_files] or [('synthetic', _synthetic_screener_page())]
+    print(f"{'page':>20} {'size(KB)':>9} {'read_html(ms)':>14} {'peak(MB)':>9} {'stream(ms)':>11} {'peak(MB)':>9}  rows")
+    for name, page in pages:
+        chunk_size = 16 * 1024
+        chunks = [page[i:i + chunk_size] for i in range(0, len(page), chunk_size)]
+        read_html_df, read_html_ms, read_html_peak = _measure(
+            lambda: pd.read_html(StringIO(page.decode('utf-8')))[0])
+        stream_df, stream_ms, stream_peak = _measure(lambda: parse_screener_stream(iter(chunks)))
+        print(f"{name[:20]:>20} {len(page) / 1024:>9.0f} {read_html_ms:>14.1f} {read_html_peak:>9.1f} "
+              f"{stream_ms:>11.1f} {stream_peak:>9.1f}  {len(read_html_df)}/{len(stream_df)}")
+
+
+def bench_market(delays_ms, in_flight_sizes, category_timeout: float, slow_category: str = None, slow_ms: int = 0):
+    """기록해 둔 스크리너 페이지를 카테고리별 지연 시간을 두고 제공하는 모의 서버에서 get_market_data 를 실행합니다.
+    동시 요청이면 전체 시간이 지연 시간의 합이 아니라 가장 느린 페이지에 가까워야 하고,
+    slow_category 를 category_timeout 보다 느리게 하면 그 카테고리만 비고 나머지는 마감 시간 안에 끝나야 합니다.
+    """
+    delays = dict(zip(SCREENER_PATHS, delays_ms))
+    if slow_category:
+        delays[slow_category] = slow_ms
+    server = MockScreenerServer(delays_ms=delays).start()
+    print(f"mock screener: {server.base_url}, delays(ms): {delays}, category_timeout: {category_timeout}s")
+    print(f"sum of delays: {sum(delays.values())}ms, slowest: {max(delays.values())}ms")
+    print(f"{'max_in_flight':>13} {'wall(ms)':>9}  rows per category")
+    try:
+        for max_in_flight in in_flight_sizes:
+            config = {'data_collection': {
+                'market_data': {'base_url': server.base_url, 'max_in_flight': max_in_flight,
+                                'category_timeout': category_timeout},
+                'price_cache': {'enabled': False}, 'metadata_cache': {'enabled': False}
+            }}
+            collector = MarketDataCollector(config)
+            start = time.perf_counter()
+            market_data = _quiet(collector.get_market_data)
+            wall_ms = (time.perf_counter() - start) * 1000
+            rows = ', '.join(f"{category}={len(df)}" for category, df in market_data.items())
+            print(f"{max_in_flight:>13} {wall_ms:>9.0f}  {rows}")
+    finally:
+        server.stop()
+
+
+def _reference_parse_volume(volume_str) -> float:
+    """기존 행 단위 parse_volume (비교 기준)"""
+    try:
+        if not isinstance(volume_str, str):
+            return float(volume_str)
+        volume_str = volume_str.strip().upper()
+        if not volume_str or volume_str == 'N/A':
+            return 0.0
+        multiplier = 1
+        for suffix, unit in (('K', 1_000), ('M', 1_000_000), ('B', 1_000_000_000)):
+            if volume_str.endswith(suffix):
+                multiplier = unit
+                volume_str = volume_str[:-1]
+                break
+        return float(volume_str.replace(',', '')) * multiplier
+    except (ValueError, TypeError, AttributeError):
+        return 0.0
+
+
+def bench_normalize(num_rows: int):
+    """합성 스크리너 문자열 컬럼을 기존 행 단위 변환과 벡터화 정규화로 각각 변환해 비교합니다."""
+    rng = np.random.default_rng(0)
+    suffixes = rng.choice(['', 'K', 'M', 'B'], num_rows)
+    screener = pd.DataFrame({
+        'Symbol': [f"S{i}" for i in range(num_rows)],
+        'Name': [f"Company {i}" for i in range(num_rows)],
+        'Price': [f"{p:,.2f}" for p in rng.uniform(1, 5000, num_rows)],
+        '% Change': [f"{c:+.2f}%" for c in rng.normal(0, 5, num_rows)],
+        'Volume': [f"{v:,.3f}{s}" for v, s in zip(rng.uniform(1, 999, num_rows), suffixes)]
+    })
+
+    start = time.perf_counter()
+    change = screener['% Change'].apply(lambda x: float(str(x).strip('%').replace(',', '')))
+    volume = screener['Volume'].apply(_reference_parse_volume)
+    price = screener['Price'].apply(lambda x: float(str(x).replace(',', '')))
+    reference_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    normalized = normalize_screener_frame(screener)
+    vectorized_ms = (time.perf_counter() - start) * 1000
+
+    match = (
+        np.array_equal(normalized['% Change'].to_numpy(), change.to_numpy())
+        and np.array_equal(normalized['Price'].to_numpy(), price.to_numpy())
+        and np.array_equal(normalized['Volume'].to_numpy(), np.round(volume.to_numpy()).astype('int64'))
+    )
+    print(f"rows: {num_rows}, per-row: {reference_ms:.1f}ms, vectorized: {vectorized_ms:.1f}ms, "
+          f"speedup: {reference_ms / vectorized_ms:.1f}x, match: {'OK' if match else 'MISMATCH'}")
+
+
+def _synthetic_headlines(num_headlines: int, num_keywords: int, seed: int = 0):
+    """영문 헤드라인과 high/medium/low 3단계 키워드 분류를 만듭니다. (일부 키워드는 여러 단어 구문)"""
+    rng = np.random.default_rng(seed)
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyz'))
+    vocabulary = sorted({''.join(rng.choice(letters, rng.integers(3, 10))) for _ in range(max(4 * num_keywords, 3000))})
+    keywords = list(rng.choice(vocabulary, num_keywords, replace=False))
+    for i in range(0, num_keywords, 10):
+        keywords[i] = f"{keywords[i]} {rng.choice(vocabulary)}"
+    bounds = [num_keywords // 5, num_keywords // 2]
+    taxonomy = {'high': keywords[:bounds[0]], 'medium': keywords[bounds[0]:bounds[1]], 'low': keywords[bounds[1]:]}
+    headlines = [' '.join(rng.choice(vocabulary, 12)).capitalize() for _ in range(num_headlines)]
+    return headlines, taxonomy
+
+
+def bench_keywords(num_headlines: int, keyword_sizes):
+    """헤드라인 중요도 분류를 기존 중첩 any() 방식과 컴파일된 매처(Aho-Corasick)로 각각 수행해 비교합니다."""
+    for num_keywords in keyword_sizes:
+        headlines, taxonomy = _synthetic_headlines(num_headlines, num_keywords)
+
+        start = time.perf_counter()
+        reference = []
+        for title in headlines:
+            importance = 'none'
+            for level, keywords in taxonomy.items():
+                if any(keyword.lower() in title.lower() for keyword in keywords):
+                    importance = level
+                    break
+            reference.append(importance)
+        reference_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        matcher = KeywordMatcher(taxonomy)
+        build_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        compiled = [matcher.classify(title, default='none') for title in headlines]
+        compiled_ms = (time.perf_counter() - start) * 1000
+
+        print(f"headlines: {num_headlines}, keywords: {num_keywords}, nested any(): {reference_ms:.1f}ms, "
+              f"compiled: {compiled_ms:.1f}ms (+build {build_ms:.1f}ms), speedup: {reference_ms / compiled_ms:.1f}x, "
+              f"match: {'OK' if compiled == reference else 'MISMATCH'}")
+
+
+def _synthetic_news(num_stories: int, copies: int = 4, seed: int = 0):
+    """사건마다 여러 언론사 버전(단어 한두 개 변경, 언론사 표기)의 헤드라인을 만들고 정답 사건 번호를 함께 반환합니다."""
+    rng = np.random.default_rng(seed)
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyz'))
+    vocabulary = [''.join(rng.choice(letters, rng.integers(3, 9))) for _ in range(5000)]
+    outlets = ['Reuters', 'CNBC', 'Bloomberg', 'MarketWatch', 'Yahoo Finance', 'WSJ']
+    headlines, story_ids = [], []
+    for story in range(num_stories):
+        words = list(rng.choice(vocabulary, 12))
+        for _ in range(rng.integers(1, copies + 1)):
+            variant = list(words)
+            variant[rng.integers(len(variant))] = rng.choice(vocabulary)  # 한 단어 교체
+            headlines.append(f"{' '.join(variant).capitalize()} - {rng.choice(outlets)}")
+            story_ids.append(story)
+    order = rng.permutation(len(headlines))
+    return [headlines[i] for i in order], [story_ids[i] for i in order]
+
+
+def _pairwise_clusters(documents, threshold: float):
+    """모든 쌍의 정확한 Jaccard 유사도로 묶는 기준 구현 (O(n^2))"""
+    parent = list(range(len(documents)))
+
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for i in range(len(documents)):
+        for j in range(i + 1, len(documents)):
+            a, b = documents[i], documents[j]
+            if a and b and len(a & b) / len(a | b) >= threshold:
+                parent[find(j)] = find(i)
+    return {find(i) for i in range(len(documents))}
+
+
+def bench_dedupe(story_counts, pairwise_limit: int = 3000):
+    """MinHash LSH 묶음과 모든 쌍 비교(헤드라인 pairwise_limit 개 이하일 때만)의 시간과 묶음 수를 비교합니다."""
+    for num_stories in story_counts:
+        headlines, story_ids = _synthetic_news(num_stories)
+        items = [{'title': title, 'time': '', 'importance': 'low'} for title in headlines]
+
+        start = time.perf_counter()
+        deduped = dedupe_news(items)
+        lsh_ms = (time.perf_counter() - start) * 1000
+
+        line = (f"headlines: {len(headlines)}, stories: {num_stories}, MinHash LSH: {lsh_ms:.1f}ms "
+                f"-> {len(deduped)} clusters")
+        if len(headlines) <= pairwise_limit:
+            documents = [shingles(headline_tokens(title)) for title in headlines]
+            start = time.perf_counter()
+            pairwise = _pairwise_clusters(documents, 0.5)
+            pairwise_ms = (time.perf_counter() - start) * 1000
+            line += f", pairwise: {pairwise_ms:.1f}ms -> {len(pairwise)} clusters"
+        print(line)
+
+
+def bench_news(num_tickers: int, in_flight_sizes, delay_ms: int):
+    """로컬 모의 Google News 에서 기본 질의 + 종목별 검색을 동시 요청 수별로 수집한 시간과,
+    (질의, 날짜) 캐시가 채워진 뒤 다시 수집할 때의 시간/요청 수를 비교합니다.
+    """
+    symbols = [f"SYM{i}" for i in range(num_tickers)]
+    specs = list(DEFAULT_QUERIES) + ticker_queries(symbols)
+    server = MockNewsServer(delay_ms=delay_ms).start()
+    http = HttpClient(retry_policy=RetryPolicy(max_retries=0), pool_maxsize=max(in_flight_sizes))
+    today = time.strftime('%Y-%m-%d')
+    print(f"mock news: {server.base_url}, queries: {len(specs)}, delay: {delay_ms}ms")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for max_in_flight in in_flight_sizes:
+                cache = NewsQueryCache(Path(tmp) / f"news_{max_in_flight}.sqlite")
+                source = GoogleNewsSource(http, base_url=server.base_url, max_in_flight=max_in_flight, cache=cache)
+                timings = []
+                for _ in range(2):  # cold → warm
+                    before = len(server.requests)
+                    start = time.perf_counter()
+                    articles = _quiet(source.collect, specs, today)
+                    timings.append(((time.perf_counter() - start) * 1000, len(server.requests) - before, len(articles)))
+                source.close()
+                (cold_ms, cold_requests, count), (warm_ms, warm_requests, _) = timings
+                print(f"max_in_flight: {max_in_flight:>2}, cold: {cold_ms:>7.0f}ms ({cold_requests} requests), "
+                      f"warm: {warm_ms:>5.1f}ms ({warm_requests} requests), articles: {count}")
+    finally:
+        server.stop()
+
+
+def bench_feeds(num_tickers: int, delay_ms: int):
+    """기록해 둔 피드 파일을 파싱하고(오프라인), 모의 서버에서 RSS 질의/피드를 세 번 수집해
+    처음(200), 바뀌지 않았을 때(304), 피드가 갱신된 뒤(200)의 응답 상태와 시간을 비교합니다.
+    """
+    for path in sorted(RECORDED_FEEDS.glob('*')):
+        data = path.read_bytes()
+        start = time.perf_counter()
+        articles = parse_feed_stream(data[i:i + 4096] for i in range(0, len(data), 4096))
+        parse_ms = (time.perf_counter() - start) * 1000
+        dated = sum(1 for article in articles if article['datetime'])
+        print(f"{path.name}: {len(data) / 1024:.1f}KB, {len(articles)} articles ({dated} dated), parse: {parse_ms:.2f}ms")
+
+    server = MockNewsServer(delay_ms=delay_ms).start()
+    http = HttpClient(retry_policy=RetryPolicy(max_retries=0))
+    specs = list(DEFAULT_QUERIES) + ticker_queries([f"SYM{i}" for i in range(num_tickers)])
+    feeds = [{'name': path.stem, 'url': f"{server.base_url}/feeds/{path.name}"} for path in sorted(RECORDED_FEEDS.glob('*'))]
+    today = time.strftime('%Y-%m-%d')
+    print(f"mock news: {server.base_url}, feeds: {len(specs) + len(feeds)}, delay: {delay_ms}ms")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            state = FeedStateStore(Path(tmp) / 'feeds.sqlite')
+            source = RssNewsSource(http, feeds=feeds, state=state, base_url=server.base_url, max_in_flight=8)
+            for label in ['first', 'unchanged', 'updated']:
+                if label == 'updated':
+                    server.update_feeds()
+                before = len(server.statuses)
+                start = time.perf_counter()
+                articles = _quiet(source.collect, specs, today)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                statuses = server.statuses[before:]
+                print(f"{label:>9}: {elapsed_ms:>6.0f}ms, 200: {statuses.count(200):>2}, 304: {statuses.count(304):>2}, "
+                      f"articles: {len(articles)}")
+            source.close()
+    finally:
+        server.stop()
+
+
+def _quiet(func, *args):
+    """수집기의 질의별 진행 출력을 숨기고 실행합니다."""
+    with contextlib.redirect_stdout(StringIO()):
+        return func(*args)
+
+
+def _synthetic_post(num_chars: int):
+    """분석 콘텐츠와 같은 형식(제목, 굵게, 목록, 문단)의 Markdown 본문을 num_chars 길이 내외로 만듭니다."""
+    sections = []
+    index = 1
+    while sum(len(section) for section in sections) < num_chars:
+        sections.append(
+            f"### {index}. Company {index} (S{index})\n"
+            f"현재 {100 + index:,.2f}에 거래되며 {index % 7 - 3}%의 움직임을 보이고 있습니다.\n\n"
+            f"**기술적 분석 포인트:**\n"
+            f"- RSI: {40 + index % 30:.2f}는 중립 구간에 위치하고 있습니다.\n"
+            f"- MACD: {index % 5 - 2:.2f}는 추세 전환 가능성을 보여줍니다.\n\n"
+            f"**종합 평가:**\n\n종목 {index}은(는) 분할 매수 관점에서 관심을 가질 만합니다."
+        )
+        index += 1
+    content = "## 오늘의 투자 유망 종목\n\n" + "\n\n".join(sections)
+    tags = [f"태그{i}" for i in range(20)]
+    return "[종목추천] 벤치마크 글", content, tags
+
+
+def bench_poster(strategies, num_chars: int, runs: int, delay_ms: int, headless: bool, profiles=('default',),
+                 user_data_dir: str = None):
+    """로컬 모의 사이트에서 브라우저 프로필/본문 입력 방식별로 로그인부터 발행까지의 시간,
+    글쓰기 페이지 첫 페인트/로드 시간, WebDriver 왕복 수를 측정합니다.
+    user_data_dir 을 주면 실행 사이에 프로필 폴더(디스크 캐시)를 재사용하므로 2회차부터 warm 실행입니다.
+    """
+    from blog_poster import NaverBlogPoster
+
+    os.environ.setdefault('NAVER_USERNAME', 'mock-user')
+    os.environ.setdefault('NAVER_PASSWORD', 'mock-password')
+    title, content, tags = _synthetic_post(num_chars)
+    server = MockNaverServer(delay_ms=delay_ms).start()
+    print(f"mock site: {server.base_url}, body: {len(content)} chars, tags: {len(tags)}")
+    print(f"{'profile':>11} {'strategy':>8} {'run':>4} {'start(s)':>9} {'login(s)':>9} {'publish(s)':>11} "
+          f"{'paint(ms)':>10} {'load(ms)':>9} {'cached':>7} {'chars/s':>9} {'round-trips':>12}  body/tags")
+    try:
+        for profile, strategy in itertools.product(profiles, strategies):
+            for run in range(1, runs + 1):
+                config = {'blog_settings': {
+                    'urls': server.urls(), 'headless': headless, 'body_insertion': strategy,
+                    'session': {'enabled': False}, 'browser_profile': {'name': profile},
+                    'user_data_dir': {'enabled': bool(user_data_dir), 'path': user_data_dir or ''}
+                }}
+                poster = NaverBlogPoster(config)
+                start = time.perf_counter()
+                if not poster.setup_driver():
+                    print("✗ 웹드라이버를 시작할 수 없습니다. (Chrome/chromedriver 확인)")
+                    return
+                try:
+                    started = time.perf_counter()
+                    logged_in = poster.ensure_login()
+                    login_done = time.perf_counter()
+                    published = logged_in and poster.create_post(title, content, tags)
+                    publish_done = time.perf_counter()
+                    round_trips = poster.round_trips.total()
+                    timing = poster.page_timings.get('postwrite', {})
+                finally:
+                    poster.close()
+
+                publish_s = publish_done - login_done
+                if not published:
+                    print(f"{profile:>11} {strategy:>8} {run:>4} {started - start:>9.2f} {login_done - started:>9.2f} {'FAILED':>11}")
+                    continue
+                post = server.published[-1]
+                expected = count_visible_chars(markdown_to_text(content) if strategy == 'html' else content)
+                body_ok = count_visible_chars(post.get('text', '')) == expected
+                tags_ok = len(post.get('tags', [])) == len(tags)
+                print(f"{profile:>11} {strategy:>8} {run:>4} {started - start:>9.2f} {login_done - started:>9.2f} {publish_s:>11.2f} "
+                      f"{timing.get('first_paint_ms') or float('nan'):>10.0f} {timing.get('load_ms', float('nan')):>9.0f} "
+                      f"{timing.get('cached_resources', '-'):>7} {len(content) / publish_s:>9.0f} {round_trips:>12}  "
+                      f"{'OK' if body_ok else 'MISMATCH'}/{'OK' if tags_ok else 'MISMATCH'}")
+    finally:
+        server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="성능 벤치마크 (수동 실행용)")
+    subparsers = parser.add_subparsers(dest='target', required=True)
+
+    indicators_parser = subparsers.add_parser('indicators', help="기술적 지표 엔진 종목 수별 확장성")
+    indicators_parser.add_argument('--sizes', type=int, nargs='+', default=[20, 100, 500, 1000, 5000])
+
+    screener_parser = subparsers.add_parser('screener', help="스크리너 표 파서 vs pandas.read_html")
+    screener_parser.add_argument('html_files', nargs='*', help="저장해 둔 스크리너 HTML 파일 (없으면 합성 페이지 사용)")
+
+    market_parser = subparsers.add_parser('market', help="모의 스크리너 서버에서 카테고리 동시 수집 (기록된 페이지 + 지연)")
+    market_parser.add_argument('--delays-ms', type=int, nargs=5, default=[300, 600, 900, 1200, 1500],
+                               help=f"카테고리별 응답 지연 ({', '.join(SCREENER_PATHS)})")
+    market_parser.add_argument('--in-flight', type=int, nargs='+', default=[1, 5])
+    market_parser.add_argument('--category-timeout', type=float, default=10)
+    market_parser.add_argument('--slow', nargs=2, metavar=('CATEGORY', 'MS'), help="한 카테고리를 마감 시간보다 느리게 (예: top_etfs 5000)")
+
+    normalize_parser = subparsers.add_parser('normalize', help="스크리너 숫자 컬럼 정규화 (행 단위 vs 벡터화)")
+    normalize_parser.add_argument('--rows', type=int, default=100_000)
+
+    keywords_parser = subparsers.add_parser('keywords', help="헤드라인 키워드 분류 (중첩 any() vs 컴파일된 매처)")
+    keywords_parser.add_argument('--headlines', type=int, default=10_000)
+    keywords_parser.add_argument('--keywords', type=int, nargs='+', default=[50, 500, 5000])
+
+    dedupe_parser = subparsers.add_parser('dedupe', help="뉴스 헤드라인 중복 묶음 (MinHash LSH vs 모든 쌍 비교)")
+    dedupe_parser.add_argument('--stories', type=int, nargs='+', default=[200, 1000, 5000])
+
+    news_parser = subparsers.add_parser('news', help="모의 Google News 에서 다중 질의 동시 수집과 질의 캐시")
+    news_parser.add_argument('--tickers', type=int, default=10)
+    news_parser.add_argument('--in-flight', type=int, nargs='+', default=[1, 4, 8])
+    news_parser.add_argument('--delay-ms', type=int, default=200, help="모의 서버 응답 지연 시간")
+
+    feeds_parser = subparsers.add_parser('feeds', help="RSS/Atom 피드 파싱과 조건부 요청(304) 수집")
+    feeds_parser.add_argument('--tickers', type=int, default=5)
+    feeds_parser.add_argument('--delay-ms', type=int, default=100, help="모의 서버 응답 지연 시간")
+
+    poster_parser = subparsers.add_parser('poster', help="모의 네이버 사이트에서 글 발행 처리량 (Chrome 필요)")
+    poster_parser.add_argument('--strategies', nargs='+', default=['html', 'paste'], choices=['html', 'paste', 'typing'])
+    poster_parser.add_argument('--chars', type=int, default=3000)
+    poster_parser.add_argument('--runs', type=int, default=1)
+    poster_parser.add_argument('--delay-ms', type=int, default=300, help="모의 에디터 팝업/발행 창 지연 시간")
+    poster_parser.add_argument('--headed', action='store_true', help="브라우저 창을 띄워서 실행 (default 프로필)")
+    poster_parser.add_argument('--profiles', nargs='+', default=['default', 'performance'], choices=['default', 'performance'])
+    poster_parser.add_argument('--user-data-dir', help="재사용할 Chrome 프로필 폴더 (지정하면 2회차부터 디스크 캐시 사용)")
+
+    args = parser.parse_args()
+    if args.target == 'indicators':
+        bench_indicators(args.sizes)
+    elif args.target == 'screener':
+        bench_screener(args.html_files)
+    elif args.target == 'market':
+        slow_category, slow_ms = (args.slow[0], int(args.slow[1])) if args.slow else (None, 0)
+        bench_market(args.delays_ms, args.in_flight, args.category_timeout, slow_category, slow_ms)
+    elif args.target == 'normalize':
+        bench_normalize(args.rows)
+    elif args.target == 'keywords':
+        bench_keywords(args.headlines, args.keywords)
+    elif args.target == 'dedupe':
+        bench_dedupe(args.stories)
+    elif args.target == 'news':
+        bench_news(args.tickers, args.in_flight, args.delay_ms)
+    elif args.target == 'feeds':
+        bench_feeds(args.tickers, args.delay_ms)
+    elif args.target == 'poster':
+        bench_poster(args.strategies, args.chars, args.runs, args.delay_ms, headless=not args.headed, profiles=args.profiles,
+                     user_data_dir=args.user_data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,60 +15,125 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 from datetime import datetime
 from selenium.webdriver.common.action_chains import ActionChains
 import re
+from editor_insertion import create_insertion_strategy
+from browser_pool import BrowserDaemon
+from session_store import NaverSessionStore
+from wait_engine import WaitEngine
+from tag_entry import enter_tags_bulk, enter_tags_typing, TAG_CHIP_SELECTOR
+from dom_helper import DomHelper, RoundTripCounter
+from browser_profile import BrowserProfile, create_browser_profile, page_load_timing
+from post_trace import PostTrace, capture_failure
+
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36'
+
+
+DEFAULT_URLS = {
+    'login': 'https://nid.naver.com/nidlogin.login',
+    'blog': 'https://blog.naver.com/gongnyangi',
+    'postwrite': 'https://blog.naver.com/gongnyangi/postwrite'
+}
+
+
+def create_driver(headless: bool = False, profile: BrowserProfile = None):
+    """Selenium Chrome WebDriver 를 새로 띄웁니다. 실패하면 None 을 반환합니다.
+    profile 을 주면 headless 대신 프로필의 실행 옵션과 CDP 설정(요청 차단 등)을 적용합니다.
+    """
+    logger = logging.getLogger(__name__)
+    profile = profile or BrowserProfile(headless=headless)
+    try:
+        options = webdriver.ChromeOptions()
+        profile.apply_options(options)
+        options.add_argument('--no-sandbox')
+        options.add_argument('--start-maximized')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        # 실패 시 브라우저 콘솔 로그를 저장하기 위해 수집
+        options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+        
+        # User-Agent 설정
+        options.add_argument(f'--user-agent={BROWSER_USER_AGENT}')
+        
+        # ChromeDriver 경로 직접 지정
+        # (Windows 가 아니거나 번들 드라이버가 없으면 Selenium Manager 가 찾은 드라이버 사용)
+        chromedriver_path = Path(__file__).parent / 'chromedriver' / 'chromedriver-win64' / 'chromedriver.exe'
+        if os.name == 'nt' and chromedriver_path.exists():
+            service = Service(executable_path=str(chromedriver_path))
+        else:
+            service = Service()
+        driver = webdriver.Chrome(service=service, options=options)
+        driver.set_page_load_timeout(30)
+        
+        # JavaScript 코드 실행하여 웹드라이버 감지 방지
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': '''
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                })
+            '''
+        })
+        profile.apply_driver(driver)
+
+        return driver
+    except Exception as e:
+        logger.error(f"Failed to setup WebDriver: {e}", exc_info=True)
+        print(f"✗ 웹드라이버 설정 실패: {str(e)}")
+        return None
 
 class NaverBlogPoster:
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, daemon: BrowserDaemon = None):
         self.config = config
+        self.daemon = daemon
+        self.healthy = True  # False 이면 반납 시 데몬 브라우저를 재시작
+        self.posted = False
+        # 마지막 create_post 에서 최종 발행 버튼을 눌렀는지 (눌렀다면 실패로 끝나도 이미 발행됐을 수 있음)
+        self.publish_submitted = False
         self.logger = logging.getLogger(__name__)
         self.username = os.getenv('NAVER_USERNAME')
         self.password = os.getenv('NAVER_PASSWORD')
         self.driver = None
+        self.round_trips = None
+        self.browser_profile = create_browser_profile(config)
+        self.page_timings = {}  # 페이지별 로드 시간 (브라우저 프로필 비교용)
         self.cookies_file = Path(__file__).parent.parent / 'config' / 'naver_cookies.pkl'
+        # 로그인/블로그/글쓰기 주소 (로컬 모의 사이트로 바꿔 테스트할 수 있음)
+        self.urls = {**DEFAULT_URLS, **config.get('blog_settings', {}).get('urls', {})}
+        # 로그인 세션(쿠키/localStorage) 저장소 (설정 시 사용)
+        self.session_store = None
+        session_settings = config.get('blog_settings', {}).get('session', {})
+        if session_settings.get('enabled', False):
+            if session_settings.get('path'):
+                self.cookies_file = Path(__file__).parent.parent / session_settings['path']
+            self.session_store = NaverSessionStore(
+                self.cookies_file,
+                check_url=session_settings.get('check_url', self.urls['postwrite']),
+                login_marker=session_settings.get('login_marker', 'nidlogin'),
+                user_agent=BROWSER_USER_AGENT
+            )
         
         if not self.username or not self.password:
             self.logger.error("Naver credentials not found in environment variables")
             raise ValueError("네이버 로그인 정보가 환경변수에 설정되지 않았습니다.")
 
     def setup_driver(self):
-        """Selenium WebDriver를 초기화합니다."""
-        try:
-            options = webdriver.ChromeOptions()
-            options.add_argument('--no-sandbox')
-            options.add_argument('--start-maximized')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            
-            # User-Agent 설정
-            options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36')
-            
-            # ChromeDriver 경로 직접 지정
-            chromedriver_path = Path(__file__).parent / 'chromedriver' / 'chromedriver-win64' / 'chromedriver.exe'
-            service = Service(executable_path=str(chromedriver_path))
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.driver.set_page_load_timeout(30)
-            
-            # JavaScript 코드 실행하여 웹드라이버 감지 방지
-            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    })
-                '''
-            })
-            
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to setup WebDriver: {e}", exc_info=True)
-            print(f"✗ 웹드라이버 설정 실패: {str(e)}")
+        """Selenium WebDriver를 초기화합니다. 브라우저 데몬이 있으면 유지 중인 브라우저를 빌려 씁니다."""
+        if self.daemon:
+            self.driver = self.daemon.acquire()
+        else:
+            self.driver = create_driver(profile=self.browser_profile)
+        if self.driver is None:
             return False
+        # 이번 실행의 WebDriver 명령 수 집계 (로그인 + 포스팅)
+        self.round_trips = RoundTripCounter.attach(self.driver)
+        return True
 
     def login(self):
         """네이버에 로그인합니다."""
         try:
             # 네이버 로그인 페이지로 이동
-            self.driver.get('https://nid.naver.com/nidlogin.login')
+            self.driver.get(self.urls['login'])
+            self._record_page_timing('login')
             time.sleep(2)
             
             # JavaScript를 통한 로그인 정보 입력
@@ -81,6 +146,7 @@ class NaverBlogPoster:
             time.sleep(0.5)
             
             # 로그인 버튼 클릭
+            login_path = self.urls['login'].split('://', 1)[-1].split('?')[0]
             login_button = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((By.CLASS_NAME, 'btn_login'))
             )
@@ -89,7 +155,7 @@ class NaverBlogPoster:
             # 로그인 성공 확인
             try:
                 WebDriverWait(self.driver, 5).until(
-                    lambda d: 'nid.naver.com/nidlogin.login' not in d.current_url
+                    lambda d: login_path not in d.current_url
                 )
                 print("✓ 네이버 로그인 성공")
                 return True
@@ -105,7 +171,7 @@ class NaverBlogPoster:
     def check_login_status(self):
         """현재 로그인 상태를 확인합니다."""
         try:
-            self.driver.get('https://blog.naver.com/gongnyangi')
+            self.driver.get(self.urls['blog'])
             time.sleep(2)
             
             # 로그인 버튼이 있는지 확인
@@ -116,174 +182,157 @@ class NaverBlogPoster:
             return False
 
     def create_post(self, title: str, content: str, tags: List[str]) -> bool:
-        """네이버 블로그에 글을 포스팅합니다. (참고 코드 기반 수정)"""
+        """네이버 블로그에 글을 포스팅합니다. 실패하면 반납 시 데몬 브라우저를 재시작하도록 표시합니다.
+        단계별 소요 시간을 기록하고, 실패하면 그 시점의 DOM/스크린샷/콘솔 로그를 저장합니다.
+        """
+        trace_settings = self.config.get('blog_settings', {}).get('trace', {})
+        trace = PostTrace(trace_settings.get('path', 'logs/post_trace.jsonl'))
+        success = False
+        self.publish_submitted = False
+        try:
+            success = self._write_and_publish(title, content, tags, trace)
+        finally:
+            if not success and self.driver and trace_settings.get('capture_on_failure', True):
+                capture_failure(self.driver, trace_settings.get('failure_dir', 'logs/failures'),
+                                trace.run_id, trace.current_phase)
+            trace.finish(success, body_chars=len(content), tags=len(tags or []),
+                         round_trips=self.round_trips.total() if self.round_trips else None)
+        self.posted = self.posted or success
+        self.healthy = self.healthy and success
+        return success
+
+    def _write_and_publish(self, title: str, content: str, tags: List[str], trace: PostTrace) -> bool:
+        """글쓰기 페이지에서 제목/본문/태그를 입력하고 발행합니다. (참고 코드 기반 수정)"""
         if not self.driver:
             self.logger.error("WebDriver가 초기화되지 않았습니다.")
             return False
 
+        waits = WaitEngine(self.driver)
+        dom = DomHelper(self.driver)
+        publish_layer = (By.CSS_SELECTOR, 'button.selectbox_button__jb1Dt, input#tag-input, button[data-testid="seOnePublishBtn"]')
         try:
             # 글쓰기 페이지로 이동
+            trace.begin('navigation')
             print("- 글쓰기 페이지로 이동 중...")
-            self.driver.get("https://blog.naver.com/gongnyangi/postwrite")
-            print("- 페이지 로딩 대기 (7초)...")
-            time.sleep(7)
+            self.driver.get(self.urls['postwrite'])
+            self._record_page_timing('postwrite')
+            print("- 에디터 로딩 대기...")
+            try:
+                waits.element('에디터 로드', (By.CSS_SELECTOR, 'div.se-component, span.se-placeholder'), 20)
+            except TimeoutException:
+                print("- 에디터 로딩 대기 시간 초과 (무시하고 계속)")
             print(f"현재 URL: {self.driver.current_url}")
-            time.sleep(3) # 팝업 로드 대기
+            waits.network_idle('에디터 초기 요청 완료', idle_ms=500, timeout=10) # 팝업 로드 대기
 
             # 이전 글 작성 확인 팝업 처리 (참고 코드 방식)
+            trace.begin('popups')
             try:
                 print("- 이전 글 팝업 확인 중...")
                 # 팝업 버튼이 나타날 때까지 조금 더 대기
-                WebDriverWait(self.driver, 5).until(
-                     EC.presence_of_element_located((By.CLASS_NAME, 'se-popup-button-text'))
-                )
-                cancel_buttons = self.driver.find_elements(By.CLASS_NAME, 'se-popup-button-text')
-                if cancel_buttons:
-                    for button in cancel_buttons:
-                        if button.text == '취소':
-                            button.click()
-                            time.sleep(3) # 팝업 닫히는 시간
-                            print("- 이전 글 '취소' 처리 완료")
-                            break
+                waits.element('이전 글 팝업', (By.CLASS_NAME, 'se-popup-button-text'), 3)
+                if dom.click('.se-popup-button-text', text='취소'):
+                    waits.gone('이전 글 팝업 닫힘', (By.CLASS_NAME, 'se-popup-button-text'), 5)
+                    print("- 이전 글 '취소' 처리 완료")
             except TimeoutException:
                  print("- 이전 글 팝업 없음 - 계속 진행")
             except Exception as e:
                 print(f"- 이전 글 팝업 처리 중 오류 (무시하고 계속): {e}")
 
             # 도움말 닫기 버튼 처리 (참고 코드 방식)
-            time.sleep(2)
+            waits.dom_quiet('도움말 팝업 표시', quiet_ms=300, timeout=3)
             try:
                 print("- 도움말 팝업 확인 중...")
-                help_buttons = self.driver.find_elements(By.TAG_NAME, 'button')
-                for button in help_buttons:
-                     try:
-                         if button.get_attribute('class') and '닫기' in button.get_attribute('class'):
-                             if button.is_displayed() and button.is_enabled():
-                                 button.click()
-                                 time.sleep(2)
-                                 print("- 도움말 닫기 완료")
-                                 break
-                     except: # StaleElementReference 등 예외 처리
-                         continue
+                # 보이고 활성화된 '닫기' 버튼을 브라우저 안에서 찾아 클릭 (한 번의 왕복)
+                if dom.click('button', class_contains='닫기'):
+                    waits.dom_quiet('도움말 닫힘', quiet_ms=300, timeout=3)
+                    print("- 도움말 닫기 완료")
             except Exception as e:
                 print(f"- 도움말 팝업 처리 중 오류 (무시하고 계속): {e}")
 
             # 제목 입력 (참고 코드 방식)
+            trace.begin('title')
             try:
                 print("- 제목 영역 찾는 중...")
                 title_area = None
                 try:
                     # 시도 1: Placeholder
                     title_placeholder_selector = 'span.se-placeholder.__se_placeholder' # 좀 더 일반적일 수 있는 선택자
-                    title_area = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, title_placeholder_selector))
-                    )
+                    title_area = waits.element('제목 영역 (Placeholder)', (By.CSS_SELECTOR, title_placeholder_selector), 5, clickable=True)
                     print("- 제목 영역 찾음 (Placeholder)")
                 except TimeoutException:
                     print("- 제목 Placeholder 없음, 다른 선택자 시도")
                     # 시도 2: 특정 클래스 (참고 코드와 유사)
                     title_class_selector = 'span.se-ff-nanumgothic.se-fs32.__se-node'
                     try:
-                         title_area = WebDriverWait(self.driver, 5).until(
-                             EC.element_to_be_clickable((By.CSS_SELECTOR, title_class_selector))
-                         )
+                         title_area = waits.element('제목 영역 (클래스)', (By.CSS_SELECTOR, title_class_selector), 5, clickable=True)
                          print("- 제목 영역 찾음 (클래스)")
                     except TimeoutException:
                          print("✗ 제목 영역을 찾을 수 없습니다.")
                          return False
 
                 title_area.click()
-                time.sleep(1)
                 print("- 제목 입력 중...")
                 actions = ActionChains(self.driver)
                 actions.send_keys(title).perform()
                 print("- 제목 입력 완료")
-                time.sleep(1)
                 print("- Enter 키 입력 (본문 이동)")
                 actions.send_keys(Keys.ENTER).perform()
-                time.sleep(3) # 본문 영역 활성화 대기
+                waits.dom_quiet('본문 영역 활성화', quiet_ms=300, timeout=3)
             except Exception as e:
                 print(f"✗ 제목 입력 실패: {e}")
                 return False
 
-            # 본문 입력 (문자 단위 send_keys 및 초소형 대기)
+            # 본문 입력 (설정된 입력 전략 사용, 붙여넣기 실패 시 문자 단위 입력으로 전환)
+            trace.begin('body')
             try:
-                print("- 본문 문자 단위 입력 시작 (매우 느릴 수 있음)...")
+                insertion = create_insertion_strategy(self.driver, self.config.get('blog_settings', {}))
+                print(f"- 본문 입력 시작 (입력 방식: {insertion.name})...")
                 # --- iframe 전환 필요 시 여기에 추가 --- 
                 # try: self.driver.switch_to.frame(...) except: ...
 
                 # 본문 영역 포커스 확보 (기존 로직 유지)
                 editor_body_selector = 'div.se-component-content p.se-text-paragraph'
                 try:
-                    editor_element = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, editor_body_selector))
-                    )
+                    editor_element = waits.element('본문 영역', (By.CSS_SELECTOR, editor_body_selector), 10, clickable=True)
                     self.driver.execute_script("arguments[0].click();", editor_element)
                     print("- 본문 영역 포커스 확보 완료")
-                    time.sleep(1)
                 except Exception as focus_e:
                     print(f"- 본문 영역 포커스 실패 (무시하고 입력 시도): {focus_e}")
                     # 포커스 실패해도 입력은 시도
                 
-                actions = ActionChains(self.driver) # ActionChains 객체 생성
-                cleaned_content = content.strip()
-                total_chars = len(cleaned_content)
-                print(f"- 총 {total_chars} 문자 입력 예정")
-                
-                for i, char in enumerate(cleaned_content):
-                    if char == '\n':
-                        actions.send_keys(Keys.ENTER)
-                    else:
-                        actions.send_keys(char)
-                    
-                    actions.perform() # 각 문자/Enter 전송
-                    time.sleep(0.05) # 각 문자 입력 후 0.05초 대기 (속도 조절 가능)
-                    
-                    # 진행 상황 로그 (너무 자주 찍히지 않도록 조절)
-                    if (i + 1) % 100 == 0 or (i + 1) == total_chars:
-                        print(f"  ... {i+1}/{total_chars} 문자 입력 완료")
+                if not insertion.insert(content.strip()):
+                    print("✗ 본문 입력 실패")
+                    return False
                         
-                print("- 모든 본문 문자 입력 완료.")
-                time.sleep(3) # 모든 본문 입력 후 안정화 시간
+                print("- 모든 본문 입력 완료.")
+                waits.dom_quiet('본문 입력 안정화', quiet_ms=500, timeout=5)
 
                 # --- iframe 전환했다면 복귀 --- 
                 # try: self.driver.switch_to.default_content() except: ...
 
             except Exception as e:
-                print(f"✗ 본문 문자 단위 입력 중 오류 발생: {e}")
+                print(f"✗ 본문 입력 중 오류 발생: {e}")
                 # iframe 전환 시 복귀 필요
                 # try: self.driver.switch_to.default_content() except: ...
                 return False
 
             # 첫 번째 발행 버튼 클릭 (JavaScript 사용)
-            time.sleep(3)
+            trace.begin('publish_dialog')
             try:
                 print("- 첫 번째 발행 버튼 클릭 시도 (JavaScript)...")
-                publish_script = """
-                    var publishBtn = document.querySelector('button.publish_btn__m9KHH');
-                    if (publishBtn) {
-                        publishBtn.click();
-                        return true;
-                    } else {
-                        console.error('Publish button not found!');
-                        return false;
-                    }
-                """
-                if self.driver.execute_script(publish_script):
-                    print("- 첫 번째 발행 버튼 클릭 완료. 발행 설정 창 대기 (5초)...")
-                    time.sleep(5)
+                if dom.click('button.publish_btn__m9KHH', visible=False, enabled=False):
+                    print("- 첫 번째 발행 버튼 클릭 완료. 발행 설정 창 대기...")
+                    waits.present('발행 설정 창', publish_layer, 10)
                 else:
                     print("✗ 첫 번째 발행 버튼을 JavaScript로 찾거나 클릭할 수 없습니다.")
                     # 실패 시 Selenium 클릭 시도 (Fallback)
                     try:
                          print("- Selenium 클릭으로 재시도...")
                          publish_button_selector = 'button.publish_btn__m9KHH'
-                         publish_button = WebDriverWait(self.driver, 5).until(
-                             EC.element_to_be_clickable((By.CSS_SELECTOR, publish_button_selector))
-                         )
+                         publish_button = waits.element('첫 번째 발행 버튼', (By.CSS_SELECTOR, publish_button_selector), 5, clickable=True)
                          publish_button.click()
-                         print("- 첫 번째 발행 버튼 클릭 완료 (Selenium). 발행 설정 창 대기 (5초)...")
-                         time.sleep(5)
+                         print("- 첫 번째 발행 버튼 클릭 완료 (Selenium). 발행 설정 창 대기...")
+                         waits.present('발행 설정 창', publish_layer, 10)
                     except Exception as e_fallback:
                          print(f"✗ 첫 번째 발행 버튼 클릭 최종 실패: {e_fallback}")
                          return False
@@ -294,41 +343,41 @@ class NaverBlogPoster:
 
             # --- 발행 설정 (카테고리, 태그 등, 기존 안정화 코드 유지) ---
             try:
+                trace.begin('category')
                 print("- 카테고리 선택 과정 시작...")
                 # 카테고리 선택 시도 (이전 코드와 유사, 에러 시 무시)
                 try:
                     category_button_selector = 'button.selectbox_button__jb1Dt'
-                    category_button = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, category_button_selector))
-                    )
-                    self.driver.execute_script("arguments[0].click();", category_button)
-                    time.sleep(2)
+                    # 클릭 가능해질 때까지 확인과 클릭을 한 번의 왕복으로 반복
+                    waits.until('카테고리 버튼', lambda d: dom.click(category_button_selector), 10, kind='click')
                     category_label_selector = 'label[for="11_종목 추천 및 분석"]' # 카테고리명 확인!
-                    category_label = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, category_label_selector))
-                    )
-                    self.driver.execute_script("arguments[0].click();", category_label)
+                    waits.until('카테고리 목록', lambda d: dom.click(category_label_selector), 10, kind='click')
                     print("- 카테고리 선택 완료")
-                    time.sleep(2)
+                    waits.dom_quiet('카테고리 반영', quiet_ms=300, timeout=3)
                 except Exception as cat_e:
                     print(f"- 카테고리 선택 실패 (무시): {cat_e}")
                 
                 # 태그 입력 시도 (이전 코드와 유사, 에러 시 무시)
+                trace.begin('tags')
                 if tags:
                     try:
                         print("- 태그 입력 시작...")
                         tag_input_selector = 'input#tag-input.tag_input__rvUB5'
-                        tag_input = WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, tag_input_selector))
-                        )
-                        for tag in tags:
-                            tag_input.clear()
-                            tag_input.send_keys(tag)
-                            time.sleep(0.7)
-                            tag_input.send_keys(Keys.ENTER)
-                            time.sleep(1.5)
-                        print("- 모든 태그 입력 완료")
-                        time.sleep(2)
+                        tag_input = waits.element('태그 입력창', (By.CSS_SELECTOR, tag_input_selector), 10)
+                        blog_settings = self.config.get('blog_settings', {})
+                        if blog_settings.get('tag_entry', 'bulk') == 'bulk':
+                            missing = enter_tags_bulk(
+                                self.driver, tag_input, tags, waits,
+                                retries=blog_settings.get('tag_entry_retries', 2),
+                                chip_selector=blog_settings.get('tag_chip_selector', TAG_CHIP_SELECTOR)
+                            )
+                            if missing:
+                                print(f"- 태그 {len(missing)}개 반영 확인 실패 (무시): {', '.join(missing)}")
+                            else:
+                                print(f"- 모든 태그 입력 완료 ({len(tags)}개 일괄 입력)")
+                        else:
+                            enter_tags_typing(tag_input, tags, waits)
+                            print("- 모든 태그 입력 완료")
                     except Exception as tag_e:
                         print(f"- 태그 입력 실패 (무시): {tag_e}")
                 else:
@@ -338,33 +387,26 @@ class NaverBlogPoster:
                  print(f"- 발행 설정(카테고리/태그) 중 오류 발생 (무시하고 최종 발행 시도): {e_publish_settings}")
             
             # 최종 발행 버튼 클릭 (JavaScript 사용)
+            trace.begin('final_publish')
             try:
                 print("- 최종 발행 버튼 클릭 시도 (JavaScript)...")
-                final_publish_script = """
-                    var finalBtn = document.querySelector('button.confirm_btn__WEaBq[data-testid="seOnePublishBtn"]');
-                    if (finalBtn) {
-                        finalBtn.click();
-                        return true;
-                    } else {
-                         console.error('Final publish button not found!');
-                         return false;
-                    }
-                """
-                if self.driver.execute_script(final_publish_script):
-                    print("- 최종 발행 버튼 클릭 완료. 포스팅 완료 대기 (7초)...")
-                    time.sleep(7)
+                # 클릭 도중 오류가 나도 발행 요청이 나갔을 수 있으므로 먼저 표시하고, 버튼을 못 찾은 경우에만 되돌림
+                self.publish_submitted = True
+                if dom.click('button.confirm_btn__WEaBq[data-testid="seOnePublishBtn"]', visible=False, enabled=False):
+                    print("- 최종 발행 버튼 클릭 완료. 포스팅 완료 대기...")
+                    waits.url_change('발행 후 페이지 이동', 'postwrite', 15)
                 else:
                     print("✗ 최종 발행 버튼을 JavaScript로 찾거나 클릭할 수 없습니다.")
+                    self.publish_submitted = False
                     # 실패 시 Selenium 클릭 시도 (Fallback)
                     try:
                          print("- Selenium 클릭으로 재시도...")
                          final_publish_button_selector = 'button.confirm_btn__WEaBq[data-testid="seOnePublishBtn"]'
-                         final_publish_button = WebDriverWait(self.driver, 5).until(
-                              EC.element_to_be_clickable((By.CSS_SELECTOR, final_publish_button_selector))
-                         )
+                         final_publish_button = waits.element('최종 발행 버튼', (By.CSS_SELECTOR, final_publish_button_selector), 5, clickable=True)
+                         self.publish_submitted = True
                          final_publish_button.click()
-                         print("- 최종 발행 버튼 클릭 완료 (Selenium). 포스팅 완료 대기 (7초)...")
-                         time.sleep(7)
+                         print("- 최종 발행 버튼 클릭 완료 (Selenium). 포스팅 완료 대기...")
+                         waits.url_change('발행 후 페이지 이동', 'postwrite', 15)
                     except Exception as e_final_fallback:
                          print(f"✗ 최종 발행 버튼 클릭 최종 실패: {e_final_fallback}")
                          return False
@@ -385,7 +427,6 @@ class NaverBlogPoster:
         except (TimeoutException, NoSuchElementException, WebDriverException) as e:
             self.logger.error(f"포스팅 중 오류 발생: {e}", exc_info=True)
             print(f"✗ 포스팅 실패: {e}")
-            # self.driver.save_screenshot(f"error_screenshot_{datetime.now():%Y%m%d_%H%M%S}.png")
             return False
         except Exception as e:
             self.logger.error(f"예상치 못한 오류 발생: {e}", exc_info=True)
@@ -396,18 +437,77 @@ class NaverBlogPoster:
             try:
                 self.driver.switch_to.default_content()
             except Exception: pass
+            waits.log_summary()
+            if self.round_trips:
+                summary = self.round_trips.summary()
+                print(f"- WebDriver 왕복 요청: {summary['total']}회")
+                self.logger.info(f"WebDriver 왕복 요청 수: {summary}")
             
+    def _record_page_timing(self, page: str):
+        """방금 연 페이지의 로드 시간을 기록하고 출력합니다."""
+        timing = page_load_timing(self.driver)
+        if not timing:
+            return
+        self.page_timings[page] = timing
+        print(f"- 페이지 로드({page}): 첫 페인트 {timing['first_paint_ms']}ms, "
+              f"DOMContentLoaded {timing['dom_content_loaded_ms']}ms, load {timing['load_ms']}ms, "
+              f"리소스 {timing['resources']}개 (캐시 {timing['cached_resources']}개) / {timing['transferred_kb']}KB")
+        self.logger.info(f"페이지 로드 시간 ({page}, 프로필 {self.browser_profile.name}): {timing}")
+
     def manual_login(self) -> bool:
-        """자동으로 로그인을 진행합니다."""
+        """자동으로 로그인을 진행합니다. 성공하면 세션을 저장해 다음 실행에서 재사용합니다."""
         try:
             # 로그인 시도
-            return self.login()
+            success = self.login()
         except Exception as e:
             self.logger.error(f"로그인 실패: {e}")
             return False
+        if success and self.session_store:
+            self.session_store.save(self.driver)
+        return success
+
+    def ensure_login(self) -> bool:
+        """유효한 로그인 세션을 확보합니다.
+        데몬 브라우저의 현재 세션 → 저장된 세션 복원 순으로 재사용하고, 만료된 경우에만 전체 로그인을 진행합니다.
+        """
+        success = False
+        try:
+            if self.daemon and self.daemon.logged_in and self._session_valid(self.driver.get_cookies()):
+                print("✓ 유지 중인 브라우저의 로그인 세션 재사용")
+                success = True
+            elif self.session_store:
+                state = self.session_store.load()
+                if state and self.session_store.is_valid(state['cookies']):
+                    success = self.session_store.restore(self.driver, state)
+                    if success:
+                        print("✓ 저장된 로그인 세션 복원")
+                elif state:
+                    print("- 저장된 로그인 세션 만료, 다시 로그인합니다.")
+        except Exception as e:
+            self.logger.warning(f"Session reuse failed, falling back to login: {e}")
+            success = False
+
+        if not success:
+            success = self.manual_login()
+        if self.daemon:
+            self.daemon.logged_in = success
+        if not success:
+            self.healthy = False
+        return success
+
+    def _session_valid(self, cookies) -> bool:
+        if self.session_store:
+            return self.session_store.is_valid(cookies)
+        return self.check_login_status()
 
     def close(self):
-        """WebDriver를 종료합니다."""
+        """WebDriver를 종료합니다. 브라우저 데몬을 쓰는 경우 종료하지 않고 반납합니다."""
+        if self.daemon:
+            if self.driver:
+                self.daemon.release(posted=self.posted, healthy=self.healthy)
+                self.driver = None
+                print("- 웹드라이버 반납 완료 (브라우저 데몬 유지)")
+            return
         if self.driver:
             try:
                 self.driver.quit()
@@ -0,0 +1,105 @@
+import logging
+import time
+from typing import Callable, Optional
+
+
+class BrowserDaemon:
+    """스케줄러 프로세스가 실행 사이에도 유지하는 장기 실행 브라우저입니다.
+
+    acquire() 로 살아 있는 드라이버를 빌려 쓰고 release() 로 반납합니다.
+    글 수가 max_posts 에 도달하거나, 시작 시점 대비 JS 힙 증가량이 max_heap_growth_mb 를
+    넘거나, 작업이 실패해 상태를 믿을 수 없으면 브라우저를 종료하고 다음 acquire() 때 새로 띄웁니다.
+    logged_in 은 포스터가 로그인 후 표시하며, 브라우저를 새로 띄우면 초기화됩니다.
+    """
+
+    def __init__(self, driver_factory: Callable[[], object], max_posts: int = 20,
+                 max_heap_growth_mb: float = 300):
+        self.driver_factory = driver_factory
+        self.max_posts = max_posts
+        self.max_heap_growth_mb = max_heap_growth_mb
+        self.logger = logging.getLogger(__name__)
+        self.driver = None
+        self.logged_in = False
+        self.posts = 0
+        self.baseline_heap_mb = None
+        self.stats = {'cold_starts': 0, 'warm_reuses': 0, 'recycles': 0}
+
+    def acquire(self):
+        """살아 있는 드라이버를 반환합니다. 없거나 응답하지 않으면 새로 띄우며, 실패하면 None 을 반환합니다."""
+        if self.driver is not None and self.is_alive():
+            self.stats['warm_reuses'] += 1
+            return self.driver
+
+        if self.driver is not None:
+            self.logger.warning("Browser daemon is not responding, restarting")
+            self.shutdown()
+
+        start = time.monotonic()
+        self.driver = self.driver_factory()
+        if self.driver is None:
+            return None
+        self.stats['cold_starts'] += 1
+        self.posts = 0
+        self.logged_in = False
+        try:
+            self.driver.execute_cdp_cmd('Performance.enable', {})
+        except Exception as e:
+            self.logger.warning(f"Performance metrics unavailable: {e}")
+        self.baseline_heap_mb = self.heap_mb()
+        self.logger.info(f"브라우저 데몬 시작 ({time.monotonic() - start:.1f}초)")
+        return self.driver
+
+    def release(self, posted: bool = False, healthy: bool = True):
+        """드라이버를 반납합니다. 재활용 조건에 해당하면 브라우저를 종료합니다."""
+        if self.driver is None:
+            return
+        if posted:
+            self.posts += 1
+
+        reason = None
+        if not healthy:
+            reason = "작업 실패"
+        elif self.posts >= self.max_posts:
+            reason = f"글 {self.posts}개 작성"
+        else:
+            heap = self.heap_mb()
+            if heap is not None and self.baseline_heap_mb is not None:
+                growth = heap - self.baseline_heap_mb
+                if growth > self.max_heap_growth_mb:
+                    reason = f"JS 힙 {growth:.0f}MB 증가"
+
+        if reason:
+            print(f"- 브라우저 데몬 재시작 예정 ({reason})")
+            self.logger.info(f"브라우저 데몬 재활용: {reason}")
+            self.stats['recycles'] += 1
+            self.shutdown()
+
+    def is_alive(self) -> bool:
+        try:
+            self.driver.current_url  # 가벼운 왕복 요청으로 세션 확인
+            return True
+        except Exception:
+            return False
+
+    def heap_mb(self) -> Optional[float]:
+        """CDP Performance 지표의 JS 힙 사용량(MB). 조회할 수 없으면 None"""
+        try:
+            metrics = self.driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+            used = next(m['value'] for m in metrics if m['name'] == 'JSHeapUsedSize')
+            return used / (1024 * 1024)
+        except Exception:
+            return None
+
+    def summary(self) -> dict:
+        return {**self.stats, 'posts_since_start': self.posts, 'running': self.driver is not None}
+
+    def shutdown(self):
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Browser daemon quit error: {e}")
+        self.driver = None
+        self.logged_in = False
+        self.baseline_heap_mb = None
@@ -0,0 +1,117 @@
+import logging
+from typing import List
+from chrome_data_dir import ChromeDataDir, get_chrome_data_dir
+
+# 성능 프로필에서 차단하는 요청 (이미지, 웹폰트, 방문 통계/광고 수집)
+DEFAULT_BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*wcs.naver.net*', '*lcs.naver.com*', '*nlog.naver.com*', '*tivan.naver.com*'
+]
+
+# 렌더링/확장 기능을 끄는 Chrome 옵션 (창 없이 실행하므로 GPU 합성 불필요)
+PERFORMANCE_ARGS = [
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--mute-audio'
+]
+
+# 현재 문서의 첫 페인트/로드 시간(ms)과 전송량, 리소스 요청 수 (디스크 캐시에서 읽은 리소스 수 포함)
+NAVIGATION_TIMING_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav) return null;
+var paints = {};
+performance.getEntriesByType('paint').forEach(function (p) { paints[p.name] = Math.round(p.startTime); });
+var resources = performance.getEntriesByType('resource');
+var transferred = nav.transferSize || 0, cached = 0;
+for (var i = 0; i < resources.length; i++) {
+    transferred += resources[i].transferSize || 0;
+    if (resources[i].transferSize === 0 && resources[i].decodedBodySize > 0) cached++;
+}
+return {
+    first_paint_ms: paints['first-paint'] != null ? paints['first-paint'] : null,
+    first_contentful_paint_ms: paints['first-contentful-paint'] != null ? paints['first-contentful-paint'] : null,
+    dom_content_loaded_ms: Math.round(nav.domContentLoadedEventEnd),
+    load_ms: Math.round(nav.loadEventEnd),
+    resources: resources.length,
+    cached_resources: cached,
+    transferred_kb: Math.round(transferred / 1024)
+};
+"""
+
+
+class BrowserProfile:
+    """기본 프로필: 브라우저를 일반 설정 그대로 띄웁니다. (headless 는 설정값을 따름)
+    data_dir 을 주면 빈 프로필 대신 재사용하는 user-data-dir 로 띄우고, 띄우기 전에 폴더를 정리합니다.
+    """
+    name = 'default'
+
+    def __init__(self, headless: bool = False, data_dir: ChromeDataDir = None):
+        self.headless = headless
+        self.data_dir = data_dir
+
+    def apply_options(self, options):
+        """드라이버 생성 전 ChromeOptions 에 프로필 설정을 적용합니다."""
+        if self.headless:
+            options.add_argument('--headless=new')
+            options.add_argument('--window-size=1920,1080')
+        if self.data_dir:
+            if self.data_dir.acquire():
+                self.data_dir.compact()
+                self.data_dir.apply_options(options)
+            else:
+                print(f"- Chrome 프로필 폴더가 다른 프로세스에서 사용 중이라 빈 프로필로 실행합니다: {self.data_dir.path}")
+
+    def apply_driver(self, driver):
+        """드라이버 생성 후 CDP 설정을 적용합니다."""
+        pass
+
+
+class PerformanceProfile(BrowserProfile):
+    """성능 프로필: headless(new) 로 띄우고 GPU/확장 기능을 끄며,
+    CDP Network.setBlockedURLs 로 이미지, 웹폰트, 방문 통계 요청을 차단합니다.
+    """
+    name = 'performance'
+
+    def __init__(self, blocked_urls: List[str] = None, data_dir: ChromeDataDir = None):
+        super().__init__(headless=True, data_dir=data_dir)
+        self.blocked_urls = DEFAULT_BLOCKED_URLS if blocked_urls is None else blocked_urls
+        self.logger = logging.getLogger(__name__)
+
+    def apply_options(self, options):
+        super().apply_options(options)
+        for arg in PERFORMANCE_ARGS:
+            options.add_argument(arg)
+
+    def apply_driver(self, driver):
+        if not self.blocked_urls:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_urls})
+        except Exception as e:
+            self.logger.warning(f"Network.setBlockedURLs unavailable, loading all resources: {e}")
+
+
+def create_browser_profile(config: dict) -> BrowserProfile:
+    """설정(blog_settings.browser_profile)에 맞는 브라우저 프로필을 생성합니다."""
+    blog_settings = config.get('blog_settings', {})
+    settings = blog_settings.get('browser_profile', {})
+    name = settings.get('name', BrowserProfile.name)
+    data_dir = get_chrome_data_dir(config)
+    if name == PerformanceProfile.name:
+        return PerformanceProfile(blocked_urls=settings.get('blocked_urls'), data_dir=data_dir)
+    if name != BrowserProfile.name:
+        logging.getLogger(__name__).warning(f"Unknown browser profile '{name}', using default")
+    return BrowserProfile(headless=blog_settings.get('headless', False), data_dir=data_dir)
+
+
+def page_load_timing(driver) -> dict:
+    """현재 페이지의 Navigation/Resource Timing 요약을 반환합니다. 측정할 수 없으면 빈 dict"""
+    try:
+        return driver.execute_script(NAVIGATION_TIMING_SCRIPT) or {}
+    except Exception:
+        return {}
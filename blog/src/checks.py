@@ -0,0 +1,392 @@
+import argparse
+import contextlib
+import json
+import logging
+import os
+import socket
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+from markdown_html import markdown_to_html, markdown_to_text, parse_blocks
+from mock_metaweblog import MockMetaWeblogServer
+from mock_naver import MockNaverServer
+from editor_insertion import BODY_LENGTH_SCRIPT, HtmlPasteInsertion, InsertionStrategy, PasteInsertion, count_visible_chars
+from publish_outbox import NOT_SENT, PENDING, PUBLISHED, UNCONFIRMED, UNKNOWN, FAILED, PublishOutbox, PublishWorker
+
+
+GOLDEN_DIR = Path(__file__).parent.parent / 'samples' / 'markdown'
+
+# 골든 파일용 추천 종목 (과매수/대형주, 중립/시가총액 없음 분기)
+GOLDEN_RECOMMENDATIONS = [
+    {'name': 'NVIDIA Corporation', 'symbol': 'NVDA', 'price': 181.5, 'change_pct': 6.42, 'volume': 312_400_000,
+     'rsi': 74.31, 'macd': 2.18, 'score': 8.75, 'market_cap': 4_420_000_000_000, 'sector': 'Technology',
+     'industry': 'Semiconductors', 'category': 'gainers'},
+    {'name': 'Realty Income Corp', 'symbol': 'O', 'price': 57.08, 'change_pct': -1.35, 'volume': 840_000,
+     'rsi': 45.2, 'macd': -0.31, 'score': 5.1, 'market_cap': 'N/A', 'sector': 'Real Estate',
+     'industry': 'REIT - Retail', 'category': 'losers'}
+]
+
+
+class CheckRunner:
+    """점검 항목을 실행하고 OK/FAIL 을 출력합니다. 하나라도 실패하면 종료 코드 1
+    update_golden 이면 골든 파일을 비교하지 않고 현재 결과로 다시 씁니다.
+    """
+
+    def __init__(self, update_golden: bool = False):
+        self.failures = 0
+        self.update_golden = update_golden
+
+    def golden(self, name: str, path: Path, actual: str):
+        if self.update_golden:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(actual, encoding='utf-8')
+            print(f" UPD  {name}: {path.name}")
+            return
+        expected = path.read_text(encoding='utf-8') if path.exists() else None
+        detail = 'missing golden file' if expected is None else _first_difference(expected, actual)
+        self.check(f"{name}: {path.name}", actual == expected, detail)
+
+    def check(self, name: str, condition: bool, detail: str = ''):
+        print(f"{'OK' if condition else 'FAIL':>4}  {name}{f'  ({detail})' if detail and not condition else ''}")
+        if not condition:
+            self.failures += 1
+
+    def skip(self, name: str, reason: str):
+        print(f"SKIP  {name}  ({reason})")
+
+
+def _first_difference(expected: str, actual: str) -> str:
+    for line_no, (a, b) in enumerate(zip(expected.splitlines(), actual.splitlines()), 1):
+        if a != b:
+            return f"line {line_no}: expected {a[:60]!r}, got {b[:60]!r}"
+    return f"line count {len(expected.splitlines())} != {len(actual.splitlines())}"
+
+
+def _quiet(func, *args, **kwargs):
+    """점검 대상의 진행 출력을 숨기고 실행합니다."""
+    with contextlib.redirect_stdout(StringIO()):
+        return func(*args, **kwargs)
+
+
+class _FakePublisher:
+    name = 'fake'
+
+    def __init__(self, outcome, calls: list):
+        self.outcome = outcome
+        self.calls = calls
+
+    def publish(self, title, content, tags):
+        self.calls.append(title)
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+    def close(self):
+        pass
+
+
+def _broken_factory():
+    raise RuntimeError('no chrome')
+
+
+def check_outbox(runner: CheckRunner):
+    """발행 결과별 대기열 처리: 보내기 전 실패만 재시도하고, 보낸 뒤 실패/확인 불가는 unconfirmed 로 남기는지"""
+    cases = [
+        ('published', PUBLISHED, PUBLISHED),
+        ('not sent → retry', NOT_SENT, PENDING),
+        ('unknown → unconfirmed', UNKNOWN, UNCONFIRMED),
+        ('exception during publish → unconfirmed', RuntimeError('read timeout'), UNCONFIRMED)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, outcome, expected in cases:
+            outbox = PublishOutbox(Path(tmp) / f"{expected}_{len(label)}.sqlite")
+            calls = []
+            worker = PublishWorker(outbox, lambda: _FakePublisher(outcome, calls), max_attempts=3,
+                                   backoff_base=0, backoff_max=0)
+            job_id = outbox.enqueue('2026-01-01', label, 'body', ['tag'])
+            _quiet(worker.run_once)
+            _quiet(worker.run_once)  # 재시도 대상이면 한 번 더 시도됨
+            status = outbox.get(job_id)['status']
+            expected_calls = 2 if expected == PENDING else 1
+            runner.check(f"outbox: {label}", status == expected and len(calls) == expected_calls,
+                         f"status={status}, publish calls={len(calls)}")
+            outbox.close()
+
+        # 팩토리 오류(브라우저 시작 실패 등)는 보내기 전 실패
+        outbox = PublishOutbox(Path(tmp) / 'factory.sqlite')
+        worker = PublishWorker(outbox, _broken_factory, max_attempts=1)
+        job_id = outbox.enqueue('2026-01-01', 'factory error', 'body', [])
+        _quiet(worker.run_once)
+        runner.check("outbox: publisher factory error → failed (max attempts 1)", outbox.get(job_id)['status'] == FAILED)
+
+        # 확인 필요 작업 정리
+        outbox.conn.execute("UPDATE jobs SET status = ? WHERE id = ?", (UNCONFIRMED, job_id))
+        runner.check("outbox: unconfirmed job is kept for today's run", outbox.find('2026-01-01')['id'] == job_id)
+        runner.check("outbox: resolve --retry requeues", outbox.resolve(job_id, published=False)
+                     and outbox.get(job_id)['status'] == PENDING)
+        runner.check("outbox: resolve ignores non-unconfirmed jobs", not outbox.resolve(job_id, published=True))
+        outbox.close()
+
+
+def _free_port() -> int:
+    """연결을 받지 않는 로컬 포트 (연결 거부 재현용)"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def check_metaweblog(runner: CheckRunner):
+    """로컬 모의 MetaWeblog API 로 MetaWeblogPublisher 의 요청 내용과 실패별 발행 결과를 확인합니다."""
+    from publisher import MetaWeblogPublisher
+
+    os.environ['MOCK_METAWEBLOG_USER'] = 'mock-user'
+    os.environ['MOCK_METAWEBLOG_KEY'] = 'mock-api-key'
+    server = MockMetaWeblogServer(api_key='mock-api-key').start()
+
+    def publisher(endpoint=server.endpoint, api_key_env='MOCK_METAWEBLOG_KEY', timeout=2):
+        return MetaWeblogPublisher({'blog_settings': {'metaweblog': {
+            'endpoint': endpoint, 'blog_id': 'mock-blog', 'category': '종목 추천 및 분석', 'timeout': timeout,
+            'username_env': 'MOCK_METAWEBLOG_USER', 'api_key_env': api_key_env
+        }}})
+
+    content = "## 시장 개요\n\n오늘 **S&P 500** 은 상승했습니다.\n\n- AAPL: +1.2%\n- MSFT: -0.4%"
+    try:
+        outcome = _quiet(publisher().publish, '[종목추천] 점검 글', content, ['미국주식', 'AAPL'])
+        sent = server.posts[-1] if server.posts else {}
+        post = sent.get('post', {})
+        runner.check("metaweblog: published", outcome == PUBLISHED, outcome)
+        runner.check("metaweblog: blog id / user / publish flag",
+                     (sent.get('blog_id'), sent.get('username'), sent.get('publish')) == ('mock-blog', 'mock-user', True))
+        runner.check("metaweblog: title", post.get('title') == '[종목추천] 점검 글', post.get('title'))
+        runner.check("metaweblog: description is HTML",
+                     '<h2>시장 개요</h2>' in post.get('description', '') and '<strong>S&amp;P 500</strong>' in post.get('description', '')
+                     and '<li>AAPL: +1.2%</li>' in post.get('description', ''), post.get('description'))
+        runner.check("metaweblog: keywords", post.get('mt_keywords') == '미국주식,AAPL', post.get('mt_keywords'))
+        runner.check("metaweblog: category", post.get('categories') == ['종목 추천 및 분석'], post.get('categories'))
+
+        os.environ['MOCK_METAWEBLOG_BAD_KEY'] = 'wrong-key'
+        before = len(server.posts)
+        outcome = _quiet(publisher(api_key_env='MOCK_METAWEBLOG_BAD_KEY').publish, 'fault', content, [])
+        runner.check("metaweblog: fault → not sent", outcome == NOT_SENT and len(server.posts) == before, outcome)
+
+        outcome = _quiet(publisher(endpoint=f"http://127.0.0.1:{_free_port()}/RPC2").publish, 'refused', content, [])
+        runner.check("metaweblog: connection refused → not sent", outcome == NOT_SENT, outcome)
+
+        # 서버는 글을 만들었지만 응답이 늦어 시간 초과 → 발행됐을 수 있음
+        server.delay_s = 2
+        outcome = _quiet(publisher(timeout=0.5).publish, 'timeout', content, [])
+        runner.check("metaweblog: read timeout → unknown", outcome == UNKNOWN and server.posts[-1]['post']['title'] == 'timeout', outcome)
+        server.delay_s = 0
+
+        server.fail_status = 502
+        outcome = _quiet(publisher().publish, 'bad gateway', content, [])
+        runner.check("metaweblog: 5xx → unknown", outcome == UNKNOWN and server.posts[-1]['post']['title'] == 'bad gateway', outcome)
+        server.fail_status = 404
+        before = len(server.posts)
+        outcome = _quiet(publisher().publish, 'not found', content, [])
+        runner.check("metaweblog: 4xx → not sent", outcome == NOT_SENT and len(server.posts) == before, outcome)
+    finally:
+        server.stop()
+
+
+def _session_poster(server: MockNaverServer, session_path: Path):
+    """세션 저장을 켠 포스터와 login() 호출 기록"""
+    from blog_poster import NaverBlogPoster
+
+    os.environ.setdefault('NAVER_USERNAME', 'mock-user')
+    os.environ.setdefault('NAVER_PASSWORD', 'mock-password')
+    poster = NaverBlogPoster({'blog_settings': {
+        'urls': server.urls(), 'headless': True, 'browser_profile': {'name': 'default'},
+        'session': {'enabled': True, 'path': str(session_path)}
+    }})
+    logins = []
+    login = poster.login
+
+    def counted_login():
+        logins.append(poster.driver.current_url)
+        return login()
+
+    poster.login = counted_login
+    return poster, logins
+
+
+def _postwrite_opens(poster) -> bool:
+    poster.driver.get(poster.urls['postwrite'])
+    return 'nidlogin' not in poster.driver.current_url
+
+
+def check_session(runner: CheckRunner):
+    """모의 네이버 사이트로 로그인 세션 저장 → 새 브라우저에서 복원 → 유효성 확인, 만료 시 다시 로그인하는지 확인합니다.
+    쿠키 유효성 판단은 브라우저 없이, 저장/복원은 Chrome 으로 점검합니다. (Chrome 이 없으면 건너뜀)
+    """
+    from session_store import NaverSessionStore
+
+    server = MockNaverServer(delay_ms=0, asset_delay_ms=0).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = NaverSessionStore(Path(tmp) / 'probe.pkl', check_url=server.urls()['postwrite'])
+            cookie = server.session_cookie()
+            runner.check("session: is_valid with login cookie", store.is_valid([cookie]))
+            runner.check("session: is_valid without cookie → invalid", not store.is_valid([]))
+            server.expire_sessions()
+            runner.check("session: is_valid with expired cookie → invalid", not store.is_valid([cookie]))
+
+            session_path = Path(tmp) / 'session.pkl'
+            poster, logins = _session_poster(server, session_path)
+            if not _quiet(poster.setup_driver):
+                runner.skip("session: save/restore in Chrome", "webdriver could not start")
+                return
+            try:
+                logged_in = _quiet(poster.ensure_login)
+                runner.check("session: first run logs in and saves session",
+                             logged_in and len(logins) == 1 and session_path.exists(), f"logins={len(logins)}")
+            finally:
+                _quiet(poster.close)
+
+            # 새 브라우저: 저장된 세션을 복원하고 login() 은 부르지 않아야 함
+            poster, logins = _session_poster(server, session_path)
+            _quiet(poster.setup_driver)
+            try:
+                state = poster.session_store.load()
+                runner.check("session: saved state has login cookie and localStorage",
+                             state is not None and any(c['name'] == cookie['name'] for c in state['cookies'])
+                             and 'mockLoginAt' in state['local_storage'])
+                runner.check("session: saved cookie is valid", state is not None and poster.session_store.is_valid(state['cookies']))
+                logged_in = _quiet(poster.ensure_login)
+                runner.check("session: new driver restores without login()", logged_in and not logins, f"logins={len(logins)}")
+                runner.check("session: restored browser opens postwrite", _postwrite_opens(poster), poster.driver.current_url)
+                runner.check("session: localStorage restored",
+                             poster.driver.execute_script("return localStorage.getItem('mockLoginAt');") is not None)
+            finally:
+                _quiet(poster.close)
+
+            # 세션 만료: 복원하지 않고 login() 으로 대체한 뒤 새 세션을 저장
+            server.expire_sessions()
+            poster, logins = _session_poster(server, session_path)
+            _quiet(poster.setup_driver)
+            try:
+                stale = poster.session_store.load()
+                runner.check("session: expired cookie is invalid", not poster.session_store.is_valid(stale['cookies']))
+                logged_in = _quiet(poster.ensure_login)
+                runner.check("session: expired session falls back to login()", logged_in and len(logins) == 1, f"logins={len(logins)}")
+                runner.check("session: re-login opens postwrite", _postwrite_opens(poster), poster.driver.current_url)
+                fresh = poster.session_store.load()
+                runner.check("session: re-login saves a valid session", fresh is not None and poster.session_store.is_valid(fresh['cookies']))
+            finally:
+                _quiet(poster.close)
+    finally:
+        server.stop()
+
+
+class _FakeEditorDriver:
+    """붙여넣기 스크립트를 받으면 본문 글자 수를 ratio 비율만큼 늘리는 가짜 드라이버"""
+
+    def __init__(self, ratio: float = 1.0, measurable: bool = True):
+        self.ratio = ratio
+        self.measurable = measurable
+        self.length = 0
+
+    def execute_script(self, script, *args):
+        if script == BODY_LENGTH_SCRIPT:
+            if not self.measurable:
+                raise RuntimeError('stale element')
+            return self.length
+        text = args[-1]  # 붙여넣기 스크립트의 마지막 인자가 text/plain
+        self.length += int(count_visible_chars(text) * self.ratio)
+        return 'paste' if self.ratio else None
+
+
+class _FakeTyping(InsertionStrategy):
+    name = 'fake-typing'
+
+    def insert(self, content: str) -> bool:
+        self.driver.length += count_visible_chars(content)
+        self.typed = content
+        return True
+
+
+def check_insertion(runner: CheckRunner):
+    """본문 붙여넣기 후 글자 수 검증: 일부만 들어가거나 측정할 수 없으면 실패, 아무것도 안 들어가면 문자 입력으로 전환"""
+    content = '\n\n'.join(f"{i}번째 문단입니다. 오늘 시장은 상승했습니다." for i in range(40))
+
+    def paste(ratio, measurable=True):
+        driver = _FakeEditorDriver(ratio, measurable)
+        fallback = _FakeTyping(driver)
+        ok = _quiet(PasteInsertion(driver, chunk_chars=300, fallback=fallback).insert, content)
+        return ok, driver, fallback
+
+    ok, driver, _ = paste(1.0)
+    runner.check("insertion: paste complete", ok and driver.length == count_visible_chars(content))
+    ok, _, fallback = paste(0.4)
+    runner.check("insertion: paste truncated → failure", not ok and not hasattr(fallback, 'typed'))
+    ok, _, _ = paste(1.0, measurable=False)
+    runner.check("insertion: paste unmeasurable → failure", not ok)
+    ok, driver, fallback = paste(0)
+    runner.check("insertion: paste not applied → typing fallback", ok and getattr(fallback, 'typed', None) == content)
+
+    markdown = "## 시장 개요\n\n오늘 **S&P 500** 은 상승했습니다.\n\n- AAPL: +1.2%\n- MSFT: -0.4%"
+    text = markdown_to_text(markdown)
+
+    def html_paste(ratio, measurable=True):
+        driver = _FakeEditorDriver(ratio, measurable)
+        fallback = _FakeTyping(driver)
+        return _quiet(HtmlPasteInsertion(driver, fallback=fallback).insert, markdown), fallback
+
+    runner.check("insertion: html paste complete", html_paste(1.0)[0])
+    ok, fallback = html_paste(0.4)
+    runner.check("insertion: html paste truncated → failure", not ok and not hasattr(fallback, 'typed'))
+    runner.check("insertion: html paste unmeasurable → failure", not html_paste(1.0, measurable=False)[0])
+    ok, fallback = html_paste(0)
+    runner.check("insertion: html paste not applied → plain text fallback (no Markdown symbols)",
+                 ok and getattr(fallback, 'typed', None) == text and '**' not in text and '#' not in text)
+
+
+def check_markdown(runner: CheckRunner):
+    """분석 글의 추천 종목/투자 전략 섹션 Markdown 과 그 블록/HTML/텍스트 변환 결과를 골든 파일과 비교합니다."""
+    from market_analyzer import MarketAnalyzer
+
+    os.environ.setdefault('DEEPSEEK_API_KEY', 'golden-check')  # 섹션 생성은 API 를 호출하지 않음
+    analyzer = MarketAnalyzer({})
+    sections = {
+        'recommendations': analyzer._create_recommendations_section({'recommendations': GOLDEN_RECOMMENDATIONS}),
+        'strategy': analyzer._create_strategy_section()
+    }
+    for name, markdown in sections.items():
+        runner.golden(f"markdown {name}", GOLDEN_DIR / f"{name}.md", markdown)
+        # 변환기는 골든 입력으로 점검 (분석 문구가 바뀌어도 변환 결과 비교는 유지)
+        source = markdown if runner.update_golden else (GOLDEN_DIR / f"{name}.md").read_text(encoding='utf-8')
+        blocks = '[\n' + ',\n'.join(json.dumps(block, ensure_ascii=False) for block in parse_blocks(source)) + '\n]\n'
+        runner.golden(f"markdown {name}", GOLDEN_DIR / f"{name}.blocks.json", blocks)
+        runner.golden(f"markdown {name}", GOLDEN_DIR / f"{name}.html", markdown_to_html(source) + '\n')
+        runner.golden(f"markdown {name}", GOLDEN_DIR / f"{name}.txt", markdown_to_text(source) + '\n')
+
+
+CHECKS = {
+    'outbox': check_outbox,
+    'metaweblog': check_metaweblog,
+    'markdown': check_markdown,
+    'insertion': check_insertion,
+    'session': check_session
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 점검 (수동 실행용)")
+    parser.add_argument('targets', nargs='*', help=f"실행할 점검 (없으면 전체): {', '.join(CHECKS)}")
+    parser.add_argument('--update-golden', action='store_true', help="골든 파일을 현재 결과로 다시 씀 (변경 내용 확인 후 사용)")
+    args = parser.parse_args()
+    unknown = set(args.targets) - set(CHECKS)
+    if unknown:
+        parser.error(f"unknown check: {', '.join(sorted(unknown))}")
+    logging.disable(logging.CRITICAL)  # 점검 대상이 남기는 오류 로그 숨김 (결과는 OK/FAIL 로 확인)
+
+    runner = CheckRunner(update_golden=args.update_golden)
+    for name in args.targets or CHECKS:
+        CHECKS[name](runner)
+    print(f"\n{'실패 ' + str(runner.failures) + '건' if runner.failures else '모두 통과'}")
+    sys.exit(1 if runner.failures else 0)
+
+
+if __name__ == "__main__":
+    main()
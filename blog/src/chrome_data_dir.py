@@ -0,0 +1,140 @@
+import atexit
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+# 실행 사이에 유지할 필요가 없는 임시 폴더 (정리 시 항상 삭제)
+TRANSIENT_DIRS = [
+    'Crashpad', 'BrowserMetrics', 'ShaderCache', 'GrShaderCache', 'GraphiteDawnCache',
+    'Default/GPUCache', 'Default/DawnCache', 'Default/blob_storage'
+]
+# 전체 크기가 상한을 넘으면 추가로 비우는 캐시 폴더 (다음 실행에서 다시 채워짐)
+CACHE_DIRS = ['Default/Cache', 'Default/Code Cache', 'Default/Service Worker/CacheStorage']
+
+
+def dir_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass  # Chrome 이 쓰는 중 삭제한 파일
+    return total
+
+
+class ChromeDataDir:
+    """실행 사이에 재사용하는 Chrome user-data-dir 입니다.
+    에디터 JS/CSS 가 디스크 캐시(--disk-cache-size 로 제한)에 남아 다음 실행에서 다시 내려받지 않습니다.
+    같은 폴더를 두 프로세스가 동시에 쓰지 않도록 잠금 파일을 프로세스가 끝날 때까지 잡고 있으며,
+    잠금을 얻지 못하면 acquire() 가 False 를 반환합니다. (프로세스가 죽으면 OS 가 잠금을 풀어 줌)
+    """
+
+    def __init__(self, path, cache_mb: float = 200, max_mb: float = 500):
+        self.path = Path(path)
+        self.cache_bytes = int(cache_mb * 1024 * 1024)
+        self.max_bytes = max_mb * 1024 * 1024
+        self.lock_path = self.path.parent / f"{self.path.name}.lock"
+        self.logger = logging.getLogger(__name__)
+        self._lock_file = None
+
+    @property
+    def locked(self) -> bool:
+        return self._lock_file is not None
+
+    def acquire(self) -> bool:
+        """폴더 잠금을 얻습니다. 이미 이 프로세스가 잡고 있으면 True"""
+        if self._lock_file is not None:
+            return True
+        self.path.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.lock_path, 'a+')
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            try:
+                lock_file.seek(0)
+                owner = lock_file.read().strip() or '알 수 없음'
+            except OSError:
+                owner = '알 수 없음'
+            lock_file.close()
+            self.logger.warning(f"Chrome user-data-dir {self.path} is locked by another process ({owner})")
+            return False
+        lock_file.truncate(0)
+        lock_file.write(f"pid={os.getpid()} since={time.strftime('%Y-%m-%d %H:%M:%S')}")
+        lock_file.flush()
+        self._lock_file = lock_file
+        atexit.register(self.release)
+        return True
+
+    def release(self):
+        if self._lock_file is None:
+            return
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                self._lock_file.seek(0)
+                msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+        except OSError as e:
+            self.logger.warning(f"Failed to unlock {self.lock_path}: {e}")
+        self._lock_file.close()
+        self._lock_file = None
+
+    def apply_options(self, options):
+        options.add_argument(f'--user-data-dir={self.path.resolve()}')
+        options.add_argument(f'--disk-cache-size={self.cache_bytes}')
+
+    def compact(self) -> dict:
+        """브라우저가 떠 있지 않을 때 호출합니다. 임시 폴더와 Chrome 잠금 파일을 지우고,
+        그래도 전체 크기가 max_mb 를 넘으면 캐시 폴더를 비웁니다. 정리 전후 크기(MB)를 반환합니다.
+        """
+        before = dir_size(self.path)
+        for name in ['SingletonLock', 'SingletonCookie', 'SingletonSocket']:
+            try:
+                os.unlink(self.path / name)  # 비정상 종료한 Chrome 이 남긴 잠금 (심볼릭 링크)
+            except OSError:
+                pass
+        for name in TRANSIENT_DIRS:
+            shutil.rmtree(self.path / name, ignore_errors=True)
+        after = dir_size(self.path)
+        if after > self.max_bytes:
+            for name in CACHE_DIRS:
+                shutil.rmtree(self.path / name, ignore_errors=True)
+            after = dir_size(self.path)
+            self.logger.info(f"Chrome 프로필 캐시 비움 (상한 {self.max_bytes / 1024 / 1024:.0f}MB 초과)")
+        result = {'before_mb': round(before / 1024 / 1024, 1), 'after_mb': round(after / 1024 / 1024, 1)}
+        self.logger.info(f"Chrome 프로필 정리: {result}")
+        return result
+
+
+_shared_dirs = {}
+_shared_lock = threading.Lock()
+
+
+def get_chrome_data_dir(config: dict):
+    """설정(blog_settings.user_data_dir)의 폴더를 프로세스 전체에서 공유하는 ChromeDataDir 로 반환합니다.
+    사용하지 않도록 설정했으면 None
+    """
+    settings = config.get('blog_settings', {}).get('user_data_dir', {})
+    if not settings.get('enabled', False):
+        return None
+    path = (Path(__file__).parent.parent / settings.get('path', 'cache/chrome-profile')).resolve()
+    with _shared_lock:
+        if path not in _shared_dirs:
+            _shared_dirs[path] = ChromeDataDir(
+                path,
+                cache_mb=settings.get('cache_mb', 200),
+                max_mb=settings.get('max_mb', 500)
+            )
+        return _shared_dirs[path]
@@ -1,165 +1,300 @@
 import pandas as pd
-import requests
+import numpy as np
 from bs4 import BeautifulSoup
 import logging
 from typing import Dict, List, Tuple
+import re
 from datetime import datetime, timedelta
 from io import StringIO
-from GoogleNews import GoogleNews
-import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor, wait
+from price_provider import PriceDataProvider, YahooPriceProvider, history_for
+from indicators import compute_indicators
+from price_cache import CachedPriceProvider
+from metadata_cache import TickerMetadataStore
+from keyword_matcher import get_keyword_matcher
+from news_dedupe import dedupe_news
+from news_sources import DEFAULT_QUERIES, create_news_source, ticker_queries
+from screener_parser import parse_screener_stream
+from http_client import get_http_client
+import time
+from pathlib import Path
 
-def parse_volume(volume_str: str) -> float:
-    """볼륨 문자열을 숫자로 변환합니다."""
+YAHOO_FINANCE_URL = 'https://finance.yahoo.com'
+# 카테고리별 스크리너 페이지 경로
+SCREENER_PATHS = {
+    'gainers': '/gainers',
+    'losers': '/losers',
+    'trending': '/markets/stocks/trending',
+    'most_active': '/most-active',
+    'top_etfs': '/etfs'
+}
+
+# 거래량 접미사 → 지수 표기 (예: '1.2M' → '1.2E6')
+VOLUME_EXPONENTS = {'K': 'E3', 'M': 'E6', 'B': 'E9'}
+NON_NUMERIC_LINE = re.compile(r'^(?![-+]?(?:\d+\.?\d*|\.\d+)(?:E\d+)?$).*$', re.MULTILINE)
+AFTER_FIRST_TOKEN = re.compile(r'(\S)[ \t(].*$', re.MULTILINE)
+
+
+def _text_to_float(values: pd.Series, exponents: Dict[str, str] = None, first_token: bool = False) -> np.ndarray:
+    """문자열 컬럼 전체를 한 번에 float64 배열로 변환합니다. (해석 불가 값은 NaN)
+    값을 줄바꿈으로 이어 붙인 하나의 문자열에 치환을 적용한 뒤 NumPy 로 한 번에 변환하므로
+    행마다 파이썬 함수를 호출하지 않습니다.
+    """
+    text = '\n'.join(map(str, values.tolist())).upper()
+    if first_token and (' ' in text or '(' in text):
+        # '92.17 -2.14 (-2.27%)' 처럼 변동폭이 붙은 경우 첫 번째 값만 사용
+        text = AFTER_FIRST_TOKEN.sub(r'\1', text)
+    text = text.replace(',', '').replace('%', '').replace('+', '').replace(' ', '').replace('\t', '')
+    for suffix, exponent in (exponents or {}).items():
+        text = text.replace(suffix, exponent)
+    lines = text.split('\n')
+    if len(lines) != len(values):
+        # 값 안에 줄바꿈이 있으면 줄 단위 대응이 깨지므로 느린 경로로 처리
+        return pd.to_numeric(values, errors='coerce').to_numpy(dtype='float64')
     try:
-        if not isinstance(volume_str, str):
-            return float(volume_str)
-            
-        volume_str = volume_str.strip().upper()
-        if not volume_str or volume_str == 'N/A':
-            return 0.0
-            
-        # 접미사 제거 및 숫자 변환
-        multiplier = 1
-        if volume_str.endswith('K'):
-            multiplier = 1_000
-            volume_str = volume_str[:-1]
-        elif volume_str.endswith('M'):
-            multiplier = 1_000_000
-            volume_str = volume_str[:-1]
-        elif volume_str.endswith('B'):
-            multiplier = 1_000_000_000
-            volume_str = volume_str[:-1]
-            
-        # 콤마 제거 후 숫자 변환
-        volume = float(volume_str.replace(',', ''))
-        return volume * multiplier
-        
-    except (ValueError, TypeError, AttributeError):
-        return 0.0
+        return np.array(lines, dtype=np.float64)
+    except ValueError:
+        # 'N/A', '--' 등 숫자가 아닌 값이 섞인 경우에만 해당 줄을 NaN 으로 바꿔 다시 변환
+        return np.array(NON_NUMERIC_LINE.sub('NAN', text).split('\n'), dtype=np.float64)
+
+
+def normalize_screener_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """스크리너 DataFrame 의 Price, % Change, Volume 을 숫자 컬럼으로 변환합니다. (벡터화 연산)
+    Price/% Change 는 float64, Volume 은 K/M/B 접미사를 반영한 int64 (해석 불가 값은 0) 입니다.
+    수집 직후 한 번만 실행하고, 이후 단계는 변환된 컬럼을 그대로 사용합니다.
+    """
+    if df.empty:
+        return df
+    df = df.copy()
+
+    if 'Price' in df.columns:
+        if not pd.api.types.is_numeric_dtype(df['Price']):
+            df['Price'] = _text_to_float(df['Price'], first_token=True)
+        df['Price'] = df['Price'].astype('float64')
+
+    if '% Change' in df.columns:
+        if not pd.api.types.is_numeric_dtype(df['% Change']):
+            df['% Change'] = _text_to_float(df['% Change'])
+        df['% Change'] = df['% Change'].astype('float64')
+
+    if 'Volume' in df.columns:
+        if pd.api.types.is_numeric_dtype(df['Volume']):
+            volume = df['Volume'].to_numpy(dtype='float64')
+        else:
+            volume = _text_to_float(df['Volume'], exponents=VOLUME_EXPONENTS)
+        df['Volume'] = np.round(np.nan_to_num(volume, nan=0.0, posinf=0.0, neginf=0.0)).astype('int64')
+
+    return df
 
 class MarketDataCollector:
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, price_provider: PriceDataProvider = None):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        yf_settings = config.get('data_collection', {}).get('yfinance', {})
+        self.price_provider = price_provider or YahooPriceProvider(
+            max_workers=yf_settings.get('info_workers', 8)
+        )
+        # 가격 히스토리 로컬 캐시 (설정 시 사용)
+        cache_settings = config.get('data_collection', {}).get('price_cache', {})
+        if cache_settings.get('enabled', False):
+            self.price_provider = CachedPriceProvider(
+                self.price_provider,
+                Path(__file__).parent.parent / cache_settings.get('directory', 'cache/prices'),
+                ttl_days=cache_settings.get('ttl_days', 14),
+                max_mb=cache_settings.get('max_mb', 200),
+                refresh_minutes=cache_settings.get('refresh_minutes', 60)
+            )
+        # 종목 정보(info) 필드 캐시 (설정 시 사용)
+        self.metadata_store = None
+        metadata_settings = config.get('data_collection', {}).get('metadata_cache', {})
+        if metadata_settings.get('enabled', False):
+            ttl_hours = metadata_settings.get('ttl_hours', {})
+            field_ttls = {field: hours * 3_600 for field, hours in ttl_hours.items()} or None
+            self.metadata_store = TickerMetadataStore(
+                Path(__file__).parent.parent / metadata_settings.get('path', 'cache/metadata.sqlite'),
+                field_ttls=field_ttls
+            )
+        self.http = get_http_client(config)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        # Google News 설정
-        self.gn = GoogleNews()
-        self.gn.set_encode('utf-8')
-        self.gn.set_lang('en')
-        self.gn.set_topic('CAAqJggKIiBDQkFTRWdvSUwyMHZNRGx6TVdZU0FtVnVHZ0pWVXlnQVAB?hl=en-US&gl=US&ceid=US%3Aen')
+        # 뉴스 수집기 (질의별 동시 요청, 설정 시 (질의, 날짜)별 캐시)
+        self.news_source = create_news_source(config, self.http, self.headers)
 
     def get_market_data(self) -> Dict[str, pd.DataFrame]:
-        """Yahoo Finance에서 시장 데이터(상승주, 하락주, 거래량 상위, ETF)를 수집합니다."""
-        urls = {
-            'gainers': 'https://finance.yahoo.com/gainers',
-            'losers': 'https://finance.yahoo.com/losers',
-            'trending': 'https://finance.yahoo.com/markets/stocks/trending',
-            'most_active': 'https://finance.yahoo.com/most-active',
-            'top_etfs': 'https://finance.yahoo.com/etfs'
-        }
+        """Yahoo Finance에서 시장 데이터(상승주, 하락주, 거래량 상위, ETF)를 수집합니다.
+        카테고리 페이지는 스레드 풀로 동시에 요청하며, 실패하거나 마감 시간을 넘긴
+        카테고리는 빈 DataFrame 으로 채웁니다.
+        """
+        settings = self.config.get('data_collection', {}).get('market_data', {})
+        base_url = settings.get('base_url', YAHOO_FINANCE_URL).rstrip('/')
+        urls = {category: base_url + path for category, path in SCREENER_PATHS.items()}
+        max_in_flight = max(1, int(settings.get('max_in_flight', len(urls))))
+        category_timeout = float(settings.get('category_timeout', 10))
+        # 동시 요청 수보다 카테고리가 많으면 대기열 순서만큼 마감 시간을 늘려줌
+        rounds = -(-len(urls) // max_in_flight)
+        deadline = category_timeout * rounds + 1
 
         market_data = {}
-        for category, url in urls.items():
-            try:
-                print(f"- {category} 데이터 수집 중...")
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()  # HTTP 오류 확인
-                
-                html_io = StringIO(response.text)
-                df = pd.read_html(html_io)[0]
-                
-                # 데이터 검증
-                if df.empty:
-                    raise ValueError(f"Empty dataframe received for {category}")
-                
-                # 필요한 컬럼 매핑 및 선택
-                print(f"Found columns for {category}: {df.columns.tolist()}")
-                
-                # 기본 컬럼 요구사항
-                required_cols = {'Symbol', 'Name'}
-                missing_cols = required_cols - set(df.columns)
-                if missing_cols:
-                    raise ValueError(f"Missing required columns: {missing_cols}")
-                
-                # 컬럼 매핑
-                # 가격과 변화율 컬럼 찾기
-                price_col = next((col for col in df.columns if 'Price' in col), None)
-                change_col = next((col for col in df.columns if 'Change %' in col or '% Change' in col), None)
-                volume_col = next((col for col in df.columns if 'Volume' in col), None)
-                
-                if not price_col or not change_col:
-                    raise ValueError(f"Could not find price or change columns in {df.columns}")
-                
-                # 데이터프레임 재구성
-                result_df = pd.DataFrame()
-                result_df['Symbol'] = df['Symbol']
-                result_df['Name'] = df['Name']
-                result_df['Price'] = df[price_col]
-                result_df['% Change'] = df[change_col]
-                if volume_col:
-                    result_df['Volume'] = df[volume_col]
-                
-                market_data[category] = result_df
-                print(f"✓ {category} 데이터 수집 완료 (rows: {len(result_df)})")
-                
-            except Exception as e:
-                self.logger.error(f"Error collecting {category} data: {e}")
-                print(f"✗ {category} 데이터 수집 실패: {str(e)}")
-                market_data[category] = pd.DataFrame()
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        try:
+            futures = {
+                executor.submit(self._fetch_category, category, url, category_timeout): category
+                for category, url in urls.items()
+            }
+            done, not_done = wait(futures, timeout=deadline)
+
+            for future, category in futures.items():
+                if future in not_done:
+                    self.logger.error(f"Error collecting {category} data: deadline ({deadline:.0f}s) exceeded")
+                    print(f"✗ {category} 데이터 수집 실패: 마감 시간 초과")
+                    market_data[category] = pd.DataFrame()
+                    continue
+                try:
+                    result_df = normalize_screener_frame(future.result())
+                    market_data[category] = result_df
+                    print(f"✓ {category} 데이터 수집 완료 (rows: {len(result_df)})")
+                except Exception as e:
+                    self.logger.error(f"Error collecting {category} data: {e}")
+                    print(f"✗ {category} 데이터 수집 실패: {str(e)}")
+                    market_data[category] = pd.DataFrame()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # 카테고리 순서 유지
+        return {category: market_data[category] for category in urls}
+
+    def _fetch_category(self, category: str, url: str, timeout: float) -> pd.DataFrame:
+        """단일 카테고리 페이지를 가져와 필요한 컬럼만 남긴 DataFrame 으로 변환합니다."""
+        print(f"- {category} 데이터 수집 중...")
+        parser_mode = self.config.get('data_collection', {}).get('market_data', {}).get('parser', 'stream')
+        if parser_mode == 'stream':
+            return self._fetch_category_stream(category, url, timeout)
+        
+        response = self.http.get(url, headers=self.headers, timeout=timeout,
+                                 deadline=time.monotonic() + timeout)
+        response.raise_for_status()  # HTTP 오류 확인
+        
+        html_io = StringIO(response.text)
+        df = pd.read_html(html_io)[0]
+        
+        # 데이터 검증
+        if df.empty:
+            raise ValueError(f"Empty dataframe received for {category}")
+        
+        # 필요한 컬럼 매핑 및 선택
+        print(f"Found columns for {category}: {df.columns.tolist()}")
+        
+        # 기본 컬럼 요구사항
+        required_cols = {'Symbol', 'Name'}
+        missing_cols = required_cols - set(df.columns)
+        if missing_cols:
+            raise ValueError(f"Missing required columns: {missing_cols}")
+        
+        # 컬럼 매핑
+        # 가격과 변화율 컬럼 찾기
+        price_col = next((col for col in df.columns if 'Price' in col), None)
+        change_col = next((col for col in df.columns if 'Change %' in col or '% Change' in col), None)
+        volume_col = next((col for col in df.columns if 'Volume' in col), None)
+        
+        if not price_col or not change_col:
+            raise ValueError(f"Could not find price or change columns in {df.columns}")
+        
+        # 데이터프레임 재구성
+        result_df = pd.DataFrame()
+        result_df['Symbol'] = df['Symbol']
+        result_df['Name'] = df['Name']
+        result_df['Price'] = df[price_col]
+        result_df['% Change'] = df[change_col]
+        if volume_col:
+            result_df['Volume'] = df[volume_col]
+        
+        return result_df
 
-        return market_data
+    def _fetch_category_stream(self, category: str, url: str, timeout: float) -> pd.DataFrame:
+        """페이지를 스트리밍으로 받으면서 첫 번째 표만 파싱합니다. (표를 다 읽으면 나머지는 받지 않음)"""
+        deadline = time.monotonic() + timeout
+        with self.http.get(url, headers=self.headers, timeout=timeout, stream=True, deadline=deadline) as response:
+            response.raise_for_status()  # HTTP 오류 확인
+            content_type = response.headers.get('Content-Type', '')
+            encoding = response.encoding if 'charset' in content_type.lower() else 'utf-8'
+            result_df = parse_screener_stream(
+                response.iter_content(chunk_size=16 * 1024), encoding=encoding, deadline=deadline
+            )
+        
+        # 데이터 검증
+        if result_df.empty:
+            raise ValueError(f"Empty dataframe received for {category}")
+        print(f"Found columns for {category}: {result_df.columns.tolist()}")
+        return result_df
 
-    def get_market_news(self) -> List[Dict]:
-        """Google News에서 최신 금융 뉴스를 수집합니다."""
+    def get_cache_stats(self) -> Dict[str, dict]:
+        """실행 요약에 표시할 캐시 통계를 반환합니다."""
+        stats = {}
+        if isinstance(self.price_provider, CachedPriceProvider):
+            stats['prices'] = self.price_provider.summary()
+        if self.metadata_store:
+            stats['metadata'] = self.metadata_store.summary()
+        if self.news_source.cache:
+            stats['news'] = self.news_source.cache.summary()
+        if getattr(self.news_source, 'state', None):
+            stats['feeds'] = self.news_source.state.summary()
+        return stats
+
+    def get_market_news(self, symbols: List[str] = None) -> List[Dict]:
+        """Google News(결과 페이지 또는 RSS/Atom 피드, data_collection.news.source)에서 최신 금융 뉴스를 수집합니다.
+        설정한 토픽/검색 질의(시장, 거시경제, 실적 등)와 symbols 로 준 추천 종목별 검색을 동시에 요청해 합칩니다.
+        """
         try:
             print("뉴스 데이터 수집 중...")
             
             # 오늘 날짜 설정
-            today = datetime.now().strftime("%m/%d/%Y")
+            today = datetime.now().strftime("%Y-%m-%d")
             
-            # Google News 설정 및 데이터 가져오기
-            self.gn.clear()
-            self.gn.set_time_range(start=today, end=today)
-            self.gn.get_news()
+            # 수집할 질의 목록 (기본 질의 + 추천 종목별 검색)
+            settings = self.config.get('data_collection', {}).get('news', {})
+            specs = list(settings.get('queries') or DEFAULT_QUERIES)
+            ticker_query = settings.get('ticker_query', '{symbol} stock')
+            if symbols and ticker_query:
+                specs += ticker_queries(symbols, ticker_query)
             
-            # 결과를 DataFrame으로 변환
-            results = self.gn.results()
+            results = self.news_source.collect(specs, today)
             if not results:
                 return []
-                
-            df = pd.DataFrame(results)[['title', 'datetime']]
-            df['date'] = df['datetime'].dt.date
             
-            # 중요 키워드 정의
-            priority_keywords = {
-                'high': ['tariff', 'trade', 'fed', 'interest rate', 'inflation', 'economy', 'market'],
-                'medium': ['earnings', 'stock', 'company', 'industry'],
-                'low': ['product', 'service', 'individual stock']
-            }
+            # 중요 키워드 매처 (keyword_taxonomies.news_importance, 컴파일 후 재사용)
+            importance_matcher = get_keyword_matcher(self.config, 'news_importance')
             
             # 뉴스 데이터 변환
             news_items = []
-            for _, row in df.iterrows():
-                title = row['title']
+            for article in results:
+                title = article['title']
                 
-                # 뉴스 중요도 평가
-                importance = 'low'
-                for level, keywords in priority_keywords.items():
-                    if any(keyword.lower() in title.lower() for keyword in keywords):
-                        importance = level
-                        break
+                # 뉴스 중요도 평가 (제목을 한 번만 훑어 가장 높은 중요도 선택)
+                importance = importance_matcher.classify(title, default='low')
                 
                 news_items.append({
                     'title': title,
-                    'time': row['date'].strftime('%Y-%m-%d'),
+                    'time': article['datetime'].strftime('%Y-%m-%d') if article['datetime'] else today,
                     'importance': importance
                 })
             
-            # 중요도에 따라 정렬
+            # 같은 사건을 다룬 여러 언론사 기사는 대표 기사 하나로 묶음 (묶인 기사 수는 중요도에 반영)
+            dedupe_settings = settings.get('dedupe', {})
+            if dedupe_settings.get('enabled', True):
+                collected = len(news_items)
+                news_items = dedupe_news(
+                    news_items,
+                    threshold=dedupe_settings.get('threshold', 0.5),
+                    num_perm=dedupe_settings.get('num_perm', 64),
+                    bands=dedupe_settings.get('bands', 16),
+                    boost_cluster_size=dedupe_settings.get('boost_cluster_size', 3)
+                )
+                print(f"- 중복 기사 정리: {collected}개 → {len(news_items)}개")
+            
+            # 중요도에 따라 정렬 (같은 중요도면 많이 보도된 기사 우선)
             importance_order = {'high': 0, 'medium': 1, 'low': 2}
-            news_items.sort(key=lambda x: importance_order[x['importance']])
+            news_items.sort(key=lambda x: (importance_order[x['importance']], -x.get('cluster_size', 1)))
             
             print(f"✓ 뉴스 데이터 수집 완료 (기사 수: {len(news_items)})")
             return news_items
@@ -191,113 +326,71 @@ class MarketDataCollector:
                 print("분석할 종목이 없습니다.")
                 return []
             
-            # % Change 컬럼 숫자 타입으로 변환
-            all_stocks['change_pct'] = all_stocks['% Change'].apply(
-                lambda x: float(str(x).strip('%').replace(',', ''))
-            )
-            
-            # Volume 컬럼이 있으면 숫자 타입으로 변환
-            if 'Volume' in all_stocks.columns:
-                all_stocks['volume_numeric'] = all_stocks['Volume'].apply(parse_volume)
+            # 수집 단계에서 숫자 타입으로 정규화된 컬럼 사용
+            all_stocks['change_pct'] = all_stocks['% Change']
             
             # 주식 분석 결과를 저장할 리스트
             recommendations = []
             
-            # 상위 20개 종목만 선택하여 자세한 분석 수행 (성능 최적화)
-            potential_stocks = all_stocks.sort_values(by='change_pct', ascending=False).head(20)
+            # 상위 N개 종목만 선택하여 자세한 분석 수행 (기본 20개, candidate_limit 설정)
+            candidate_limit = self.config.get('data_collection', {}).get('recommendations', {}).get('candidate_limit', 20)
+            potential_stocks = all_stocks.sort_values(by='change_pct', ascending=False, kind='stable').head(candidate_limit)
             
-            # yfinance 데이터 수집 및 기술적 지표 계산 (병렬 계산 준비)
-            stock_data = {}
+            # 같은 종목이 여러 카테고리에 있으면 값이 가장 많이 채워진 행을 사용 (같으면 변동률 순서상 앞 행)
+            value_columns = [c for c in ('Name', 'Price', 'change_pct', 'Volume') if c in potential_stocks.columns]
+            completeness = potential_stocks[value_columns].notna().sum(axis=1)
+            best_rows = completeness.groupby(potential_stocks['Symbol'], sort=False).idxmax()
+            symbols = list(best_rows.index)
+            rows = potential_stocks.loc[best_rows.values].set_index('Symbol')
+            
+            # yfinance 데이터 수집 (히스토리는 일괄 다운로드, info 는 병렬 조회)
             print("기술적 지표 계산 중...")
+            history = self.price_provider.get_history(symbols, period="1mo")
+            if self.metadata_store:
+                infos = self.metadata_store.prefetch(symbols, self.price_provider.get_info)
+            else:
+                infos = self.price_provider.get_info(symbols)
             
-            for _, row in potential_stocks.iterrows():
-                symbol = row['Symbol']
-                try:
-                    # yfinance 데이터 수집
-                    stock = yf.Ticker(symbol)
-                    info = stock.info
-                    hist = stock.history(period="1mo")
-                    
-                    if hist.empty:
-                        continue
-                    
-                    # 기술적 지표 계산을 위한 준비
-                    stock_data[symbol] = {
-                        'history': hist,
-                        'info': info,
-                        'row': row
-                    }
-                except Exception as e:
-                    self.logger.error(f"Error fetching data for {symbol}: {e}")
+            available = []
+            for symbol in symbols:
+                if history_for(history, symbol).empty:
+                    self.logger.error(f"Error fetching data for {symbol}: no price history")
                     continue
+                available.append(symbol)
             
-            # 벡터화된 기술적 지표 계산 함수
-            def calculate_technical_indicators(symbol, data):
-                hist = data['history']
-                row = data['row']
-                info = data['info']
-                
-                # 공통 기술적 지표 계산
-                # 1. RSI 계산 (벡터화 연산)
-                delta = hist['Close'].diff()
-                gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                rs = gain / loss
-                rsi = 100 - (100 / (1 + rs))
-                current_rsi = rsi.iloc[-1]
-                
-                # 2. MACD 계산 (벡터화 연산)
-                exp1 = hist['Close'].ewm(span=12, adjust=False).mean()
-                exp2 = hist['Close'].ewm(span=26, adjust=False).mean()
-                macd = exp1 - exp2
-                signal = macd.ewm(span=9, adjust=False).mean()
-                current_macd = macd.iloc[-1]
-                
-                # 3. 추천 점수 계산
-                score = 0
-                
-                # 3.1 가격 변동성
-                price_change = row['change_pct']
-                if price_change > 0:
-                    score += price_change * 0.5
-                
-                # 3.2 거래량
-                if 'Volume' in row:
-                    volume = parse_volume(str(row['Volume']))
-                    avg_volume = hist['Volume'].mean()
-                    if volume > avg_volume:
-                        score += 10
-                
-                # 3.3 RSI
-                if 30 <= current_rsi <= 70:
-                    score += 15
-                elif current_rsi < 30:  # 과매도
-                    score += 20
-                
-                # 3.4 MACD
-                if current_macd > signal.iloc[-1]:  # 골든크로스
-                    score += 15
-                
-                # 결과 반환
-                return {
-                    'name': row['Name'].strip(),
-                    'symbol': symbol,
-                    'price': row['Price'],
-                    'change_pct': price_change,
-                    'volume': row.get('Volume', 'N/A'),
-                    'rsi': current_rsi,
-                    'macd': current_macd,
-                    'score': score,
-                    'market_cap': info.get('marketCap', 'N/A'),
-                    'sector': info.get('sector', 'N/A'),
-                    'industry': info.get('industry', 'N/A'),
-                    'category': row['category']
-                }
+            if not available:
+                print("가격 데이터를 가져온 종목이 없습니다.")
+                return []
+            
+            # 전 종목 기술적 지표를 (날짜 × 종목) 행렬로 한 번에 계산
+            close = history.xs('Close', axis=1, level=1)[available]
+            volume = history.xs('Volume', axis=1, level=1)[available]
+            indicators = compute_indicators(
+                close,
+                volume,
+                rows.loc[available, 'change_pct'],
+                rows.loc[available, 'Volume'] if 'Volume' in rows.columns else None
+            )
             
-            # 각 종목별 기술적 지표 계산
-            for symbol, data in stock_data.items():
+            for symbol in available:
+                row = rows.loc[symbol]
+                info = infos.get(symbol, {})
+                indicator = indicators.loc[symbol]
                 try:
-                    result = calculate_technical_indicators(symbol, data)
+                    result = {
+                        'name': row['Name'].strip(),
+                        'symbol': symbol,
+                        'price': row['Price'],
+                        'change_pct': row['change_pct'],
+                        'volume': row.get('Volume', 'N/A'),
+                        'rsi': indicator['rsi'],
+                        'macd': indicator['macd'],
+                        'score': indicator['score'],
+                        'market_cap': info.get('marketCap', 'N/A'),
+                        'sector': info.get('sector', 'N/A'),
+                        'industry': info.get('industry', 'N/A'),
+                        'category': row['category']
+                    }
                     recommendations.append(result)
                     print(f"- {symbol} 분석 완료 (점수: {result['score']})")
                 except Exception as e:
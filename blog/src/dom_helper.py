@@ -0,0 +1,121 @@
+import logging
+from collections import Counter
+
+# 페이지에 한 번 설치해 두는 DOM 헬퍼: 찾기/거르기/클릭을 브라우저 안에서 한 번에 처리
+# options: text(보이는 텍스트 일치), classContains(class 속성 부분 일치), visible(기본 true), enabled(기본 true)
+HELPER_LIBRARY = """
+window.__blogDom = window.__blogDom || (function () {
+    function matches(el, options) {
+        if (options.text != null && (el.innerText || el.textContent || '').trim() !== options.text) return false;
+        if (options.classContains != null && (el.getAttribute('class') || '').indexOf(options.classContains) === -1) return false;
+        if (options.visible !== false) {
+            var rect = el.getBoundingClientRect();
+            var style = window.getComputedStyle(el);
+            if (rect.width === 0 || rect.height === 0 || style.visibility === 'hidden' || style.display === 'none') return false;
+        }
+        if (options.enabled !== false && el.disabled) return false;
+        return true;
+    }
+    function find(selector, options) {
+        var nodes = document.querySelectorAll(selector);
+        for (var i = 0; i < nodes.length; i++) {
+            if (matches(nodes[i], options || {})) return nodes[i];
+        }
+        return null;
+    }
+    return {
+        find: find,
+        click: function (selector, options) {
+            var el = find(selector, options);
+            if (!el) return false;
+            el.click();
+            return true;
+        },
+        count: function (selector, options) {
+            var nodes = document.querySelectorAll(selector), n = 0;
+            for (var i = 0; i < nodes.length; i++) {
+                if (matches(nodes[i], options || {})) n++;
+            }
+            return n;
+        }
+    };
+})();
+"""
+
+# 헬퍼가 없으면(주입 전 열린 페이지 등) '__missing__' 을 반환
+CALL_SCRIPT = """
+if (!window.__blogDom) return '__missing__';
+return window.__blogDom[arguments[0]](arguments[1], arguments[2]);
+"""
+
+
+class RoundTripCounter:
+    """driver.execute 를 감싸 WebDriver 명령(HTTP 왕복) 수를 명령별로 셉니다."""
+
+    def __init__(self, driver):
+        self.counts = Counter()
+        self._execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            self.counts[driver_command] += 1
+            return self._execute(driver_command, params)
+
+        driver.execute = counted_execute
+
+    @classmethod
+    def attach(cls, driver) -> 'RoundTripCounter':
+        """드라이버에 카운터를 붙입니다. 이미 붙어 있으면(데몬 브라우저 재사용) 초기화해서 반환합니다."""
+        counter = getattr(driver, '_round_trip_counter', None)
+        if counter is None:
+            counter = cls(driver)
+            driver._round_trip_counter = counter
+        counter.counts.clear()
+        return counter
+
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def summary(self, top: int = 5) -> dict:
+        return {'total': self.total(), 'top': dict(self.counts.most_common(top))}
+
+
+class DomHelper:
+    """브라우저 안의 헬퍼로 요소 찾기 + 조건 거르기 + 클릭을 execute_script 한 번에 처리합니다.
+    헬퍼는 새 문서마다 자동으로 실행되도록 CDP 로 한 번 등록하고, 이미 열린 페이지에는 필요할 때 설치합니다.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.logger = logging.getLogger(__name__)
+        if not getattr(driver, '_dom_helper_registered', False):
+            try:
+                driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': HELPER_LIBRARY})
+                driver._dom_helper_registered = True
+            except Exception as e:
+                self.logger.info(f"DOM helper auto-injection unavailable, injecting per page: {e}")
+
+    def find(self, selector: str, text: str = None, class_contains: str = None, visible: bool = True,
+             enabled: bool = True):
+        """조건에 맞는 첫 번째 요소(WebElement)를 반환합니다. 없으면 None"""
+        return self._call('find', selector, self._options(text, class_contains, visible, enabled))
+
+    def click(self, selector: str, text: str = None, class_contains: str = None, visible: bool = True,
+              enabled: bool = True) -> bool:
+        """조건에 맞는 첫 번째 요소를 클릭합니다. 클릭했으면 True"""
+        return bool(self._call('click', selector, self._options(text, class_contains, visible, enabled)))
+
+    def count(self, selector: str, text: str = None, class_contains: str = None, visible: bool = True,
+              enabled: bool = True) -> int:
+        return self._call('count', selector, self._options(text, class_contains, visible, enabled)) or 0
+
+    def _options(self, text, class_contains, visible, enabled) -> dict:
+        return {'text': text, 'classContains': class_contains, 'visible': visible, 'enabled': enabled}
+
+    def _call(self, method: str, selector: str, options: dict):
+        result = self.driver.execute_script(CALL_SCRIPT, method, selector, options)
+        if result == '__missing__':
+            result = self.driver.execute_script(
+                HELPER_LIBRARY + "return window.__blogDom[arguments[0]](arguments[1], arguments[2]);",
+                method, selector, options
+            )
+        return result
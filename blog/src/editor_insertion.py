@@ -0,0 +1,259 @@
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.action_chains import ActionChains
+import logging
+import time
+from typing import List
+from markdown_html import markdown_to_html, markdown_to_text
+
+# 본문 글자 수를 세는 요소 (제목 영역은 제외하고 계산)
+# 에디터 문단 외에 에디터가 문단으로 바꾸지 않고 남긴 제목/목록 요소(insertHTML 경로)도 포함
+BODY_TEXT_SELECTOR = ', '.join(
+    f"div.se-component-content {tag}" for tag in ('p.se-text-paragraph', 'h1', 'h2', 'h3', 'li')
+)
+TITLE_CONTAINER_SELECTOR = '.se-documentTitle'
+PLACEHOLDER_SELECTOR = '.se-placeholder'
+
+# 입력 후 본문 글자 수가 예상보다 이만큼 넘게 모자라면 입력 실패로 판단 (공백 제외 글자 수 기준)
+LENGTH_TOLERANCE = 3
+
+# 에디터 본문 글자 수 (공백 제외) 측정 스크립트 (자리표시 문구는 제외)
+BODY_LENGTH_SCRIPT = """
+    var paragraphs = document.querySelectorAll(arguments[0]);
+    var total = 0;
+    for (var i = 0; i < paragraphs.length; i++) {
+        if (paragraphs[i].closest(arguments[1])) continue;
+        // 목록 항목 안의 문단처럼 다른 측정 요소 안에 있으면 바깥 요소에서 이미 셈
+        if (paragraphs[i].parentElement && paragraphs[i].parentElement.closest(arguments[0])) continue;
+        var text = paragraphs[i].textContent || '';
+        var placeholders = paragraphs[i].querySelectorAll(arguments[2]);
+        for (var j = 0; j < placeholders.length; j++) {
+            text = text.replace(placeholders[j].textContent || '', '');
+        }
+        total += text.replace(/\\s/g, '').length;
+    }
+    return total;
+"""
+
+# 합성 paste 이벤트로 텍스트를 한 번에 삽입하는 스크립트
+# 에디터가 paste 이벤트를 처리하지 않으면(defaultPrevented 가 아니면) execCommand 로 삽입
+PASTE_SCRIPT = """
+    var text = arguments[0];
+    var target = document.activeElement || document.body;
+    try {
+        var data = new DataTransfer();
+        data.setData('text/plain', text);
+        var event = new ClipboardEvent('paste', {
+            clipboardData: data, bubbles: true, cancelable: true
+        });
+        if (!target.dispatchEvent(event) || event.defaultPrevented) {
+            return 'paste';
+        }
+    } catch (e) {}
+    if (document.execCommand('insertText', false, text)) {
+        return 'execCommand';
+    }
+    return null;
+"""
+
+# 변환된 HTML 을 text/html 붙여넣기 한 번으로 삽입하는 스크립트 (에디터가 처리하지 않으면 insertHTML)
+HTML_PASTE_SCRIPT = """
+    var html = arguments[0], text = arguments[1];
+    var target = document.activeElement || document.body;
+    try {
+        var data = new DataTransfer();
+        data.setData('text/html', html);
+        data.setData('text/plain', text);
+        var event = new ClipboardEvent('paste', {
+            clipboardData: data, bubbles: true, cancelable: true
+        });
+        if (!target.dispatchEvent(event) || event.defaultPrevented) {
+            return 'paste';
+        }
+    } catch (e) {}
+    if (document.execCommand('insertHTML', false, html)) {
+        return 'execCommand';
+    }
+    return null;
+"""
+
+
+def count_visible_chars(text: str) -> int:
+    """공백을 제외한 글자 수를 반환합니다. (에디터 검증 기준과 동일)"""
+    return len(''.join(text.split()))
+
+
+def split_paragraph_chunks(content: str, max_chars: int) -> List[str]:
+    """본문을 문단 단위로 묶어 max_chars 이하의 덩어리로 나눕니다.
+    문단 경계(빈 줄)에서만 자르고, 덩어리 사이 구분 줄바꿈은 다음 덩어리 앞에 붙입니다.
+    """
+    paragraphs = content.split('\n\n')
+    chunks = []
+    current = ''
+    for paragraph in paragraphs:
+        candidate = f"{current}\n\n{paragraph}" if current else paragraph
+        if current and len(candidate) > max_chars:
+            chunks.append(current)
+            current = f"\n\n{paragraph}"
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class InsertionStrategy:
+    """에디터 본문 입력 전략의 기본 클래스입니다."""
+    name = 'base'
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.logger = logging.getLogger(__name__)
+
+    def insert(self, content: str) -> bool:
+        raise NotImplementedError
+
+    def body_length(self) -> int:
+        """현재 에디터 본문에 입력된 글자 수(공백 제외)를 반환합니다."""
+        try:
+            return int(self.driver.execute_script(
+                BODY_LENGTH_SCRIPT, BODY_TEXT_SELECTOR, TITLE_CONTAINER_SELECTOR, PLACEHOLDER_SELECTOR) or 0)
+        except Exception as e:
+            self.logger.warning(f"본문 길이 측정 실패: {e}")
+            return -1
+
+    def verify_length(self, start_length: int, expected: int, final_length: int = None) -> bool:
+        """입력 시작 시점(start_length) 대비 본문 글자 수가 expected 만큼 늘었는지 확인합니다.
+        측정할 수 없거나 LENGTH_TOLERANCE 보다 많이 모자라면 False (final_length 를 주면 다시 측정하지 않음)
+        """
+        if final_length is None:
+            final_length = self.body_length()
+        if start_length < 0 or final_length < 0:
+            print("✗ 본문 길이를 확인할 수 없어 입력 실패로 처리합니다.")
+            self.logger.error("Body length unmeasurable, cannot verify insertion")
+            return False
+        inserted = final_length - start_length
+        if inserted < expected - LENGTH_TOLERANCE:
+            print(f"✗ 본문 길이 검증 실패: 예상 {expected}자, 입력 {inserted}자")
+            self.logger.error(f"Body truncated after {self.name} insertion: expected {expected}, got {inserted}")
+            return False
+        if inserted > expected + LENGTH_TOLERANCE:
+            self.logger.warning(f"Body longer than expected after {self.name} insertion: expected {expected}, got {inserted}")
+        print(f"- 본문 길이 검증 완료 ({inserted}자)")
+        return True
+
+
+class TypingInsertion(InsertionStrategy):
+    """문자 단위 send_keys 입력 (기존 방식, 느리지만 가장 확실함)"""
+    name = 'typing'
+
+    def __init__(self, driver, delay: float = 0.05):
+        super().__init__(driver)
+        self.delay = delay
+
+    def insert(self, content: str) -> bool:
+        actions = ActionChains(self.driver)
+        total_chars = len(content)
+        print(f"- 총 {total_chars} 문자 입력 예정 (문자 단위 입력)")
+
+        for i, char in enumerate(content):
+            if char == '\n':
+                actions.send_keys(Keys.ENTER)
+            else:
+                actions.send_keys(char)
+
+            actions.perform() # 각 문자/Enter 전송
+            time.sleep(self.delay) # 각 문자 입력 후 대기 (속도 조절 가능)
+
+            # 진행 상황 로그 (너무 자주 찍히지 않도록 조절)
+            if (i + 1) % 100 == 0 or (i + 1) == total_chars:
+                print(f"  ... {i+1}/{total_chars} 문자 입력 완료")
+        return True
+
+
+class PasteInsertion(InsertionStrategy):
+    """문단 묶음 단위 붙여넣기 입력 (합성 paste 이벤트 → execCommand 순으로 시도)
+    덩어리마다 본문 글자 수 증가량을 확인합니다. 한 글자도 들어가지 않으면 해당 덩어리부터
+    문자 단위 입력으로 전환하고, 일부만 들어가면 잘린 본문으로 발행하지 않도록 실패로 처리합니다.
+    """
+    name = 'paste'
+
+    def __init__(self, driver, chunk_chars: int = 2000, fallback: InsertionStrategy = None):
+        super().__init__(driver)
+        self.chunk_chars = chunk_chars
+        self.fallback = fallback or TypingInsertion(driver)
+
+    def insert(self, content: str) -> bool:
+        chunks = split_paragraph_chunks(content, self.chunk_chars)
+        start_length = self.body_length()
+        print(f"- 총 {len(content)} 문자를 {len(chunks)}개 묶음으로 붙여넣기 예정")
+
+        before = start_length
+        for index, chunk in enumerate(chunks):
+            method = self.driver.execute_script(PASTE_SCRIPT, chunk)
+            after = self.body_length()
+            inserted = after - before if before >= 0 and after >= 0 else -1
+
+            if not method or inserted == 0:
+                print(f"- 붙여넣기 미적용 ({index+1}/{len(chunks)}), 문자 단위 입력으로 전환")
+                self.logger.warning(f"Paste insertion not applied at chunk {index+1}, falling back to {self.fallback.name}")
+                if not self.fallback.insert(''.join(chunks[index:])):
+                    return False
+                break
+
+            expected = count_visible_chars(chunk)
+            if inserted < 0 or inserted < expected - LENGTH_TOLERANCE:
+                print(f"✗ 붙여넣기 일부만 입력됨 ({index+1}/{len(chunks)}): 예상 {expected}자, 입력 {inserted}자")
+                self.logger.error(f"Chunk {index+1} truncated: expected {expected}, got {inserted}")
+                return False
+            print(f"  ... {index+1}/{len(chunks)} 묶음 입력 완료 ({method})")
+            before = after
+
+        return self.verify_length(start_length, count_visible_chars(content))
+
+
+class HtmlPasteInsertion(InsertionStrategy):
+    """Markdown 을 HTML(제목, 문단, 굵게, 목록)로 변환해 붙여넣기 한 번으로 삽입합니다.
+    서식이 그대로 반영되고 입력 시간이 본문 길이와 무관합니다.
+    한 글자도 들어가지 않으면 문단 묶음 붙여넣기(변환된 일반 텍스트)로 전환하고,
+    일부만 들어가거나 측정할 수 없으면 실패로 처리합니다.
+    """
+    name = 'html'
+
+    def __init__(self, driver, fallback: InsertionStrategy = None):
+        super().__init__(driver)
+        self.fallback = fallback or PasteInsertion(driver)
+
+    def insert(self, content: str) -> bool:
+        html = markdown_to_html(content)
+        text = markdown_to_text(content)
+        print(f"- 총 {len(content)} 문자를 HTML 문서로 변환해 한 번에 붙여넣기 예정")
+
+        before = self.body_length()
+        method = self.driver.execute_script(HTML_PASTE_SCRIPT, html, text)
+        after = self.body_length()
+
+        if not method or (before >= 0 and after == before):
+            print(f"- HTML 붙여넣기 미적용, {self.fallback.name} 방식으로 전환")
+            self.logger.warning(f"HTML paste not applied, falling back to {self.fallback.name}")
+            # 서식 없이 넣으므로 Markdown 기호(#, **)가 남지 않도록 변환된 텍스트를 사용
+            return self.fallback.insert(text)
+
+        if not self.verify_length(before, count_visible_chars(text), after):
+            return False
+        print(f"- HTML 붙여넣기 완료 ({method})")
+        return True
+
+
+def create_insertion_strategy(driver, settings: dict) -> InsertionStrategy:
+    """설정(blog_settings)에 맞는 본문 입력 전략을 생성합니다."""
+    mode = settings.get('body_insertion', PasteInsertion.name)
+    if mode == HtmlPasteInsertion.name:
+        return HtmlPasteInsertion(
+            driver, fallback=PasteInsertion(driver, chunk_chars=settings.get('body_insertion_chunk_chars', 2000))
+        )
+    if mode == PasteInsertion.name:
+        return PasteInsertion(driver, chunk_chars=settings.get('body_insertion_chunk_chars', 2000))
+    if mode == TypingInsertion.name:
+        return TypingInsertion(driver)
+    logging.getLogger(__name__).warning(f"Unknown body_insertion mode '{mode}', using typing")
+    return TypingInsertion(driver)
@@ -0,0 +1,55 @@
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, List, Optional
+from xml.etree.ElementTree import XMLPullParser
+
+# RSS 2.0 <item>, Atom <entry> 에서 읽는 자식 요소 (namespace 제외한 이름)
+ITEM_TAGS = {'item', 'entry'}
+DATE_TAGS = ['pubDate', 'published', 'updated', 'date']  # date: Dublin Core (dc:date)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def parse_feed_date(text: str) -> Optional[datetime]:
+    """RSS(RFC 822) 또는 Atom(ISO 8601) 날짜를 datetime 으로 변환합니다. (해석 불가면 None)"""
+    text = (text or '').strip()
+    if not text:
+        return None
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+    try:
+        published = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    return published if published.tzinfo else published.replace(tzinfo=timezone.utc)
+
+
+def parse_feed_stream(chunks: Iterable[bytes], deadline: float = None, max_items: int = None) -> List[dict]:
+    """RSS/Atom 바이트 조각을 받으면서 항목(item/entry)이 끝날 때마다 제목과 게시 시각을 추출합니다.
+    읽은 항목은 바로 비워 전체 문서 트리를 메모리에 두지 않고, max_items 개를 읽으면 나머지는 받지 않습니다.
+    deadline(time.monotonic 기준 시각)을 넘기면 TimeoutError 를 발생시킵니다.
+    """
+    parser = XMLPullParser(events=('end',))
+    articles = []
+    for chunk in chunks:
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError("Feed download exceeded deadline")
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if _local_name(element.tag) not in ITEM_TAGS:
+                continue
+            fields = {_local_name(child.tag): (child.text or '').strip() for child in element}
+            element.clear()
+            if not fields.get('title'):
+                continue
+            published = next((parse_feed_date(fields[tag]) for tag in DATE_TAGS if fields.get(tag)), None)
+            articles.append({'title': fields['title'], 'datetime': published})
+            if max_items and len(articles) >= max_items:
+                return articles
+    parser.close()
+    return articles
@@ -0,0 +1,163 @@
+import requests
+from requests.adapters import HTTPAdapter
+import logging
+import random
+import threading
+import time
+from bisect import bisect_left
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# 지연 시간 히스토그램 구간 상한 (초)
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+RETRY_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError
+)
+
+
+class RetryPolicy:
+    """재시도 정책: 지수 백오프 + full jitter, Retry-After 헤더가 있으면 우선 적용"""
+
+    def __init__(self, max_retries: int = 2, backoff_base: float = 1.0, backoff_max: float = 30.0,
+                 retry_statuses=(429, 500, 502, 503, 504)):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = set(retry_statuses)
+
+    def delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _retry_after(self, response: Optional[requests.Response]) -> Optional[float]:
+        if response is None:
+            return None
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+
+class HttpClient:
+    """호스트별 커넥션 풀(keep-alive)을 재사용하는 공용 HTTP 클라이언트입니다.
+    모든 요청에 같은 재시도 정책을 적용하고, 호스트별 응답 지연 시간을 기록합니다.
+    """
+
+    def __init__(self, retry_policy: RetryPolicy = None, pool_connections: int = 10, pool_maxsize: int = 10):
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.logger = logging.getLogger(__name__)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._latencies: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def request(self, method: str, url: str, max_retries: int = None, deadline: float = None,
+                **kwargs) -> requests.Response:
+        """요청을 보내고 재시도 대상 상태 코드/연결 오류면 백오프 후 다시 시도합니다.
+        deadline(time.monotonic 기준 시각)을 넘기게 되는 재시도는 하지 않습니다.
+        재시도 후에도 실패하면 마지막 응답을 반환하거나 마지막 예외를 다시 발생시킵니다.
+        """
+        max_retries = self.retry_policy.max_retries if max_retries is None else max_retries
+        host = urlsplit(url).netloc
+        attempt = 0
+        while True:
+            response = None
+            error = None
+            start = time.monotonic()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except RETRY_EXCEPTIONS as e:
+                error = e
+            self._record(host, time.monotonic() - start)
+
+            if error is None and response.status_code not in self.retry_policy.retry_statuses:
+                return response
+            if attempt >= max_retries:
+                if error is not None:
+                    raise error
+                return response
+
+            wait_time = self.retry_policy.delay(attempt, response)
+            if deadline is not None and time.monotonic() + wait_time > deadline:
+                if error is not None:
+                    raise error
+                return response
+
+            reason = error if error is not None else f"HTTP {response.status_code}"
+            self.logger.warning(f"{method} {host} 실패 ({reason}), {wait_time:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            if response is not None:
+                response.close()
+            time.sleep(wait_time)
+            attempt += 1
+
+    def latency_report(self, reset: bool = False) -> Dict[str, dict]:
+        """호스트별 요청 수, p50/p95/최대 지연 시간(초)과 구간별 히스토그램을 반환합니다.
+        reset=True 이면 반환 후 기록을 비웁니다. (스케줄러에서 실행별로 집계할 때 사용)
+        """
+        report = {}
+        with self._lock:
+            latencies = {host: sorted(values) for host, values in self._latencies.items()}
+            if reset:
+                self._latencies.clear()
+        for host, values in latencies.items():
+            histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+            for value in values:
+                histogram[bisect_left(LATENCY_BUCKETS, value)] += 1
+            labels = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+            report[host] = {
+                'count': len(values),
+                'p50': round(values[int(0.5 * (len(values) - 1))], 3),
+                'p95': round(values[int(0.95 * (len(values) - 1))], 3),
+                'max': round(values[-1], 3),
+                'histogram': {label: count for label, count in zip(labels, histogram) if count}
+            }
+        return report
+
+    def _record(self, host: str, elapsed: float):
+        with self._lock:
+            self._latencies.setdefault(host, []).append(elapsed)
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client(config: dict = None) -> HttpClient:
+    """프로세스 전체에서 공유하는 HttpClient 를 반환합니다. (첫 호출 시 config 의 http 설정으로 생성)"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            settings = (config or {}).get('http', {})
+            _shared_client = HttpClient(
+                retry_policy=RetryPolicy(
+                    max_retries=settings.get('max_retries', 2),
+                    backoff_base=settings.get('backoff_base', 1.0),
+                    backoff_max=settings.get('backoff_max', 30.0)
+                ),
+                pool_connections=settings.get('pool_connections', 10),
+                pool_maxsize=settings.get('pool_maxsize', 10)
+            )
+        return _shared_client
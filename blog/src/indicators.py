@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+RSI_WINDOW = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+
+
+def _compact(values: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """각 컬럼의 유효값을 순서를 유지한 채 아래쪽(최근 날짜 쪽)으로 모읍니다.
+    종목별로 상장일/휴장일이 달라 생긴 NaN 을 제거해, 종목 단독 히스토리와 같은 시계열로 만듭니다.
+    """
+    order = np.argsort(valid, axis=0, kind='stable')
+    return np.take_along_axis(values, order, axis=0)
+
+
+def _ewm(values: np.ndarray, span: int) -> np.ndarray:
+    """pandas ewm(span, adjust=False).mean() 과 같은 계산을 모든 컬럼에 대해 한 번에 수행합니다."""
+    # pandas 와 같은 순서로 alpha 를 계산해야 결과가 비트 단위로 일치함
+    com = (span - 1) / 2.0
+    alpha = 1.0 / (1.0 + com)
+    old_wt = 1.0 - alpha
+
+    out = np.empty_like(values)
+    weighted = values[0].copy()
+    out[0] = weighted
+    for t in range(1, values.shape[0]):
+        cur = values[t]
+        is_obs = ~np.isnan(cur)
+        has_weighted = ~np.isnan(weighted)
+        update = has_weighted & is_obs & (weighted != cur)
+        blended = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+        weighted = np.where(update, blended, weighted)
+        weighted = np.where(~has_weighted & is_obs, cur, weighted)
+        out[t] = weighted
+    return out
+
+
+def compute_indicators(close: pd.DataFrame, volume: pd.DataFrame, change_pct: pd.Series,
+                       screener_volume: pd.Series = None) -> pd.DataFrame:
+    """(날짜 × 종목) 종가/거래량 행렬로 전 종목의 기술적 지표와 추천 점수를 한 번에 계산합니다.
+
+    change_pct 는 종목별 당일 등락률(%), screener_volume 은 스크리너의 당일 거래량입니다.
+    screener_volume 이 없으면 거래량 점수는 더하지 않습니다.
+    반환 컬럼: rsi, macd, signal, avg_volume, volume_ratio, score (마지막 날짜 기준)
+    """
+    symbols = close.columns
+    closes = close.to_numpy(dtype=float)
+    volumes = volume.reindex(index=close.index, columns=symbols).to_numpy(dtype=float)
+
+    valid = ~np.isnan(closes)
+    n_valid = valid.sum(axis=0)
+    closes = _compact(closes, valid)
+    volumes = np.where(_compact(valid, valid), _compact(volumes, valid), np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 1. RSI (마지막 14개 구간 평균 상승폭/하락폭)
+        delta = np.diff(closes, axis=0, prepend=np.nan)
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        avg_gain = gain[-RSI_WINDOW:].sum(axis=0) / RSI_WINDOW
+        avg_loss = loss[-RSI_WINDOW:].sum(axis=0) / RSI_WINDOW
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        rsi = np.where((n_valid >= RSI_WINDOW) & (closes.shape[0] >= RSI_WINDOW), rsi, np.nan)
+
+        # 2. MACD / Signal
+        macd_line = _ewm(closes, MACD_FAST) - _ewm(closes, MACD_SLOW)
+        signal_line = _ewm(macd_line, MACD_SIGNAL)
+        macd = macd_line[-1]
+        signal = signal_line[-1]
+
+        # 3. 거래량 (스크리너 당일 거래량 / 기간 평균 거래량)
+        avg_volume = np.nanmean(volumes, axis=0)
+        change = change_pct.reindex(symbols).to_numpy(dtype=float)
+        if screener_volume is not None:
+            today_volume = screener_volume.reindex(symbols).to_numpy(dtype=float)
+        else:
+            today_volume = np.full(len(symbols), np.nan)
+        volume_ratio = today_volume / avg_volume
+
+    # 4. 추천 점수 (기존 종목별 계산과 같은 순서로 더함)
+    score = np.zeros(len(symbols))
+    score = score + np.where(change > 0, change * 0.5, 0.0)
+    score = score + np.where(today_volume > avg_volume, 10, 0)
+    score = score + np.where((rsi >= 30) & (rsi <= 70), 15, np.where(rsi < 30, 20, 0))
+    score = score + np.where(macd > signal, 15, 0)
+
+    return pd.DataFrame({
+        'rsi': rsi,
+        'macd': macd,
+        'signal': signal,
+        'avg_volume': avg_volume,
+        'volume_ratio': volume_ratio,
+        'score': score
+    }, index=symbols)
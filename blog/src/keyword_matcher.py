@@ -0,0 +1,126 @@
+import logging
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+# 설정(keyword_taxonomies)이 없을 때 쓰는 기본 분류 (분류 순서 = 우선순위)
+DEFAULT_TAXONOMIES = {
+    # get_market_news: 영문 헤드라인 중요도
+    'news_importance': {
+        'high': ['tariff', 'trade', 'fed', 'interest rate', 'inflation', 'economy', 'market'],
+        'medium': ['earnings', 'stock', 'company', 'industry'],
+        'low': ['product', 'service', 'individual stock']
+    },
+    # _create_market_commentary_prompt: 프롬프트에 넣는 뉴스 우선순위
+    'news_priority': {
+        'high': ['실적', '계약', '특허', '인수합병', '정책', '규제', '기술개발', '금리', '인플레이션'],
+        'medium': ['시장점유율', '신제품', '투자', '협력', '파트너십', '경쟁', '전망'],
+        'low': ['일반뉴스', '인사', '기타']
+    },
+    # _generate_market_tags: 본문에 나오면 해당 태그 묶음을 추가하는 키워드
+    'market_tags': {
+        '상승': ['상승', '급등', '강세', '매수'],
+        '하락': ['하락', '급락', '약세', '매도'],
+        '변동성': ['변동성', '불확실성', '리스크'],
+        '주식': ['주식'],
+        '원자재': ['원자재'],
+        '채권': ['채권'],
+        '환율': ['환율']
+    }
+}
+
+
+class KeywordMatcher:
+    """여러 분류의 키워드를 Aho-Corasick 오토마톤 하나로 컴파일해, 문서를 한 번만 훑어 모든 일치를 찾습니다.
+    기존 `keyword in text` 와 같은 부분 문자열 일치이며, 기본적으로 대소문자를 구분하지 않습니다.
+    """
+
+    def __init__(self, taxonomy: Dict[str, Iterable[str]], case_sensitive: bool = False):
+        self.categories = list(taxonomy)
+        self.case_sensitive = case_sensitive
+        # 상태별 전이, 실패 링크, 그 상태에서 끝나는 (분류, 키워드) 목록
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[tuple] = [()]
+        self.keyword_count = 0
+        for category, keywords in taxonomy.items():
+            for keyword in keywords:
+                keyword = self._fold(str(keyword).strip())
+                if keyword:
+                    self._add(keyword, category)
+        self._build_links()
+
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _add(self, keyword: str, category: str):
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][ch] = next_state
+            state = next_state
+        if (category, keyword) not in self._out[state]:
+            self._out[state] += ((category, keyword),)
+            self.keyword_count += 1
+
+    def _build_links(self):
+        """너비 우선으로 실패 링크를 만들고, 접미사 상태의 일치 목록을 합쳐 둡니다."""
+        queue = deque(self._goto[0].values())  # 깊이 1 상태의 실패 링크는 루트
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def scan(self, text: str) -> Dict[str, List[str]]:
+        """문서에서 찾은 키워드를 분류별로 반환합니다. (키워드는 처음 나온 순서, 중복 제외)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Dict[str, List[str]] = {}
+        state = 0
+        for ch in self._fold(text or ''):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for category, keyword in out[state]:
+                keywords = found.setdefault(category, [])
+                if keyword not in keywords:
+                    keywords.append(keyword)
+        return found
+
+    def matched_categories(self, text: str) -> Set[str]:
+        return set(self.scan(text))
+
+    def classify(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """일치한 분류 중 taxonomy 순서상 가장 앞선 분류를 반환합니다. (중요도 high → low 등)"""
+        found = self.scan(text)
+        return next((category for category in self.categories if category in found), default)
+
+
+_matchers: Dict[str, tuple] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_keyword_matcher(config: dict, name: str) -> KeywordMatcher:
+    """설정(keyword_taxonomies.<name>, 없으면 기본값)의 분류로 만든 매처를 반환합니다.
+    한 번 컴파일한 매처를 재사용하고, 설정의 분류가 바뀐 경우에만 다시 컴파일합니다.
+    """
+    taxonomy = (config or {}).get('keyword_taxonomies', {}).get(name) or DEFAULT_TAXONOMIES[name]
+    with _matchers_lock:
+        cached = _matchers.get(name)
+        if cached is not None and cached[0] == taxonomy:
+            return cached[1]
+        matcher = KeywordMatcher(taxonomy)
+        logging.getLogger(__name__).info(
+            f"키워드 매처 컴파일: {name} ({len(matcher.categories)}개 분류, 키워드 {matcher.keyword_count}개)"
+        )
+        _matchers[name] = (taxonomy, matcher)
+        return matcher
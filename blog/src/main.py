@@ -4,10 +4,15 @@ import os
 import sys
 from data_collector import MarketDataCollector
 from market_analyzer import MarketAnalyzer
-from blog_poster import NaverBlogPoster
-from datetime import datetime
+from blog_poster import NaverBlogPoster, create_driver
+from browser_profile import create_browser_profile
+from publisher import create_publisher
+from publish_outbox import PublishOutbox, PublishWorker
+from browser_pool import BrowserDaemon
+from datetime import datetime, timedelta
 from pathlib import Path
 from utils import load_environment, setup_logging
+from http_client import get_http_client
 import schedule
 import time
 from typing import Dict, Any
@@ -16,6 +21,7 @@ import re
 
 # --- Global Variable ---
 logger = None # Logger will be initialized in setup_logging
+browser_daemon = None # 스케줄러 실행 중 유지하는 브라우저 (설정 시 생성)
 
 def load_config() -> Dict[str, Any]:
     """설정 파일을 로드합니다."""
@@ -40,6 +46,45 @@ def get_kst_time():
     """현재 한국 시간을 반환합니다."""
     return datetime.now(KST)
 
+def create_publish_worker(config: Dict[str, Any]) -> PublishWorker:
+    """설정(blog_settings.outbox)으로 발행 대기열과 발행 작업자를 생성합니다."""
+    settings = config.get('blog_settings', {}).get('outbox', {})
+    outbox = PublishOutbox(Path(__file__).parent.parent / settings.get('path', 'cache/outbox.sqlite'))
+    return PublishWorker(
+        outbox,
+        lambda: create_publisher(config, daemon=browser_daemon),
+        max_attempts=settings.get('max_attempts', 5),
+        backoff_base=settings.get('backoff_base_minutes', 5) * 60,
+        backoff_max=settings.get('backoff_max_minutes', 60) * 60,
+        max_age_hours=settings.get('max_age_hours', 12)
+    )
+
+def publish_pending(worker: PublishWorker) -> dict:
+    """발행 대기열에서 재시도 시각이 된 글을 발행하고 결과를 출력합니다."""
+    result = worker.run_once()
+    counts = worker.outbox.counts()
+    print(f"- 발행 결과: {result} / 대기열 상태: {counts}")
+    if logger:
+        logger.info(f"발행 결과: {result}, 대기열 상태: {counts}")
+    return result
+
+def retry_pending_posts():
+    """예약 실행 사이에 발행 실패한 글을 재시도합니다. (데이터 수집/분석은 다시 하지 않음)"""
+    worker = None
+    try:
+        worker = create_publish_worker(load_config())
+        if not worker.outbox.due():
+            return
+        print(f"\n=== 발행 대기열 재시도: {get_kst_time().strftime('%Y-%m-%d %H:%M:%S %Z%z')} ===")
+        publish_pending(worker)
+    except Exception as e:
+        print(f"✗ 발행 대기열 재시도 중 오류: {e}")
+        if logger:
+            logger.error(f"발행 대기열 재시도 중 오류: {e}", exc_info=True)
+    finally:
+        if worker:
+            worker.outbox.close()
+
 def main():
     """메인 프로그램을 실행합니다."""
     global logger # Ensure we modify the global logger variable
@@ -57,7 +102,7 @@ def main():
     start_time_kst = today_kst 
     print(f"\n=== 작업 시작: {start_time_kst.strftime('%Y-%m-%d %H:%M:%S %Z%z')} ===")
 
-    poster = None # Initialize poster to None for error handling
+    worker = None # Initialize worker to None for error handling
     try:
         # 환경 변수 및 설정 로드
         print("환경 변수 및 설정 로드 중...")
@@ -69,68 +114,69 @@ def main():
         logger.info(f"작업 시작: {start_time_kst.strftime('%Y-%m-%d %H:%M:%S')}")
         print("✓ 환경 설정 로드 및 로깅 설정 완료\n")
         
-        # 1. 시장 데이터 수집
-        print("1. 시장 데이터 수집 시작...")
-        collector = MarketDataCollector(config)
-        market_data = collector.get_market_data()
-        news = collector.get_market_news()
-        
-        print("\n수집된 데이터 요약:")
-        for category, df in market_data.items():
-            print(f"- {category}: {len(df)}개 항목")
-        print(f"- 뉴스: {len(news)}개 기사\n")
+        # 오늘 생성한 글이 이미 대기열에 있으면(이전 실행에서 발행 실패 등) 수집/분석을 다시 하지 않음
+        worker = create_publish_worker(config)
+        run_date = start_time_kst.strftime('%Y-%m-%d')
+        existing_job = worker.outbox.find(run_date)
+        if existing_job:
+            print(f"오늘({run_date}) 생성된 글이 이미 있습니다 (작업 #{existing_job['id']}, {existing_job['status']}). 수집/분석을 건너뜁니다.\n")
+            logger.info(f"기존 작업 #{existing_job['id']} ({existing_job['status']}) 사용, 수집/분석 생략")
+        else:
+            # 1. 시장 데이터 수집
+            print("1. 시장 데이터 수집 시작...")
+            collector = MarketDataCollector(config)
+            market_data = collector.get_market_data()
         
-        print("- 종목 추천 생성 중...")
-        recommendations = collector.get_stock_recommendations(market_data=market_data, num_recommendations=5)
+            print("- 종목 추천 생성 중...")
+            recommendations = collector.get_stock_recommendations(market_data=market_data, num_recommendations=5)
         
-        # 2. 시장 데이터 분석 및 콘텐츠 생성
-        print("2. 시장 데이터 분석 및 콘텐츠 생성 시작...")
-        analyzer = MarketAnalyzer(config)
-        title, content, tags, analysis = analyzer.analyze_market_trend(market_data, news, recommendations)
+            # 추천 종목별 뉴스 검색을 함께 수집하므로 추천 생성 후에 수집
+            news = collector.get_market_news(symbols=[stock['symbol'] for stock in recommendations])
         
-        if not title or not content:
-            logger.error("시장 분석 또는 콘텐츠 생성 실패: 제목 또는 내용 없음")
-            print("✗ 시장 분석 또는 콘텐츠 생성 실패. 이번 실행을 중단합니다.")
-            return # Exit current main execution
-
-        tags = tags if tags is not None else ["주식", "투자"]
-        analysis = analysis if analysis is not None else {}
-
-        print("\n=== 분석 완료 ===\n")
-        print(f"제목: {title}\n")
-        print(f"\n포스팅 정보:")
-        print(f"- 제목: {title}")
-        print(f"- 태그: {', '.join(tags[:5])}... (총 {len(tags)}개)")
-        print(f"- 콘텐츠 길이: {len(content)}자\n")
+            print("\n수집된 데이터 요약:")
+            for category, df in market_data.items():
+                print(f"- {category}: {len(df)}개 항목")
+            print(f"- 뉴스: {len(news)}개 기사\n")
         
-        # 4. 블로그 포스팅
-        print("4. 블로그 포스팅 시작...")
-        poster = NaverBlogPoster(config) # Assign poster here
+            for cache_name, stats in collector.get_cache_stats().items():
+                print(f"- 캐시({cache_name}): {stats}")
+                logger.info(f"캐시 통계 ({cache_name}): {stats}")
         
-        print("- 웹드라이버 설정 중...")
-        if not poster.setup_driver():
-            logger.error("웹드라이버 설정 실패")
-            print("✗ 웹드라이버 설정 실패. 이번 실행을 중단합니다.")
-            # No need to close poster here as setup failed
-            return
+            # 2. 시장 데이터 분석 및 콘텐츠 생성
+            print("2. 시장 데이터 분석 및 콘텐츠 생성 시작...")
+            analyzer = MarketAnalyzer(config)
+            title, content, tags, analysis = analyzer.analyze_market_trend(market_data, news, recommendations)
         
-        print("- 네이버 로그인 시도 중...")
-        if not poster.manual_login():
-            logger.error("네이버 로그인 실패")
-            print("✗ 네이버 로그인 실패. 이번 실행을 중단합니다.")
-            poster.close() # Close driver if login fails
-            return
+            if not title or not content:
+                logger.error("시장 분석 또는 콘텐츠 생성 실패: 제목 또는 내용 없음")
+                print("✗ 시장 분석 또는 콘텐츠 생성 실패. 이번 실행을 중단합니다.")
+                return # Exit current main execution
+
+            tags = tags if tags is not None else ["주식", "투자"]
+            analysis = analysis if analysis is not None else {}
+
+            print("\n=== 분석 완료 ===\n")
+            print(f"제목: {title}\n")
+            print(f"\n포스팅 정보:")
+            print(f"- 제목: {title}")
+            print(f"- 태그: {', '.join(tags[:5])}... (총 {len(tags)}개)")
+            print(f"- 콘텐츠 길이: {len(content)}자\n")
+            
+            # 3. 발행 대기열에 저장 (발행이 실패해도 이 글로 재시도)
+            job_id = worker.outbox.enqueue(run_date, title, content, tags, analysis)
+            print(f"3. 발행 대기열에 저장 완료 (작업 #{job_id})\n")
+            logger.info(f"발행 대기열 저장: 작업 #{job_id} '{title}'")
         
-        print("- 블로그 글 작성 및 발행 중...")
-        success = poster.create_post(title, content, tags)
+        # 4. 블로그 포스팅
+        print("4. 블로그 포스팅 시작...")
+        result = publish_pending(worker)
         
-        if success:
-            logger.info(f"포스팅 성공: '{title}'")
+        if result['published']:
             print("\n✓ 블로그 포스팅 완료!")
-        else:
-            logger.error(f"포스팅 실패: '{title}'")
+        elif result['unconfirmed']:
+            print("\n✗ 블로그 포스팅 결과 확인 필요 (이미 발행됐을 수 있어 자동 재시도하지 않음).")
+        elif result['retry'] or result['failed']:
             print("\n✗ 블로그 포스팅 실패.")
-            # Optional: Raise an exception or handle failure differently
 
     except Exception as e:
         print(f"\n✗ 작업 중 오류 발생: {str(e)}")
@@ -139,15 +185,14 @@ def main():
         # No need to print "프로그램 종료" here, just log the error
         
     finally:
-        # 항상 웹 드라이버 종료 시도 (poster 객체가 생성된 경우)
-        if poster and hasattr(poster, 'close'):
-            try:
-                print("- 웹드라이버 종료 시도...")
-                poster.close()
-            except Exception as close_e:
-                 print(f"✗ 웹드라이버 종료 중 오류: {close_e}")
-                 if logger:
-                     logger.error(f"웹드라이버 종료 중 오류: {close_e}")
+        if worker:
+            worker.outbox.close()
+        
+        # 호스트별 HTTP 응답 지연 시간 요약
+        for host, stats in get_http_client().latency_report(reset=True).items():
+            print(f"- HTTP({host}): {stats}")
+            if logger:
+                logger.info(f"HTTP 지연 시간 ({host}): {stats}")
         
         end_time_kst = get_kst_time()
         duration = end_time_kst - start_time_kst
@@ -156,6 +201,28 @@ def main():
              logger.info(f"작업 종료. 소요 시간: {duration}")
 
 
+def warm_up_browser():
+    """예약 실행 전에 데몬 브라우저를 띄우고 로그인해 둡니다. (주말에는 생략)"""
+    if not browser_daemon or get_kst_time().weekday() >= 5:
+        return
+    print("\n=== 브라우저 데몬 준비 (사전 로그인) ===")
+    try:
+        poster = NaverBlogPoster(load_config(), daemon=browser_daemon)
+    except Exception as e:
+        print(f"✗ 브라우저 데몬 준비 실패: {e}")
+        return
+    try:
+        if poster.setup_driver():
+            poster.ensure_login()
+    except Exception as e:
+        print(f"✗ 브라우저 데몬 준비 중 오류: {e}")
+        if logger:
+            logger.error(f"브라우저 데몬 준비 중 오류: {e}", exc_info=True)
+        poster.healthy = False
+    finally:
+        poster.close()
+
+
 # 스케줄링 설정 및 실행
 if __name__ == "__main__":
     print("프로그램 시작: 스케줄러 설정")
@@ -171,12 +238,36 @@ if __name__ == "__main__":
         initial_config = load_config()
         logger = setup_logging(initial_config)
         logger.info("스케줄러 시작 및 초기 로거 설정 완료")
+        
+        # 발행 실패한 글 재시도 (대기열에 재시도 시각이 된 글이 있을 때만 발행)
+        retry_minutes = initial_config.get('blog_settings', {}).get('outbox', {}).get('check_minutes', 10)
+        schedule.every(retry_minutes).minutes.do(retry_pending_posts)
+        print(f"발행 대기열 확인: {retry_minutes}분마다 실패한 글 재시도")
+        
+        # 브라우저 데몬 설정 (선택): 예약 시각 전에 브라우저를 띄우고 로그인해 둠
+        daemon_settings = initial_config.get('blog_settings', {}).get('browser_daemon', {})
+        if daemon_settings.get('enabled', False):
+            browser_profile = create_browser_profile(initial_config)
+            browser_daemon = BrowserDaemon(
+                lambda: create_driver(profile=browser_profile),
+                max_posts=daemon_settings.get('max_posts', 20),
+                max_heap_growth_mb=daemon_settings.get('max_heap_growth_mb', 300)
+            )
+            warm_up_time = (datetime.strptime(schedule_time, "%H:%M")
+                            - timedelta(minutes=daemon_settings.get('warm_up_minutes', 10))).strftime("%H:%M")
+            schedule.every().day.at(warm_up_time).do(warm_up_browser)
+            print(f"브라우저 데몬 사용: 매일 {warm_up_time}에 브라우저 준비 및 로그인")
     except Exception as init_e:
         print(f"경고: 초기 로거 설정 실패 (스케줄된 작업 시 재시도): {init_e}")
 
     print("\n스케줄러 실행 중... (Ctrl+C 로 종료)")
-    while True:
-        schedule.run_pending()
-        time.sleep(60) # 1분마다 다음 실행 시간 확인
+    try:
+        while True:
+            schedule.run_pending()
+            time.sleep(60) # 1분마다 다음 실행 시간 확인
+    finally:
+        if browser_daemon:
+            print(f"브라우저 데몬 종료: {browser_daemon.summary()}")
+            browser_daemon.shutdown()
 
     # main() # 스케줄링 사용 시 주석 처리 또는 제거
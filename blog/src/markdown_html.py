@@ -0,0 +1,94 @@
+import html
+import re
+from typing import List, Tuple
+
+HEADING = re.compile(r'^(#{1,3})\s+(.*)$')
+BULLET_ITEM = re.compile(r'^[-*]\s+(.*)$')
+ORDERED_ITEM = re.compile(r'^(\d+)\.\s+(.*)$')
+BOLD = re.compile(r'\*\*(.+?)\*\*')
+
+
+def _inline(text: str) -> str:
+    """HTML 이스케이프 후 **굵게** 를 <strong> 으로 변환합니다."""
+    return BOLD.sub(r'<strong>\1</strong>', html.escape(text.strip(), quote=False))
+
+
+def _plain_inline(text: str) -> str:
+    return BOLD.sub(r'\1', text.strip())
+
+
+def parse_blocks(markdown: str) -> List[Tuple[str, object]]:
+    """분석 콘텐츠에서 쓰는 Markdown 을 블록 목록으로 나눕니다.
+    블록: ('heading', (level, text)), ('ul', [items]), ('ol', (start, [items])), ('p', text), ('blank', None)
+    목록 항목 사이의 빈 줄은 같은 목록으로 이어 붙이고, 그 외 빈 줄은 빈 문단으로 유지합니다.
+    """
+    blocks = []
+    pending_blanks = 0
+    for line in markdown.strip().splitlines():
+        stripped = line.strip()
+        if not stripped:
+            pending_blanks += 1
+            continue
+
+        heading = HEADING.match(stripped)
+        bullet = BULLET_ITEM.match(stripped)
+        ordered = ORDERED_ITEM.match(stripped)
+        last = blocks[-1] if blocks else None
+
+        if bullet and last and last[0] == 'ul':
+            last[1].append(bullet.group(1))
+            pending_blanks = 0
+            continue
+        if ordered and last and last[0] == 'ol':
+            last[1][1].append(ordered.group(2))
+            pending_blanks = 0
+            continue
+
+        blocks.extend([('blank', None)] * pending_blanks)
+        pending_blanks = 0
+        if heading:
+            blocks.append(('heading', (len(heading.group(1)), heading.group(2))))
+        elif bullet:
+            blocks.append(('ul', [bullet.group(1)]))
+        elif ordered:
+            blocks.append(('ol', (int(ordered.group(1)), [ordered.group(2)])))
+        else:
+            blocks.append(('p', stripped))
+    return blocks
+
+
+def markdown_to_html(markdown: str) -> str:
+    """Markdown 을 에디터에 붙여넣을 HTML(제목, 문단, 굵게, 목록)로 변환합니다."""
+    parts = []
+    for kind, payload in parse_blocks(markdown):
+        if kind == 'heading':
+            level, text = payload
+            parts.append(f"<h{level}>{_inline(text)}</h{level}>")
+        elif kind == 'ul':
+            parts.append('<ul>' + ''.join(f"<li>{_inline(item)}</li>" for item in payload) + '</ul>')
+        elif kind == 'ol':
+            start, items = payload
+            start_attr = f' start="{start}"' if start != 1 else ''
+            parts.append(f'<ol{start_attr}>' + ''.join(f"<li>{_inline(item)}</li>" for item in items) + '</ol>')
+        elif kind == 'p':
+            parts.append(f"<p>{_inline(payload)}</p>")
+        else:
+            parts.append('<p><br></p>')
+    return ''.join(parts)
+
+
+def markdown_to_text(markdown: str) -> str:
+    """HTML 과 같은 구조의 일반 텍스트 (붙여넣기 text/plain 및 본문 길이 검증용, 목록 번호 제외)"""
+    lines = []
+    for kind, payload in parse_blocks(markdown):
+        if kind == 'heading':
+            lines.append(_plain_inline(payload[1]))
+        elif kind == 'ul':
+            lines.extend(_plain_inline(item) for item in payload)
+        elif kind == 'ol':
+            lines.extend(_plain_inline(item) for item in payload[1])
+        elif kind == 'p':
+            lines.append(_plain_inline(payload))
+        else:
+            lines.append('')
+    return '\n'.join(lines)
@@ -4,18 +4,33 @@ from typing import Dict, List, Any, Tuple
 import os
 import requests
 import json
-from utils import parse_price_string
+from utils import parse_price_string, format_price, format_volume
+from http_client import get_http_client
+from keyword_matcher import get_keyword_matcher
 import time
 from datetime import datetime
 from data_collector import MarketDataCollector
 import re
 import random
 
+# keyword_taxonomies.market_tags 분류별로 추가하는 태그 묶음 (시장 상황별, 자산군별)
+MARKET_TAG_GROUPS = {
+    "상승": ["주식상승", "매수전략", "상승장", "강세장", "매수기회"],
+    "하락": ["주식하락", "매도전략", "하락장", "약세장", "리스크관리"],
+    "변동성": ["변동성장세", "리스크관리", "투자전략", "자산관리", "포트폴리오"],
+    "주식": ["개별주식", "성장주", "가치주", "배당주", "기술주"],
+    "원자재": ["원자재", "금", "은", "원유", "commodities"],
+    "채권": ["채권", "국채", "회사채", "금리", "채권투자"],
+    "환율": ["환율", "달러", "외환시장", "달러인덱스", "외환"]
+}
+
+
 class MarketAnalyzer:
     def __init__(self, config: dict):
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.api_key = os.getenv('DEEPSEEK_API_KEY')
+        self.http = get_http_client(config)
         
         if not self.api_key:
             raise ValueError("DeepSeek API key not found in environment variables")
@@ -46,12 +61,12 @@ class MarketAnalyzer:
             # 첫 번째 행 선택
             row = df_sorted.iloc[0]
             
-            # 결과 딕셔너리 생성
+            # 결과 딕셔너리 생성 (Price/% Change/Volume 은 수집 단계에서 숫자로 정규화됨)
             result = {
                 'Name': str(row['Name']).strip(),
                 'Symbol': str(row['Symbol']).strip(),
-                'Price': str(row['Price']).strip(),
-                'Change %': float(str(row[change_col]).strip('%').replace(',', ''))
+                'Price': row['Price'],
+                'Change %': float(row[change_col])
             }
             
             # Change가 있다면 추가
@@ -60,7 +75,7 @@ class MarketAnalyzer:
             
             # Volume이 있다면 추가
             if 'Volume' in row:
-                result['Volume'] = str(row['Volume'])
+                result['Volume'] = row['Volume']
             
             return result
             
@@ -140,7 +155,7 @@ class MarketAnalyzer:
                     row = df.iloc[0]
                     
                     price = row['Price']
-                    change_pct = float(str(row['% Change']).strip('%'))
+                    change_pct = float(row['% Change'])
                     
                     significant_moves[f'biggest_{category[:-1]}'] = {
                         'Name': row['Name'].strip(),
@@ -211,20 +226,11 @@ class MarketAnalyzer:
             template += """
 1. 주요 시장 뉴스 (시장 및 종목 영향 분석)
 """
-            # 뉴스 우선순위에 따라 정렬
-            priority_keywords = {
-                'high': ['실적', '계약', '특허', '인수합병', '정책', '규제', '기술개발', '금리', '인플레이션'],
-                'medium': ['시장점유율', '신제품', '투자', '협력', '파트너십', '경쟁', '전망'],
-                'low': ['일반뉴스', '인사', '기타']
-            }
+            # 뉴스 우선순위 표시 (keyword_taxonomies.news_priority)
+            priority_matcher = get_keyword_matcher(self.config, 'news_priority')
             
             for item in data['news']:
-                title = item['title'].lower()
-                priority = 'low'
-                for level, keywords in priority_keywords.items():
-                    if any(keyword in title for keyword in keywords):
-                        priority = level
-                        break
+                priority = priority_matcher.classify(item['title'], default='low')
                 
                 template += f"- [{priority.upper()}] {item['title']}\n"
 
@@ -233,9 +239,9 @@ class MarketAnalyzer:
             template += f"""
 2. 상승 주도주 심층 분석
 - 종목: {data['biggest_gainer']['Name']} ({data['biggest_gainer']['Symbol']})
-- 현재가: {data['biggest_gainer']['Price']}
+- 현재가: {format_price(data['biggest_gainer']['Price'])}
 - 상승률: {data['biggest_gainer']['Change %']}%
-- 거래량: {data['biggest_gainer'].get('Volume', 'N/A')}
+- 거래량: {format_volume(data['biggest_gainer'].get('Volume', 'N/A'))}
 - 분석 포인트: 이 종목의 상승 배경과 해당 업종 내에서의 포지셔닝, 향후 전망
 """
 
@@ -243,9 +249,9 @@ class MarketAnalyzer:
             template += f"""
 3. 하락 주도주 심층 분석
 - 종목: {data['biggest_loser']['Name']} ({data['biggest_loser']['Symbol']})
-- 현재가: {data['biggest_loser']['Price']}
+- 현재가: {format_price(data['biggest_loser']['Price'])}
 - 하락률: {data['biggest_loser']['Change %']}%
-- 거래량: {data['biggest_loser'].get('Volume', 'N/A')}
+- 거래량: {format_volume(data['biggest_loser'].get('Volume', 'N/A'))}
 - 분석 포인트: 하락의 구조적 원인과 단기적 요인 구분, 반등 가능성 평가
 """
 
@@ -253,9 +259,9 @@ class MarketAnalyzer:
             template += f"""
 4. 거래대금 상위 종목 심층 분석
 - 종목: {data['biggest_active']['Name']} ({data['biggest_active']['Symbol']})
-- 현재가: {data['biggest_active']['Price']}
+- 현재가: {format_price(data['biggest_active']['Price'])}
 - 등락률: {data['biggest_active']['Change %']}%
-- 거래량: {data['biggest_active'].get('Volume', 'N/A')}
+- 거래량: {format_volume(data['biggest_active'].get('Volume', 'N/A'))}
 - 분석 포인트: 이례적 거래량 발생 원인과 가격 흐름과의 연관성 분석
 """
 
@@ -272,7 +278,7 @@ class MarketAnalyzer:
             for idx, rec in enumerate(data['recommendations'], 1):
                 template += f"""
 {idx}. {rec['name']} ({rec['symbol']})
-- 현재가: {rec['price']}
+- 현재가: {format_price(rec['price'])}
 - 등락률: {rec['change_pct']}%
 - 기술적 분석:
   * RSI: {rec['rsi']:.2f} (과매수: >70, 과매도: <30)
@@ -282,7 +288,7 @@ class MarketAnalyzer:
   * 섹터: {rec.get('sector', 'N/A')}
   * 산업: {rec.get('industry', 'N/A')}
 - 데이터 포인트:
-  * 거래량: {rec.get('volume', 'N/A')}
+  * 거래량: {format_volume(rec.get('volume', 'N/A'))}
   * 추천점수: {rec['score']}점
 """
 
@@ -351,93 +357,59 @@ class MarketAnalyzer:
         """DeepSeek API를 호출하여 분석 결과를 얻습니다.
         (수정: 2단계 가다듬기 프롬프트에 줄바꿈 유지 지침 추가)
         (수정: 진단을 위해 가다듬기 단계 임시 비활성화)
+        재시도(429/5xx/연결 오류, 백오프 + Retry-After)는 공용 HTTP 클라이언트가 처리합니다.
         """
-        for attempt in range(max_retries):
-            try:
-                headers = {
-                    'Authorization': f'Bearer {self.api_key}',
-                    'Content-Type': 'application/json'
+        headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
+        
+        # 첫 번째 API 호출 (분석 중심)
+        analysis_payload = {
+            "model": "deepseek-chat",
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
                 }
+            ],
+            "temperature": 0.6, 
+            "max_tokens": 1500 # 분석 단계 토큰은 유지
+        }
+        
+        try:
+            print(f"1단계: 데이터 분석 생성 중... (최대 {max_retries}회 시도) (가다듬기 비활성화됨)")
+            response = self.http.post(
+                'https://api.deepseek.com/v1/chat/completions',
+                headers=headers,
+                json=analysis_payload,
+                timeout=timeout,
+                max_retries=max_retries - 1
+            )
+            
+            if response.status_code == 200:
+                analysis_result = response.json()['choices'][0]['message']['content']
+                analysis_result = analysis_result.replace('*', '') # 별표 제거는 유지
                 
-                # 첫 번째 API 호출 (분석 중심)
-                analysis_payload = {
-                    "model": "deepseek-chat",
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "temperature": 0.6, 
-                    "max_tokens": 1500 # 분석 단계 토큰은 유지
-                }
+                # 제목 생성의 경우 바로 반환 (기존 로직 유지)
+                if "제목을 작성해주세요" in prompt:
+                    return analysis_result.strip()
                 
-                print(f"1단계: 데이터 분석 생성 중... (시도 {attempt+1}/{max_retries}) (가다듬기 비활성화됨)")
-                response = requests.post(
-                    'https://api.deepseek.com/v1/chat/completions',
-                    headers=headers,
-                    json=analysis_payload,
-                    timeout=timeout
-                )
+                # === 진단을 위해 2단계 API 호출 (가다듬기) 임시 비활성화 ===
+                print("⚠ 2단계 가다듬기 비활성화됨. 1단계 원본 분석 결과 반환.")
+                return analysis_result.strip() # 1단계 결과 바로 반환
+                # ======================================================
+            
+            self.logger.error(f"API 오류: {response.status_code} - {response.text}")
+            return "시장 분석 생성에 실패했습니다. 잠시 후 다시 시도해 주세요."
                 
-                if response.status_code == 200:
-                    analysis_result = response.json()['choices'][0]['message']['content']
-                    analysis_result = analysis_result.replace('*', '') # 별표 제거는 유지
-                    
-                    # 제목 생성의 경우 바로 반환 (기존 로직 유지)
-                    if "제목을 작성해주세요" in prompt:
-                        return analysis_result.strip()
-                    
-                    # === 진단을 위해 2단계 API 호출 (가다듬기) 임시 비활성화 ===
-                    print("⚠ 2단계 가다듬기 비활성화됨. 1단계 원본 분석 결과 반환.")
-                    return analysis_result.strip() # 1단계 결과 바로 반환
-                    # ======================================================
-
-                    # --- 기존 2단계 API 호출 (가다듬기) 코드 (현재는 실행되지 않음) ---
-                    # refinement_prompt = f"""... (기존 가다듬기 프롬프트) ..."""
-                    # refinement_payload = { ... }
-                    # print("2단계: 소비자용 콘텐츠로 가다듬는 중 (줄바꿈 유지 강조)...")
-                    # refinement_response = requests.post(...)                   
-                    # if refinement_response.status_code == 200:
-                    #     refined_result = ...
-                    #     print("✓ 양질의 블로그 콘텐츠 생성 완료")
-                    #     return refined_result.strip()
-                    # else:
-                    #     self.logger.error(f"다듬기 API 오류: ...")
-                    #     print("⚠ 가다듬기 실패, 원본 분석 결과 사용")
-                    #     return analysis_result # 가다듬기 실패 시 1단계 결과 반환
-                    # --- 코드 끝 ---
-                else:
-                    # ... (기존 오류 처리 로직) ...
-                    self.logger.error(f"API 오류 (시도 {attempt+1}): {response.status_code} - {response.text}")
-                    if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt
-                        print(f"재시도 대기 중... ({wait_time}초)")
-                        time.sleep(wait_time)
-                        continue
-                    return "시장 분석 생성에 실패했습니다. 잠시 후 다시 시도해 주세요."
-                    
-            except requests.exceptions.Timeout:
-                # ... (기존 타임아웃 처리 로직) ...
-                self.logger.error(f"API 타임아웃 (시도 {attempt+1})")
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    print(f"타임아웃 발생, 재시도 중... ({wait_time}초)")
-                    time.sleep(wait_time)
-                else:
-                    return "시장 분석 생성에 실패했습니다. 서버 응답이 지연되고 있습니다."
-                    
-            except Exception as e:
-                # ... (기존 예외 처리 로직) ...
-                self.logger.error(f"API 호출 오류 (시도 {attempt+1}): {e}", exc_info=True)
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    print(f"오류 발생, 재시도 중... ({wait_time}초)")
-                    time.sleep(wait_time)
-                else:
-                    return "시장 분석 생성에 실패했습니다. 시스템 오류가 발생했습니다."
-        
-        return "시장 분석 생성에 실패했습니다. 여러 번 시도했으나 응답을 받지 못했습니다."
+        except requests.exceptions.Timeout:
+            self.logger.error(f"API 타임아웃 ({max_retries}회 시도)")
+            return "시장 분석 생성에 실패했습니다. 서버 응답이 지연되고 있습니다."
+                
+        except Exception as e:
+            self.logger.error(f"API 호출 오류: {e}", exc_info=True)
+            return "시장 분석 생성에 실패했습니다. 시스템 오류가 발생했습니다."
 
     def _create_fallback_content(self, data: Dict = None) -> Dict:
         """분석 실패 시 대체 내용을 생성합니다."""
@@ -473,12 +445,12 @@ class MarketAnalyzer:
                 for idx, rec in enumerate(data['recommendations'], 1):
                     fallback_commentary += f"""
 {idx}. {rec['name']} ({rec['symbol']})
-- 현재가: {rec['price']}
+- 현재가: {format_price(rec['price'])}
 - 등락률: {rec['change_pct']}%
 - 추천 점수: {rec['score']}
 - RSI: {rec['rsi']:.2f}
 - MACD: {rec['macd']:.2f}
-- 거래량: {rec.get('volume', 'N/A')}
+- 거래량: {format_volume(rec.get('volume', 'N/A'))}
 - 시가총액: {rec.get('market_cap', 'N/A')}
 - 섹터: {rec.get('sector', 'N/A')}
 - 산업: {rec.get('industry', 'N/A')}
@@ -609,10 +581,10 @@ class MarketAnalyzer:
 오늘 시장에서는 {gainer['Name']}와 {loser['Name']} 간의 뚜렷한 대비가 나타났습니다.
 
 ### 상승 주도주 분석
-{gainer['Name']}({gainer['Symbol']})는 오늘 {gainer['Change %']:.2f}%의 상승세를 보였습니다. 현재 {gainer['Price']}에 거래되고 있으며, 이러한 강한 상승 흐름은 최근 시장의 관심이 집중되고 있음을 시사합니다.
+{gainer['Name']}({gainer['Symbol']})는 오늘 {gainer['Change %']:.2f}%의 상승세를 보였습니다. 현재 {format_price(gainer['Price'])}에 거래되고 있으며, 이러한 강한 상승 흐름은 최근 시장의 관심이 집중되고 있음을 시사합니다.
 
 ### 주의 필요 종목
-반면 {loser['Name']}({loser['Symbol']})은 {loser['Change %']:.2f}%의 하락을 보이며 현재 {loser['Price']}에 거래되고 있습니다. 이는 단기적인 조정인지 아니면 더 장기적인 약세 신호인지 면밀한 모니터링이 필요합니다."""
+반면 {loser['Name']}({loser['Symbol']})은 {loser['Change %']:.2f}%의 하락을 보이며 현재 {format_price(loser['Price'])}에 거래되고 있습니다. 이는 단기적인 조정인지 아니면 더 장기적인 약세 신호인지 면밀한 모니터링이 필요합니다."""
         else:
             self.logger.warning("주요 시장 동향 섹션 생성 실패: 데이터 누락")
             return "## 주요 시장 동향\n\n주요 시장 동향 데이터를 분석하는 중 오류가 발생했거나 데이터가 부족합니다."
@@ -648,12 +620,13 @@ class MarketAnalyzer:
         rsi = round(float(stock.get('rsi', 0)), 2)
         macd = round(float(stock.get('macd', 0)), 2)
         change_pct = round(float(stock.get('change_pct', 0)), 2)
-        price = stock.get('price', 'N/A')
+        price = format_price(stock.get('price', 'N/A'))
         symbol = stock.get('symbol', 'N/A')
         name = stock.get('name', 'N/A')
         sector = stock.get('sector', 'N/A')
         industry = stock.get('industry', 'N/A')
         volume = stock.get('volume', 'N/A')
+        volume_display = format_volume(volume)
         market_cap = stock.get('market_cap', 'N/A')
 
         # 분석 내용 생성
@@ -673,7 +646,7 @@ class MarketAnalyzer:
             f"\n**기술적 분석 포인트:**\n"
             f"- RSI: {rsi:.2f}는 {rsi_interpretation}\n"
             f"- MACD: {macd:.2f}는 {macd_interpretation}\n"
-            f"- 거래량: {volume}는 {volume_interpretation}\n"
+            f"- 거래량: {volume_display}는 {volume_interpretation}\n"
             f"- 시가총액: {'$' + str(market_cap) if market_cap != 'N/A' else market_cap} ({market_cap_interpretation})"
         )
         industry_env = f"\n**산업 환경:**\n\n{industry_analysis}\n\n특히 {industry} 산업은 현재 {industry_sector_analysis}\n\n{name}의 경우, {company_positioning}"
@@ -734,12 +707,14 @@ class MarketAnalyzer:
         if macd > 0: return f"양의 값을 보이며 상승 추세가 우세함을 나타냅니다. 이는 단기 이동평균선이 장기 이동평균선을 상회하고 있음을 의미하며, 추세의 방향성이 상승임을 확인해주는 지표입니다. 특히 {change_pct}%의 최근 가격 변동과 함께 고려하면, {'추세의 초기 단계로 추가 상승 여력이 있다고 볼 수 있습니다.' if change_pct < 10 else '강한 상승 추세가 확립되어 있으나 단기적 과열 여부를 체크할 필요가 있습니다.' if change_pct > 30 else '상승 추세가 지속되고 있으며 모멘텀이 유지되고 있습니다.'}"
         return f"음의 값을 보이고 있으나 {abs(macd):.2f}의 값은 {'약한 하락 압력을 의미하며, 반등 가능성을 모색할 단계입니다.' if abs(macd) < 0.5 else '뚜렷한 하락 추세를 나타내며, 추세 전환 신호를 확인한 후 접근하는 것이 바람직합니다.' if abs(macd) > 1 else '중간 강도의 하락 추세를 보이고 있으나, RSI 등 다른 지표와 함께 고려할 때 기술적 반등 가능성도 있습니다.'}"
 
-    def _interpret_volume(self, volume_str: str) -> str:
+    def _interpret_volume(self, volume) -> str:
         try:
-            if 'M' in str(volume_str) or 'B' in str(volume_str):
+            # 100만 주 이상 (기존 'M'/'B' 접미사 기준과 동일)
+            if float(volume) >= 1_000_000:
                 return '높은 거래량으로 시장의 강한 관심이 집중되고 있음을 의미합니다.'
             return '적정 수준의 거래량으로 안정적인 가격 형성을 시사합니다.'
-        except: return '거래량 정보 확인 불가'
+        except (TypeError, ValueError):
+            return '적정 수준의 거래량으로 안정적인 가격 형성을 시사합니다.'
 
     def _interpret_market_cap(self, market_cap_str: str) -> str:
         try:
@@ -792,38 +767,16 @@ class MarketAnalyzer:
             "시장분석", "투자정보", "주식정보", "시장동향", "금융시장"
         ]
         
-        # 시장 상황별 태그
-        market_condition_tags = {
-            "상승": ["주식상승", "매수전략", "상승장", "강세장", "매수기회"],
-            "하락": ["주식하락", "매도전략", "하락장", "약세장", "리스크관리"],
-            "변동성": ["변동성장세", "리스크관리", "투자전략", "자산관리", "포트폴리오"]
-        }
-        
-        # 자산군 태그
-        asset_tags = {
-            "주식": ["개별주식", "성장주", "가치주", "배당주", "기술주"],
-            "원자재": ["원자재", "금", "은", "원유", "commodities"],
-            "채권": ["채권", "국채", "회사채", "금리", "채권투자"],
-            "환율": ["환율", "달러", "외환시장", "달러인덱스", "외환"]
-        }
+        # 분류별 태그 묶음 (설정 market_tag_groups 가 기본값을 덮어씀)
+        tag_groups = {**MARKET_TAG_GROUPS, **self.config.get('market_tag_groups', {})}
         
-        # 글의 내용에서 키워드 분석 (content만 사용)
-        content_lower = content.lower()
+        # 글의 내용에서 키워드 분석 (content만 사용, 한 번 훑어서 시장 상황/자산군 분류를 모두 찾음)
         selected_tags = set(base_tags)  # 중복 방지를 위해 set 사용
-        
-        # 시장 상황 태그 추가
-        if any(word in content_lower for word in ["상승", "급등", "강세", "매수"]):
-            selected_tags.update(market_condition_tags["상승"])
-        if any(word in content_lower for word in ["하락", "급락", "약세", "매도"]):
-            selected_tags.update(market_condition_tags["하락"])
-        if any(word in content_lower for word in ["변동성", "불확실성", "리스크"]):
-            selected_tags.update(market_condition_tags["변동성"])
-        
-        # 자산군 태그 추가
-        for asset_type, tags in asset_tags.items():
-            # title이나 analysis 대신 content에서 키워드 검색
-            if asset_type.lower() in content_lower: 
-                selected_tags.update(tags)
+        for group in get_keyword_matcher(self.config, 'market_tags').matched_categories(content):
+            if group not in tag_groups:
+                self.logger.warning(f"market_tags 분류 '{group}' 에 해당하는 태그 묶음이 없습니다. (market_tag_groups 설정 확인)")
+                continue
+            selected_tags.update(tag_groups[group])
         
         # 현재 날짜 태그 추가 (datetime 필요)
         today = datetime.now() # datetime 임포트 되어 있다고 가정
@@ -0,0 +1,98 @@
+import sqlite3
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# 필드별 유효 기간 (초): 섹터/산업은 거의 바뀌지 않고, 시가총액은 매일 변함
+DEFAULT_FIELD_TTLS = {
+    'sector': 7 * 86_400,
+    'industry': 7 * 86_400,
+    'marketCap': 6 * 3_600
+}
+
+
+class TickerMetadataStore:
+    """종목 info 중 추천에 쓰는 필드만 SQLite 에 보관하는 저장소입니다.
+    prefetch 는 유효 기간이 지난 필드가 하나라도 있는 종목만 모아 한 번에 조회합니다.
+    """
+
+    def __init__(self, path, field_ttls: Dict[str, float] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.field_ttls = field_ttls or DEFAULT_FIELD_TTLS
+        self.logger = logging.getLogger(__name__)
+        self.stats = {'hits': 0, 'misses': 0}
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS metadata (
+                symbol TEXT NOT NULL,
+                field TEXT NOT NULL,
+                value TEXT,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (symbol, field)
+            )
+        """)
+        self.conn.commit()
+
+    def prefetch(self, symbols: List[str], fetch_info: Callable[[List[str]], Dict[str, dict]]) -> Dict[str, dict]:
+        """캐시에서 유효한 필드를 읽고, 만료된 종목만 fetch_info 로 한 번에 조회해 저장합니다."""
+        cached = self._load(symbols)
+        stale = [symbol for symbol in symbols if not self._is_fresh(cached.get(symbol, {}))]
+        self.stats['hits'] += len(symbols) - len(stale)
+        self.stats['misses'] += len(stale)
+
+        if stale:
+            fetched = fetch_info(stale)
+            now = time.time()
+            rows = []
+            for symbol in stale:
+                info = fetched.get(symbol) or {}
+                if not info:
+                    continue  # 조회 실패는 저장하지 않고 다음 실행에서 재시도
+                for field in self.field_ttls:
+                    value = info.get(field)
+                    rows.append((symbol, field, json.dumps(value), now))
+                    cached.setdefault(symbol, {})[field] = (value, now)
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO metadata (symbol, field, value, fetched_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self.conn.commit()
+
+        return {
+            symbol: {field: value for field, (value, _) in cached.get(symbol, {}).items() if value is not None}
+            for symbol in symbols
+        }
+
+    def summary(self) -> dict:
+        lookups = self.stats['hits'] + self.stats['misses']
+        hit_rate = self.stats['hits'] / lookups if lookups else 0.0
+        return {**self.stats, 'hit_rate': round(hit_rate, 3)}
+
+    def close(self):
+        self.conn.close()
+
+    def _is_fresh(self, fields: dict) -> bool:
+        now = time.time()
+        for field, ttl in self.field_ttls.items():
+            if field not in fields or now - fields[field][1] > ttl:
+                return False
+        return True
+
+    def _load(self, symbols: List[str]) -> Dict[str, dict]:
+        result = {}
+        if not symbols:
+            return result
+        placeholders = ','.join('?' * len(symbols))
+        cursor = self.conn.execute(
+            f"SELECT symbol, field, value, fetched_at FROM metadata WHERE symbol IN ({placeholders})",
+            symbols
+        )
+        for symbol, field, value, fetched_at in cursor:
+            try:
+                result.setdefault(symbol, {})[field] = (json.loads(value), fetched_at)
+            except (TypeError, ValueError):
+                self.logger.warning(f"Invalid cached metadata for {symbol}.{field}, ignoring")
+        return result
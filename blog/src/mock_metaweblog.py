@@ -0,0 +1,76 @@
+import threading
+import time
+import xmlrpc.client
+from socketserver import ThreadingMixIn
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+# 로컬 모의 MetaWeblog API: metaWeblog.newPost 를 받아 posts 에 쌓고 글 번호를 반환합니다.
+# 인증 실패(Fault), 응답 지연(클라이언트 시간 초과), 5xx 응답을 재현해 발행 결과 판단을 점검합니다.
+AUTH_FAULT = 801
+
+
+class _ThreadingXMLRPCServer(ThreadingMixIn, SimpleXMLRPCServer):
+    daemon_threads = True
+
+
+class MockMetaWeblogServer:
+    """로컬 XML-RPC 서버로 metaWeblog.newPost 를 제공합니다. (주소: endpoint, 경로 /RPC2)
+    posts 에 받은 글({'blog_id', 'username', 'post', 'publish'})이 순서대로 쌓입니다.
+    api_key 가 다르면 Fault 를 반환하고, delay_s 를 주면 글을 저장한 뒤 그만큼 응답을 늦추며,
+    fail_status 를 주면 그 상태 코드로 응답합니다. (5xx 는 글을 저장한 뒤 실패, 4xx 는 저장하지 않고 거부)
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, api_key: str = 'mock-api-key'):
+        self.api_key = api_key
+        self.delay_s = 0.0
+        self.fail_status = None
+        self.posts = []
+        self._lock = threading.Lock()
+        self.server = _ThreadingXMLRPCServer((host, port), requestHandler=self._handler_class(),
+                                             logRequests=False, allow_none=True)
+        self.server.register_function(self._new_post, 'metaWeblog.newPost')
+        self.thread = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/RPC2"
+
+    def start(self) -> 'MockMetaWeblogServer':
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _new_post(self, blog_id, username, api_key, post, publish):
+        if api_key != self.api_key:
+            raise xmlrpc.client.Fault(AUTH_FAULT, 'Invalid API key')
+        with self._lock:
+            self.posts.append({'blog_id': blog_id, 'username': username, 'post': post, 'publish': publish})
+            post_id = str(223000000000 + len(self.posts))
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        return post_id
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(SimpleXMLRPCRequestHandler):
+            def do_POST(self):
+                if server.fail_status is None:
+                    return super().do_POST()
+                length = int(self.headers.get('Content-Length') or 0)
+                params, method = xmlrpc.client.loads(self.rfile.read(length))
+                if server.fail_status >= 500:
+                    try:
+                        server.server._dispatch(method, params)  # 글은 저장하고 응답만 실패
+                    except xmlrpc.client.Fault:
+                        pass
+                self.send_response(server.fail_status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+        return Handler
@@ -0,0 +1,332 @@
+import json
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, quote
+
+# 로컬 모의 네이버 사이트: 포스터가 의존하는 선택자(로그인 폼, 이전 글/도움말 팝업, 제목/본문 영역,
+# 발행 버튼과 발행 설정 창, 카테고리, 태그 입력창, 최종 발행 버튼)를 같은 이름으로 재현합니다.
+SESSION_COOKIE = 'NID_AUT'
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>로그인</title></head>
+<body>
+<form id="frmNIDLogin" onsubmit="return false;">
+  <input type="text" name="id">
+  <input type="password" name="pw">
+  <button type="button" class="btn_login" onclick="login()">로그인</button>
+</form>
+<script>
+function login() {
+  var id = document.getElementsByName('id')[0].value;
+  var pw = document.getElementsByName('pw')[0].value;
+  if (!id || !pw) return;
+  document.cookie = 'NID_AUT=mock-' + encodeURIComponent(id) + '.{session_epoch}; path=/';
+  localStorage.setItem('mockLoginAt', String(Date.now()));
+  setTimeout(function () { location.href = '/'; }, 100);
+}
+</script>
+</body></html>
+"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>홈</title></head>
+<body>{login_button}<h1>모의 네이버</h1></body></html>
+"""
+
+POSTWRITE_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>글쓰기</title>
+<style>
+  @font-face { font-family: 'MockNanum'; src: url('/static/fonts/nanum.woff2') format('woff2'); }
+  body { font-family: 'MockNanum', sans-serif; }
+  .se-assets img { width: 1px; height: 1px; }
+  .se-popup, .se-help-panel { position: fixed; top: 80px; left: 30%; background: #fff; border: 1px solid #888; padding: 16px; z-index: 10; }
+  .se-help-panel { top: 200px; }
+  .publish_layer { border: 1px solid #888; padding: 12px; margin-top: 12px; }
+  .category_list { display: none; }
+  .category_list.open { display: block; }
+  [contenteditable] { min-height: 24px; outline: 1px dotted #ccc; }
+</style></head>
+<body>
+<div class="se-documentTitle">
+  <div class="se-title-text">
+    <p class="se-title-paragraph" id="title" contenteditable="true"><span class="se-placeholder __se_placeholder">제목</span></p>
+  </div>
+</div>
+<div class="se-component se-text">
+  <div class="se-component-content">
+    <div id="body" contenteditable="true"><p class="se-text-paragraph"><br></p></div>
+  </div>
+</div>
+<button class="publish_btn__m9KHH" type="button">발행</button>
+<div class="publish_layer" id="publish-layer"></div>
+<template id="publish-layer-content">
+  <button class="selectbox_button__jb1Dt" type="button">카테고리</button>
+  <div class="category_list">
+    <input type="radio" id="11_종목 추천 및 분석" name="category"><label for="11_종목 추천 및 분석">종목 추천 및 분석</label>
+  </div>
+  <div class="tag_area"><div class="tag_list"></div><input id="tag-input" class="tag_input__rvUB5" type="text"></div>
+  <button class="confirm_btn__WEaBq" data-testid="seOnePublishBtn" type="button">발행</button>
+</template>
+<script>
+(function () {
+  var delay = {delay_ms};
+  var title = document.getElementById('title');
+  var body = document.getElementById('body');
+  document.execCommand('defaultParagraphSeparator', false, 'p');
+
+  // 본문에 새로 생긴 문단에도 에디터 문단 클래스를 붙임
+  new MutationObserver(function () {
+    body.querySelectorAll('p:not(.se-text-paragraph)').forEach(function (p) { p.className = 'se-text-paragraph'; });
+  }).observe(body, {childList: true, subtree: true});
+
+  // 이전 글 팝업과 도움말은 로드 후 늦게 나타남
+  setTimeout(function () {
+    var popup = document.createElement('div');
+    popup.className = 'se-popup';
+    popup.innerHTML = '<p>작성 중인 글이 있습니다.</p>' +
+      '<button type="button"><span class="se-popup-button-text">취소</span></button>' +
+      '<button type="button"><span class="se-popup-button-text">확인</span></button>';
+    popup.addEventListener('click', function (e) { if (e.target.closest('button')) popup.remove(); });
+    document.body.appendChild(popup);
+
+    var help = document.createElement('div');
+    help.className = 'se-help-panel';
+    help.innerHTML = '<p>도움말</p><button type="button" class="se-help-panel-close-button 닫기">x</button>';
+    help.querySelector('button').addEventListener('click', function () { help.remove(); });
+    document.body.appendChild(help);
+    fetch('/api/ping');
+  }, delay);
+
+  title.addEventListener('focus', function () {
+    var placeholder = title.querySelector('.se-placeholder');
+    if (placeholder) placeholder.remove();
+  });
+  title.addEventListener('keydown', function (e) {
+    if (e.key === 'Enter') {
+      e.preventDefault();
+      var first = body.querySelector('p');
+      var range = document.createRange();
+      range.selectNodeContents(first);
+      range.collapse(false);
+      body.focus();
+      var selection = window.getSelection();
+      selection.removeAllRanges();
+      selection.addRange(range);
+    }
+  });
+
+  function appendParagraph(html) {
+    var p = document.createElement('p');
+    p.className = 'se-text-paragraph';
+    p.innerHTML = html || '<br>';
+    body.appendChild(p);
+  }
+
+  body.addEventListener('paste', function (e) {
+    var data = e.clipboardData;
+    if (!data) return;
+    e.preventDefault();
+    var first = body.querySelector('p');
+    if (first && !first.textContent) first.remove();
+    var html = data.getData('text/html');
+    if (html) {
+      var doc = new DOMParser().parseFromString(html, 'text/html');
+      Array.prototype.forEach.call(doc.body.children, function (node) {
+        if (node.tagName === 'UL' || node.tagName === 'OL') {
+          node.querySelectorAll('li').forEach(function (li) { appendParagraph(li.innerHTML); });
+        } else if (/^H[1-3]$/.test(node.tagName)) {
+          appendParagraph('<b>' + node.innerHTML + '</b>');
+        } else {
+          appendParagraph(node.textContent ? node.innerHTML : '');
+        }
+      });
+      return;
+    }
+    data.getData('text/plain').split('\\n').forEach(function (line) {
+      var span = document.createElement('span');
+      span.textContent = line;
+      appendParagraph(line ? span.innerHTML : '');
+    });
+  });
+
+  // 발행 설정 창은 발행 버튼을 누른 뒤 늦게 만들어짐
+  var layer = document.getElementById('publish-layer');
+  document.querySelector('.publish_btn__m9KHH').addEventListener('click', function () {
+    if (layer.classList.contains('open')) return;
+    setTimeout(function () {
+      layer.appendChild(document.getElementById('publish-layer-content').content.cloneNode(true));
+      layer.classList.add('open');
+      setUpPublishLayer();
+    }, delay / 4);
+  });
+
+  function setUpPublishLayer() {
+    var categoryList = layer.querySelector('.category_list');
+    layer.querySelector('.selectbox_button__jb1Dt').addEventListener('click', function () {
+      categoryList.classList.add('open');
+    });
+    layer.querySelector('label').addEventListener('click', function () {
+      setTimeout(function () { categoryList.classList.remove('open'); }, 0);
+    });
+
+    var tagInput = document.getElementById('tag-input');
+    var tagList = layer.querySelector('.tag_list');
+    tagInput.addEventListener('keydown', function (e) {
+      if (e.key !== 'Enter') return;
+      e.preventDefault();
+      var value = tagInput.value.replace(/\\s/g, '').replace(/^#/, '');
+      if (!value) return;
+      var exists = Array.prototype.some.call(tagList.children, function (chip) { return chip.textContent === '#' + value; });
+      if (!exists && tagList.children.length < 30) {
+        var chip = document.createElement('span');
+        chip.className = 'tag_item__mock';
+        chip.textContent = '#' + value;
+        tagList.appendChild(chip);
+      }
+      tagInput.value = '';
+    });
+
+    layer.querySelector('.confirm_btn__WEaBq').addEventListener('click', function () {
+      var checked = layer.querySelector('input[name="category"]:checked');
+      var payload = {
+        title: title.textContent.trim(),
+        text: Array.prototype.map.call(body.querySelectorAll('p.se-text-paragraph'), function (p) { return p.textContent; }).join('\\n'),
+        html_length: body.innerHTML.length,
+        tags: Array.prototype.map.call(tagList.children, function (chip) { return chip.textContent.replace(/^#/, ''); }),
+        category: checked ? checked.id : null
+      };
+      fetch('/api/publish', {method: 'POST', headers: {'Content-Type': 'application/json'}, body: JSON.stringify(payload)})
+        .then(function (r) { return r.json(); })
+        .then(function (r) { location.href = '/gongnyangi/' + r.log_no; });
+    });
+  }
+})();
+</script>
+<!-- 실제 글쓰기 화면처럼 이미지/웹폰트/방문 통계 요청을 함께 받음 (asset_delay_ms 만큼 지연) -->
+<div class="se-assets">
+  <img src="/static/img/toolbar.png"><img src="/static/img/sticker.png"><img src="/static/img/banner.jpg"><img src="/static/img/profile.gif">
+</div>
+<script async src="/static/wcs.naver.net/wcslog.js"></script>
+</body></html>
+"""
+
+POST_VIEW_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title></head><body><h2>{title}</h2></body></html>
+"""
+
+
+class MockNaverServer:
+    """로컬 HTTP 서버로 모의 네이버 로그인/글쓰기/발행 화면을 제공합니다.
+    published 에 발행된 글(제목, 본문 텍스트, 태그, 카테고리)이 순서대로 쌓입니다.
+    delay_ms 는 팝업과 발행 설정 창이 늦게 나타나는 시간(실제 에디터의 지연 흉내)이고,
+    asset_delay_ms 는 글쓰기 화면의 이미지/웹폰트/통계 스크립트 응답 지연 시간입니다. (브라우저 프로필 비교용)
+    expire_sessions() 를 부르면 그전에 발급된 로그인 쿠키는 모두 로그아웃 상태로 취급합니다. (세션 만료 재현)
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, delay_ms: int = 300, asset_delay_ms: int = 150):
+        self.delay_ms = delay_ms
+        self.asset_delay_ms = asset_delay_ms
+        self.published = []
+        self.session_epoch = 1
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def urls(self) -> dict:
+        """blog_settings.urls 에 그대로 넣을 수 있는 주소 목록"""
+        return {
+            'login': f"{self.base_url}/nidlogin.login",
+            'blog': f"{self.base_url}/gongnyangi",
+            'postwrite': f"{self.base_url}/gongnyangi/postwrite"
+        }
+
+    def session_cookie(self, username: str = 'mock-user') -> dict:
+        """현재 유효한 로그인 쿠키 (로그인 화면이 발급하는 값과 같음)"""
+        return {'name': SESSION_COOKIE, 'value': f"mock-{quote(username)}.{self.session_epoch}",
+                'domain': self.httpd.server_address[0], 'path': '/'}
+
+    def expire_sessions(self):
+        self.session_epoch += 1
+
+    def start(self) -> 'MockNaverServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                cookie = SimpleCookie(self.headers.get('Cookie') or '').get(SESSION_COOKIE)
+                logged_in = cookie is not None and cookie.value.rsplit('.', 1)[-1] == str(server.session_epoch)
+                if path == '/nidlogin.login':
+                    self._send(200, LOGIN_PAGE.replace('{session_epoch}', str(server.session_epoch)))
+                elif path == '/gongnyangi/postwrite':
+                    if not logged_in:
+                        self._redirect(f"/nidlogin.login?url={quote(self.path)}")
+                    else:
+                        self._send(200, POSTWRITE_PAGE.replace('{delay_ms}', str(server.delay_ms)))
+                elif path in ('/', '/gongnyangi'):
+                    login_button = '' if logged_in else '<a class="log_btn" href="/nidlogin.login">로그인</a>'
+                    self._send(200, HOME_PAGE.replace('{login_button}', login_button))
+                elif path.startswith('/gongnyangi/'):
+                    log_no = path.rsplit('/', 1)[-1]
+                    with server._lock:
+                        post = next((p for p in server.published if str(p['log_no']) == log_no), None)
+                    if post is None:
+                        self._send(404, 'not found', 'text/plain')
+                    else:
+                        self._send(200, POST_VIEW_PAGE.replace('{title}', post['title'] or ''))
+                elif path.startswith('/static/'):
+                    time.sleep(server.asset_delay_ms / 1000)
+                    # 재사용하는 Chrome 프로필에서는 2회차부터 디스크 캐시로 읽음
+                    self._send(200, ' ' * 2048, 'application/octet-stream', {'Cache-Control': 'max-age=86400'})
+                elif path == '/api/ping':
+                    self._send(200, '{}', 'application/json')
+                else:
+                    self._send(404, 'not found', 'text/plain')
+
+            def do_POST(self):
+                if urlsplit(self.path).path != '/api/publish':
+                    self._send(404, 'not found', 'text/plain')
+                    return
+                length = int(self.headers.get('Content-Length') or 0)
+                post = json.loads(self.rfile.read(length) or b'{}')
+                with server._lock:
+                    post['log_no'] = 223000000000 + len(server.published) + 1
+                    server.published.append(post)
+                self._send(200, json.dumps({'log_no': post['log_no']}), 'application/json')
+
+            def _send(self, status: int, body: str, content_type: str = 'text/html', headers: dict = None):
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', f"{content_type}; charset=utf-8")
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _redirect(self, location: str):
+                self.send_response(302)
+                self.send_header('Location', location)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,181 @@
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from html import escape
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qs
+
+# 로컬 모의 Google News: 토픽(/topics/<id>)과 검색(/search?q=) 결과 페이지를
+# GoogleNews 라이브러리/news_sources.parse_news_page 가 쓰는 c-wiz 마크업으로 재현합니다.
+# RSS 주소(/rss/topics/<id>, /rss/search?q=)와 기록해 둔 피드 파일(/feeds/<파일명>)은 ETag/Last-Modified 를 붙여
+# 조건부 요청에 304 로 응답합니다.
+RECORDED_FEEDS = Path(__file__).parent.parent / 'samples' / 'feeds'
+TOPIC_FEED = 'google_news_business.rss'
+FEED_TYPES = {'.rss': 'application/rss+xml', '.atom': 'application/atom+xml'}
+RESULT_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{label} - Google News</title></head>
+<body><main>
+{articles}
+</main></body></html>
+"""
+
+RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+<title>"{label}" - Google News</title>
+<description>Google News</description>
+{items}
+</channel></rss>
+"""
+
+RSS_ITEM = """<item><title>{title}</title><link>https://news.google.com/rss/articles/{article_id}</link>
+<guid isPermaLink="false">{article_id}</guid><pubDate>{published}</pubDate></item>"""
+
+ARTICLE = """<c-wiz data-node-index="1;{index}"><article>
+  <a href="./articles/{article_id}" aria-hidden="true"></a>
+  <a href="./articles/{article_id}">{title}</a>
+  <time datetime="{published}">{published}</time>
+</article></c-wiz>"""
+
+SUBJECTS = ['Stocks', 'Treasury yields', 'Oil prices', 'The dollar', 'Chipmakers', 'Bank shares', 'Tech stocks']
+EVENTS = ['rise as inflation cools', 'slip ahead of Fed decision', 'rally on strong earnings',
+          'fall on tariff worries', 'hold steady as economy slows', 'jump after trade deal']
+OUTLETS = ['Reuters', 'CNBC', 'Bloomberg', 'MarketWatch', 'Yahoo Finance']
+
+
+class MockNewsServer:
+    """로컬 HTTP 서버로 모의 Google News 결과 페이지를 제공합니다.
+    질의마다 같은 헤드라인 목록(질의 문자열로 시드)을 반환하고, 요청 경로는 requests 에 순서대로 쌓입니다.
+    delay_ms 는 페이지 응답 지연 시간(실제 서버의 응답 시간 흉내)이고, fail_queries 에 든 검색어는 503 을 반환합니다.
+    피드 응답은 statuses 에 상태 코드가 쌓이며, update_feeds() 를 부르면 모든 피드의 ETag/Last-Modified 가 바뀝니다.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, delay_ms: int = 200, articles_per_query: int = 20,
+                 fail_queries=(), feed_dir=RECORDED_FEEDS):
+        self.delay_ms = delay_ms
+        self.articles_per_query = articles_per_query
+        self.fail_queries = set(fail_queries)
+        self.feed_dir = Path(feed_dir)
+        self.requests = []
+        self.statuses = []
+        self.feed_version = 0
+        self.feeds_modified_at = datetime.now(timezone.utc).replace(microsecond=0)
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockNewsServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def update_feeds(self):
+        """피드 내용이 바뀐 것처럼 ETag/Last-Modified 를 갱신합니다."""
+        with self._lock:
+            self.feed_version += 1
+            self.feeds_modified_at = datetime.now(timezone.utc).replace(microsecond=0)
+
+    def _headlines(self, label: str):
+        rng = random.Random(zlib.crc32(label.encode('utf-8')))
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        for index in range(self.articles_per_query):
+            title = f"{label.capitalize()}: {rng.choice(SUBJECTS)} {rng.choice(EVENTS)} - {rng.choice(OUTLETS)}"
+            yield index, f"{zlib.crc32(label.encode('utf-8')):x}{index}", title, now.replace(minute=rng.randrange(60), second=0)
+
+    def render(self, label: str) -> str:
+        articles = [
+            ARTICLE.format(index=index, article_id=article_id, title=escape(title),
+                           published=published.strftime('%Y-%m-%dT%H:%M:%SZ'))
+            for index, article_id, title, published in self._headlines(label)
+        ]
+        return RESULT_PAGE.format(label=escape(label), articles='\n'.join(articles))
+
+    def render_rss(self, label: str) -> str:
+        items = [
+            RSS_ITEM.format(title=escape(title), article_id=article_id, published=format_datetime(published, usegmt=True))
+            for _, article_id, title, published in self._headlines(label)
+        ]
+        return RSS_FEED.format(label=escape(label), items='\n'.join(items))
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                with server._lock:
+                    server.requests.append(self.path)
+                time.sleep(server.delay_ms / 1000)
+                if parts.path.startswith('/rss/topics/'):
+                    self._send_feed((server.feed_dir / TOPIC_FEED).read_bytes(), FEED_TYPES['.rss'])
+                elif parts.path == '/rss/search':
+                    query = parse_qs(parts.query).get('q', [''])[0].replace(' when:1d', '')
+                    self._send_feed(server.render_rss(query).encode('utf-8'), FEED_TYPES['.rss'])
+                elif parts.path.startswith('/feeds/'):
+                    path = server.feed_dir / Path(parts.path).name
+                    if path.is_file():
+                        self._send_feed(path.read_bytes(), FEED_TYPES.get(path.suffix, 'application/xml'))
+                    else:
+                        self._send(404, 'not found', 'text/plain')
+                elif parts.path.startswith('/topics/'):
+                    self._send(200, server.render(f"topic {parts.path.rsplit('/', 1)[-1][:8]}"))
+                elif parts.path == '/search':
+                    # q 는 '<검색어> when:1d' 형식
+                    query = parse_qs(parts.query).get('q', [''])[0].replace(' when:1d', '')
+                    if query in server.fail_queries:
+                        self._send(503, 'unavailable', 'text/plain')
+                    else:
+                        self._send(200, server.render(query))
+                else:
+                    self._send(404, 'not found', 'text/plain')
+
+            def _send(self, status: int, body, content_type: str = 'text/html', headers: dict = None):
+                data = body.encode('utf-8') if isinstance(body, str) else body
+                self.send_response(status)
+                self.send_header('Content-Type', f"{content_type}; charset=utf-8")
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_feed(self, data: bytes, content_type: str):
+                """피드를 ETag/Last-Modified 와 함께 보내고, 조건부 요청이 일치하면 304 만 보냅니다."""
+                with server._lock:
+                    version, modified_at = server.feed_version, server.feeds_modified_at
+                etag = f'"{zlib.crc32(data):08x}-{version}"'
+                last_modified = format_datetime(modified_at, usegmt=True)
+                if_none_match = self.headers.get('If-None-Match')
+                if_modified_since = self.headers.get('If-Modified-Since')
+                if if_none_match is not None:
+                    not_modified = etag in [tag.strip() for tag in if_none_match.split(',')]
+                else:
+                    try:
+                        not_modified = bool(if_modified_since) and parsedate_to_datetime(if_modified_since) >= modified_at
+                    except (TypeError, ValueError):
+                        not_modified = False
+                with server._lock:
+                    server.statuses.append(304 if not_modified else 200)
+                if not_modified:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self._send(200, data, content_type, {'ETag': etag, 'Last-Modified': last_modified})
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,74 @@
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import urlsplit
+from data_collector import SCREENER_PATHS
+
+# 로컬 모의 Yahoo Finance 스크리너: 카테고리 경로(SCREENER_PATHS)마다 기록해 둔 HTML 을 지연 시간을 두고 제공합니다.
+RECORDED_PAGES = Path(__file__).parent.parent / 'samples' / 'screener'
+
+
+class MockScreenerServer:
+    """로컬 HTTP 서버로 카테고리별 스크리너 페이지(page_dir/<category>.html)를 제공합니다.
+    delays_ms 는 카테고리별 응답 지연 시간(ms)이며, 응답 본문은 chunk_size 단위로 나눠 보냅니다.
+    requests 에 (카테고리, 요청 시각, 응답 완료 시각) 이 쌓입니다. (time.monotonic 기준)
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, delays_ms: dict = None, page_dir=RECORDED_PAGES,
+                 chunk_size: int = 4096):
+        self.delays_ms = dict(delays_ms or {})
+        self.pages = {
+            path: (category, (Path(page_dir) / f"{category}.html").read_bytes())
+            for category, path in SCREENER_PATHS.items()
+        }
+        self.chunk_size = chunk_size
+        self.requests = []
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockScreenerServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                page = server.pages.get(urlsplit(self.path).path)
+                if page is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                category, data = page
+                started = time.monotonic()
+                time.sleep(server.delays_ms.get(category, 0) / 1000)
+                try:
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/html; charset=utf-8')
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    for i in range(0, len(data), server.chunk_size):
+                        self.wfile.write(data[i:i + server.chunk_size])
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # 마감 시간을 넘겨 클라이언트가 연결을 닫은 경우
+                with server._lock:
+                    server.requests.append((category, started, time.monotonic()))
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
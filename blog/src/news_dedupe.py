@@ -0,0 +1,115 @@
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List
+import numpy as np
+
+IMPORTANCE_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+IMPORTANCE_LEVELS = ['high', 'medium', 'low']
+
+# Google News 제목 끝의 " - 언론사" 표기
+OUTLET_SUFFIX = re.compile(r'\s+[-|–—]\s+[^-|–—]{1,60}$')
+TOKEN = re.compile(r'[0-9a-z가-힣]+')
+STOPWORDS = {
+    'a', 'an', 'the', 'to', 'of', 'in', 'on', 'for', 'and', 'or', 'as', 'at', 'by', 'with', 'from',
+    'is', 'are', 'was', 'be', 'its', 'it', 'after', 'amid', 'over', 'says', 'say', 'new'
+}
+
+def headline_tokens(title: str) -> List[str]:
+    """비교용 토큰: 언론사 표기 제거, 소문자, 구두점/불용어 제거"""
+    title = OUTLET_SUFFIX.sub('', title or '').lower()
+    return [token for token in TOKEN.findall(title) if token not in STOPWORDS]
+
+
+def shingles(tokens: List[str]) -> set:
+    """단어 2-gram 집합 (토큰이 하나뿐이면 단어 자체)"""
+    if len(tokens) < 2:
+        return set(tokens)
+    return {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+class MinHashLSH:
+    """MinHash 서명과 LSH 밴딩으로 유사한 헤드라인 후보만 골라 묶습니다.
+    모든 쌍을 비교하지 않고 밴드 버킷이 겹치는 후보 쌍만 서명 일치율로 확인하므로 헤드라인 수에 대해 거의 선형입니다.
+    threshold 는 추정 Jaccard 유사도 기준이며, bands * rows = num_perm 입니다. (기본 16 x 4, 약 0.5 부근에서 후보 선택)
+    """
+
+    def __init__(self, threshold: float = 0.5, num_perm: int = 64, bands: int = 16, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        # 해시 함수 num_perm 개: multiply-shift ((a * x + b) mod 2^64 의 상위 32비트, a 는 홀수)
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+        self._b = rng.integers(0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64, endpoint=True)
+
+    def signature(self, items: set) -> np.ndarray:
+        hashes = np.fromiter((zlib.crc32(item.encode('utf-8')) for item in items), dtype=np.uint64, count=len(items))
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) >> np.uint64(32)  # uint64 곱셈은 2^64 로 순환
+        return permuted.min(axis=1)
+
+    def cluster(self, documents: List[set]) -> List[List[int]]:
+        """문서(shingle 집합) 목록을 유사 문서끼리 묶은 인덱스 목록으로 반환합니다. (각 묶음은 원래 순서 유지)"""
+        parent = list(range(len(documents)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        signatures = {}
+        buckets = defaultdict(list)
+        for index, items in enumerate(documents):
+            if not items:
+                continue  # 비교할 토큰이 없는 제목은 단독 묶음
+            signature = self.signature(items)
+            signatures[index] = signature
+            for band in range(self.bands):
+                key = (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+                buckets[key].append(index)
+
+        # 버킷 안에서 문서마다 이미 나온 대표들과만 서명 일치율을 확인 (버킷 크기는 보통 작음)
+        for members in buckets.values():
+            representatives = []
+            for index in members:
+                for representative in representatives:
+                    if find(index) == find(representative):
+                        break
+                    if np.mean(signatures[index] == signatures[representative]) >= self.threshold:
+                        root_a, root_b = find(index), find(representative)
+                        parent[max(root_a, root_b)] = min(root_a, root_b)
+                        break
+                else:
+                    representatives.append(index)
+
+        clusters = defaultdict(list)
+        for index in range(len(documents)):
+            clusters[find(index)].append(index)
+        return sorted(clusters.values(), key=lambda members: members[0])
+
+
+def dedupe_news(news_items: List[Dict], threshold: float = 0.5, num_perm: int = 64, bands: int = 16,
+                boost_cluster_size: int = 3) -> List[Dict]:
+    """같은 사건을 다룬 헤드라인을 묶어 묶음마다 대표 기사 하나만 남깁니다.
+    대표는 묶음에서 중요도가 가장 높은(같으면 먼저 나온) 기사이며, cluster_size 에 묶인 기사 수를 기록합니다.
+    여러 언론사가 함께 다룬 기사(cluster_size >= boost_cluster_size)는 중요도를 한 단계 올립니다.
+    """
+    if not news_items:
+        return []
+    lsh = MinHashLSH(threshold=threshold, num_perm=num_perm, bands=bands)
+    clusters = lsh.cluster([shingles(headline_tokens(item['title'])) for item in news_items])
+
+    deduped = []
+    for members in clusters:
+        best = min(members, key=lambda i: (IMPORTANCE_ORDER.get(news_items[i]['importance'], 2), i))
+        item = dict(news_items[best])
+        item['cluster_size'] = len(members)
+        if boost_cluster_size and len(members) >= boost_cluster_size:
+            level = IMPORTANCE_ORDER.get(item['importance'], 2)
+            item['importance'] = IMPORTANCE_LEVELS[max(level - 1, 0)]
+        deduped.append(item)
+    return deduped
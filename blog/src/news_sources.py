@@ -0,0 +1,377 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import quote_plus
+from bs4 import BeautifulSoup
+from feed_parser import parse_feed_stream
+
+GOOGLE_NEWS_URL = 'https://news.google.com'
+LOCALE_PARAMS = 'hl=en-US&gl=US&ceid=US%3Aen'
+
+# 설정(data_collection.news.queries)이 없을 때 수집하는 기본 질의 (name 은 로그/캐시 표시용)
+DEFAULT_QUERIES = [
+    {'name': 'markets', 'topic': 'CAAqJggKIiBDQkFTRWdvSUwyMHZNRGx6TVdZU0FtVnVHZ0pWVXlnQVAB'},
+    {'name': 'macro', 'query': 'federal reserve OR inflation OR tariffs'},
+    {'name': 'earnings', 'query': 'earnings report'}
+]
+
+
+def ticker_queries(symbols: List[str], template: str = '{symbol} stock') -> List[dict]:
+    """추천 종목별 검색 질의"""
+    return [{'name': f"ticker:{symbol}", 'query': template.format(symbol=symbol)} for symbol in symbols]
+
+
+def query_key(spec: dict) -> str:
+    """캐시 키: 같은 토픽/검색어/피드 주소면 이름이 달라도 같은 키"""
+    if spec.get('url'):
+        return f"url:{spec['url']}"
+    if spec.get('topic'):
+        return f"topic:{spec['topic']}"
+    return f"search:{spec['query'].strip().lower()}"
+
+
+def parse_news_page(html) -> List[dict]:
+    """Google News 토픽/검색 결과 페이지에서 기사 제목과 시각을 추출합니다.
+    GoogleNews 라이브러리와 같은 선택자(c-wiz[data-node-index^="1;"] 안의 두 번째 링크와 time 태그)를 사용합니다.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    articles = []
+    for article in soup.select('c-wiz[data-node-index^="1;"]'):
+        links = article.find_all('a')
+        if len(links) < 2:
+            continue
+        title = links[1].get_text(strip=True)
+        if not title:
+            continue
+        published = None
+        time_tag = article.find('time')
+        if time_tag is not None and time_tag.get('datetime'):
+            try:
+                published = datetime.fromisoformat(time_tag['datetime'].replace('Z', '+00:00'))
+            except ValueError:
+                pass
+        articles.append({'title': title, 'datetime': published})
+    return articles
+
+
+class NewsQueryCache:
+    """(질의, 날짜)별로 수집한 기사 목록을 SQLite 에 보관합니다.
+    같은 날 다시 실행하면 ttl_minutes 이내에 가져온 질의는 다시 요청하지 않고, keep_days 가 지난 날짜는 지웁니다.
+    """
+
+    def __init__(self, path, ttl_minutes: float = 60, keep_days: int = 7):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl_minutes * 60
+        self.logger = logging.getLogger(__name__)
+        self.stats = {'hits': 0, 'misses': 0}
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS news_queries (
+                query_key TEXT NOT NULL,
+                date TEXT NOT NULL,
+                articles TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (query_key, date)
+            )
+        """)
+        cutoff = (datetime.now() - timedelta(days=keep_days)).strftime('%Y-%m-%d')
+        self.conn.execute("DELETE FROM news_queries WHERE date < ?", (cutoff,))
+        self.conn.commit()
+
+    def get(self, key: str, date: str) -> Optional[List[dict]]:
+        row = self.conn.execute(
+            "SELECT articles, fetched_at FROM news_queries WHERE query_key = ? AND date = ?", (key, date)
+        ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            self.stats['misses'] += 1
+            return None
+        try:
+            articles = json.loads(row[0])
+        except ValueError:
+            self.logger.warning(f"Invalid cached news for {key} ({date}), ignoring")
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        return [
+            {'title': a['title'], 'datetime': datetime.fromisoformat(a['datetime']) if a['datetime'] else None}
+            for a in articles
+        ]
+
+    def put(self, key: str, date: str, articles: List[dict]):
+        encoded = json.dumps([
+            {'title': a['title'], 'datetime': a['datetime'].isoformat() if a['datetime'] else None} for a in articles
+        ], ensure_ascii=False)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO news_queries (query_key, date, articles, fetched_at) VALUES (?, ?, ?, ?)",
+            (key, date, encoded, time.time())
+        )
+        self.conn.commit()
+
+    def summary(self) -> dict:
+        lookups = self.stats['hits'] + self.stats['misses']
+        hit_rate = self.stats['hits'] / lookups if lookups else 0.0
+        return {**self.stats, 'hit_rate': round(hit_rate, 3)}
+
+    def close(self):
+        self.conn.close()
+
+
+class FeedStateStore:
+    """피드 주소별 마지막 응답의 ETag/Last-Modified 와 파싱한 기사 목록을 SQLite 에 보관합니다.
+    다음 요청에 If-None-Match/If-Modified-Since 를 보내고, 304 응답이면 보관한 기사 목록을 그대로 사용합니다.
+    수집 스레드들이 함께 쓰므로 연결 하나를 잠금으로 보호합니다.
+    """
+
+    def __init__(self, path, keep_days: int = 30):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self.stats = {'modified': 0, 'not_modified': 0}
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_state (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                articles TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("DELETE FROM feed_state WHERE fetched_at < ?", (time.time() - keep_days * 86_400,))
+        self.conn.commit()
+
+    def get(self, url: str) -> Optional[dict]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, articles FROM feed_state WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            articles = [
+                {'title': a['title'], 'datetime': datetime.fromisoformat(a['datetime']) if a['datetime'] else None}
+                for a in json.loads(row[2])
+            ]
+        except (TypeError, ValueError, KeyError):
+            self.logger.warning(f"Invalid feed state for {url}, ignoring")
+            return None
+        return {'etag': row[0], 'last_modified': row[1], 'articles': articles}
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], articles: List[dict]):
+        encoded = json.dumps([
+            {'title': a['title'], 'datetime': a['datetime'].isoformat() if a['datetime'] else None} for a in articles
+        ], ensure_ascii=False)
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO feed_state (url, etag, last_modified, articles, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, encoded, time.time())
+            )
+            self.conn.commit()
+
+    def record(self, modified: bool):
+        with self._lock:
+            self.stats['modified' if modified else 'not_modified'] += 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            return dict(self.stats)
+
+    def close(self):
+        self.conn.close()
+
+
+class NewsSource:
+    """뉴스 수집기 공통 부분: 여러 질의를 스레드 풀(max_in_flight)로 동시에 요청하고,
+    결과를 질의 순서대로 합치면서 같은 제목은 한 번만 남깁니다. 하위 클래스는 page_url/fetch 를 구현합니다.
+    base_url 을 바꾸면 로컬 모의 서버(mock_news.MockNewsServer)에서 수집합니다.
+    """
+    name = None
+
+    def __init__(self, http, base_url: str = GOOGLE_NEWS_URL, headers: dict = None, max_in_flight: int = 4,
+                 timeout: float = 10, cache: NewsQueryCache = None):
+        self.http = http
+        self.base_url = base_url.rstrip('/')
+        self.headers = headers or {}
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.timeout = timeout
+        self.cache = cache
+        self.logger = logging.getLogger(__name__)
+
+    def page_url(self, spec: dict) -> str:
+        raise NotImplementedError
+
+    def fetch(self, spec: dict) -> List[dict]:
+        """질의 하나의 기사 목록({'title', 'datetime'})을 가져옵니다."""
+        raise NotImplementedError
+
+    def collect(self, specs: List[dict], date: str) -> List[dict]:
+        """질의 목록의 기사({'title', 'datetime'})를 합쳐 반환합니다. 캐시에 있는 질의는 요청하지 않으며,
+        실패하거나 마감 시간을 넘긴 질의는 건너뛰고 캐시에도 저장하지 않습니다. (다음 실행에서 재시도)
+        """
+        results = {}
+        cached_names = set()
+        pending = []
+        for spec in specs:
+            cached = self.cache.get(query_key(spec), date) if self.cache else None
+            if cached is not None:
+                results[spec['name']] = cached
+                cached_names.add(spec['name'])
+            else:
+                pending.append(spec)
+
+        if pending:
+            # 동시 요청 수보다 질의가 많으면 대기열 순서만큼 마감 시간을 늘려줌
+            rounds = -(-len(pending) // self.max_in_flight)
+            deadline = self.timeout * rounds + 1
+            executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+            try:
+                futures = {executor.submit(self.fetch, spec): spec for spec in pending}
+                done, not_done = wait(futures, timeout=deadline)
+                for future, spec in futures.items():
+                    if future in not_done:
+                        self.logger.error(f"Error collecting news '{spec['name']}': deadline ({deadline:.0f}s) exceeded")
+                        print(f"✗ 뉴스 질의 '{spec['name']}' 수집 실패: 마감 시간 초과")
+                        continue
+                    try:
+                        articles = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error collecting news '{spec['name']}': {e}")
+                        print(f"✗ 뉴스 질의 '{spec['name']}' 수집 실패: {str(e)}")
+                        continue
+                    results[spec['name']] = articles
+                    if self.cache:
+                        self.cache.put(query_key(spec), date, articles)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        merged = []
+        seen = set()
+        for spec in specs:
+            articles = results.get(spec['name'], [])
+            print(f"- 뉴스 질의 '{spec['name']}': {len(articles)}개 기사{' (캐시)' if spec['name'] in cached_names else ''}")
+            for article in articles:
+                if article['title'] not in seen:
+                    seen.add(article['title'])
+                    merged.append(article)
+        return merged
+
+    def close(self):
+        if self.cache:
+            self.cache.close()
+
+
+class GoogleNewsSource(NewsSource):
+    """Google News 토픽/검색 결과 페이지(HTML)를 가져와 c-wiz 기사 목록을 파싱합니다."""
+    name = 'google'
+
+    def page_url(self, spec: dict) -> str:
+        if spec.get('topic'):
+            return f"{self.base_url}/topics/{spec['topic']}?{LOCALE_PARAMS}"
+        # when:1d → 최근 24시간 기사
+        return f"{self.base_url}/search?q={quote_plus(spec['query'])}+when:1d&{LOCALE_PARAMS}"
+
+    def fetch(self, spec: dict) -> List[dict]:
+        response = self.http.get(self.page_url(spec), headers=self.headers, timeout=self.timeout,
+                                 deadline=time.monotonic() + self.timeout)
+        response.raise_for_status()
+        return parse_news_page(response.text)
+
+
+class RssNewsSource(NewsSource):
+    """RSS/Atom 피드를 조건부 요청(If-None-Match/If-Modified-Since)으로 가져옵니다.
+    토픽/검색 질의는 Google News RSS 주소로 바꾸고, url 이 있는 질의와 feeds 는 그 주소를 그대로 요청합니다.
+    피드가 바뀌지 않았으면 304 응답 하나로 끝나고 state 에 보관한 기사 목록을 사용하며,
+    바뀐 피드는 내려받으면서 항목 단위로 파싱합니다. (max_items 개까지)
+    """
+    name = 'rss'
+
+    def __init__(self, http, feeds: List[dict] = None, state: FeedStateStore = None, max_items: int = 100, **kwargs):
+        super().__init__(http, **kwargs)
+        self.feeds = list(feeds or [])
+        self.state = state
+        self.max_items = max_items
+
+    def page_url(self, spec: dict) -> str:
+        if spec.get('url'):
+            return spec['url']
+        if spec.get('topic'):
+            return f"{self.base_url}/rss/topics/{spec['topic']}?{LOCALE_PARAMS}"
+        return f"{self.base_url}/rss/search?q={quote_plus(spec['query'])}+when:1d&{LOCALE_PARAMS}"
+
+    def fetch(self, spec: dict) -> List[dict]:
+        url = self.page_url(spec)
+        headers = dict(self.headers)
+        state = self.state.get(url) if self.state else None
+        if state:
+            if state['etag']:
+                headers['If-None-Match'] = state['etag']
+            if state['last_modified']:
+                headers['If-Modified-Since'] = state['last_modified']
+
+        deadline = time.monotonic() + self.timeout
+        with self.http.get(url, headers=headers, timeout=self.timeout, stream=True, deadline=deadline) as response:
+            if response.status_code == 304 and state:
+                self.state.record(modified=False)
+                return state['articles']
+            response.raise_for_status()
+            articles = parse_feed_stream(
+                response.iter_content(chunk_size=16 * 1024), deadline=deadline, max_items=self.max_items
+            )
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+
+        if self.state:
+            self.state.record(modified=True)
+            if etag or last_modified:
+                self.state.put(url, etag, last_modified, articles)
+        return articles
+
+    def collect(self, specs: List[dict], date: str) -> List[dict]:
+        return super().collect(list(specs) + self.feeds, date)
+
+    def close(self):
+        super().close()
+        if self.state:
+            self.state.close()
+
+
+def create_news_source(config: dict, http, headers: dict = None) -> NewsSource:
+    """설정(data_collection.news)에 맞는 뉴스 수집기를 생성합니다. (source: google | rss)"""
+    settings = config.get('data_collection', {}).get('news', {})
+    cache = None
+    cache_settings = settings.get('cache', {})
+    if cache_settings.get('enabled', False):
+        cache = NewsQueryCache(
+            Path(__file__).parent.parent / cache_settings.get('path', 'cache/news.sqlite'),
+            ttl_minutes=cache_settings.get('ttl_minutes', 60),
+            keep_days=cache_settings.get('keep_days', 7)
+        )
+    common = {
+        'base_url': settings.get('base_url', GOOGLE_NEWS_URL),
+        'headers': headers,
+        'max_in_flight': settings.get('max_in_flight', 4),
+        'timeout': settings.get('timeout', 10),
+        'cache': cache
+    }
+    name = settings.get('source', GoogleNewsSource.name)
+    if name == RssNewsSource.name:
+        rss_settings = settings.get('rss', {})
+        state_path = rss_settings.get('state_path', 'cache/feeds.sqlite')
+        return RssNewsSource(
+            http,
+            feeds=rss_settings.get('feeds'),
+            state=FeedStateStore(Path(__file__).parent.parent / state_path) if state_path else None,
+            max_items=rss_settings.get('max_items', 100),
+            **common
+        )
+    if name != GoogleNewsSource.name:
+        logging.getLogger(__name__).warning(f"Unknown news source '{name}', using google")
+    return GoogleNewsSource(http, **common)
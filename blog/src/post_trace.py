@@ -0,0 +1,168 @@
+import argparse
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+# create_post 단계 (보고서 출력 순서)
+PHASES = ['navigation', 'popups', 'title', 'body', 'publish_dialog', 'category', 'tags', 'final_publish']
+
+
+class PostTrace:
+    """create_post 의 단계별 소요 시간을 기록합니다.
+    begin(phase) 는 진행 중인 단계를 끝내고 새 단계를 시작하며, finish() 가 마지막 단계를 닫고
+    단계마다 한 줄씩 JSON Lines 파일에 추가합니다. 실패한 실행에서는 마지막으로 진행 중이던 단계가 실패 단계입니다.
+    """
+
+    def __init__(self, path, run_id: str = None):
+        self.path = Path(path)
+        self.run_id = run_id or f"{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}"
+        self.logger = logging.getLogger(__name__)
+        self.spans: List[dict] = []
+        self._current = None
+        self._started = time.monotonic()
+
+    @property
+    def current_phase(self) -> str:
+        return self._current['phase'] if self._current else None
+
+    def begin(self, phase: str):
+        self._close(ok=True)
+        self._current = {'phase': phase, 'start': time.time(), '_t0': time.monotonic()}
+
+    def finish(self, success: bool, **extra) -> List[dict]:
+        """마지막 단계를 닫고 단계별 기록과 전체 기록('total')을 파일에 추가합니다."""
+        failed_phase = self.current_phase if not success else None
+        self._close(ok=success)
+        total = {
+            'run_id': self.run_id, 'phase': 'total', 'start': self.spans[0]['start'] if self.spans else time.time(),
+            'duration_s': round(time.monotonic() - self._started, 3), 'ok': success, 'failed_phase': failed_phase, **extra
+        }
+        records = self.spans + [total]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except OSError as e:
+            self.logger.warning(f"Failed to write post trace {self.path}: {e}")
+        slowest = sorted(self.spans, key=lambda s: s['duration_s'], reverse=True)[:3]
+        print("- 단계별 소요 시간(상위): " + ', '.join(f"{s['phase']} {s['duration_s']:.1f}초" for s in slowest))
+        self.logger.info(f"포스팅 단계별 소요 시간 ({self.run_id}): "
+                         + ', '.join(f"{s['phase']}={s['duration_s']:.2f}s" for s in self.spans))
+        return records
+
+    def _close(self, ok: bool):
+        if self._current is None:
+            return
+        span = self._current
+        self.spans.append({
+            'run_id': self.run_id, 'phase': span['phase'], 'start': span['start'],
+            'duration_s': round(time.monotonic() - span['_t0'], 3), 'ok': ok
+        })
+        self._current = None
+
+
+def capture_failure(driver, directory, run_id: str, phase: str = None) -> threading.Thread:
+    """실패 시점의 DOM, 스크린샷, 브라우저 콘솔 로그를 directory/run_id 에 저장합니다.
+    브라우저에서 가져오는 작업은 드라이버를 반납/종료하기 전에 바로 하고, 파일 쓰기는 백그라운드 스레드에서 합니다.
+    """
+    logger = logging.getLogger(__name__)
+    artifacts = {}
+    grabbers = {
+        'dom.html': lambda: driver.page_source.encode('utf-8'),
+        'screenshot.png': driver.get_screenshot_as_png,
+        'console.json': lambda: json.dumps(driver.get_log('browser'), ensure_ascii=False, indent=2).encode('utf-8')
+    }
+    for name, grab in grabbers.items():
+        try:
+            artifacts[name] = grab()
+        except Exception as e:
+            logger.warning(f"Failed to capture {name}: {e}")
+    try:
+        url = driver.current_url
+    except Exception:
+        url = None
+    artifacts['meta.json'] = json.dumps(
+        {'run_id': run_id, 'phase': phase, 'url': url, 'captured_at': time.time()}, ensure_ascii=False, indent=2
+    ).encode('utf-8')
+
+    target = Path(directory) / run_id
+
+    def write():
+        try:
+            target.mkdir(parents=True, exist_ok=True)
+            for name, data in artifacts.items():
+                (target / name).write_bytes(data)
+            logger.info(f"실패 자료 저장: {target} ({', '.join(artifacts)})")
+        except OSError as e:
+            logger.error(f"Failed to write failure artifacts to {target}: {e}")
+
+    thread = threading.Thread(target=write, name=f"capture-{run_id}")
+    thread.start()
+    print(f"- 실패 자료(DOM/스크린샷/콘솔 로그) 저장 중: {target}")
+    return thread
+
+
+def load_spans(path) -> List[dict]:
+    spans = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    spans.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # 기록 중 중단된 줄
+    return spans
+
+
+def phase_report(spans: List[dict], last: int = None) -> Dict[str, dict]:
+    """단계별 실행 수, p50/p95/최대 소요 시간(초)과 실패 수를 집계합니다. last 를 주면 최근 실행만 사용합니다."""
+    run_ids = list(dict.fromkeys(span['run_id'] for span in spans))
+    if last:
+        selected = set(run_ids[-last:])
+        spans = [span for span in spans if span['run_id'] in selected]
+    durations = defaultdict(list)
+    failures = defaultdict(int)
+    for span in spans:
+        durations[span['phase']].append(span['duration_s'])
+        if span['phase'] == 'total' and span.get('failed_phase'):
+            failures[span['failed_phase']] += 1
+    order = PHASES + sorted(set(durations) - set(PHASES) - {'total'}) + ['total']
+    report = {}
+    for phase in order:
+        values = sorted(durations.get(phase, []))
+        if not values:
+            continue
+        report[phase] = {
+            'count': len(values),
+            'p50': round(values[int(0.5 * (len(values) - 1))], 3),
+            'p95': round(values[int(0.95 * (len(values) - 1))], 3),
+            'max': round(values[-1], 3),
+            'failed': failures.get(phase, 0)
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="create_post 단계별 소요 시간 보고서")
+    parser.add_argument('path', nargs='?', default='logs/post_trace.jsonl')
+    parser.add_argument('--last', type=int, help="최근 N회 실행만 집계")
+    args = parser.parse_args()
+
+    report = phase_report(load_spans(args.path), last=args.last)
+    runs = report.get('total', {}).get('count', 0)
+    print(f"{args.path}: {runs}회 실행")
+    print(f"{'phase':>15} {'count':>6} {'p50(s)':>8} {'p95(s)':>8} {'max(s)':>8} {'failed':>7}")
+    for phase, stats in report.items():
+        print(f"{phase:>15} {stats['count']:>6} {stats['p50']:>8.2f} {stats['p95']:>8.2f} {stats['max']:>8.2f} {stats['failed']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+import logging
+import json
+import re
+import time
+from pathlib import Path
+from typing import Dict, List
+from price_provider import PriceDataProvider, HISTORY_FIELDS, history_for
+
+EPOCH = pd.Timestamp('1970-01-01')
+
+
+def period_start(period: str, now: pd.Timestamp = None) -> pd.Timestamp:
+    """yfinance period 문자열('5d', '1mo', '1y' 등)을 조회 시작 날짜로 변환합니다."""
+    now = (now or pd.Timestamp.now()).normalize()
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+    amount, unit = int(match.group(1)), match.group(2)
+    offsets = {
+        'd': pd.DateOffset(days=amount),
+        'wk': pd.DateOffset(weeks=amount),
+        'mo': pd.DateOffset(months=amount),
+        'y': pd.DateOffset(years=amount)
+    }
+    return now - offsets[unit]
+
+
+class CachedPriceProvider(PriceDataProvider):
+    """종목별 OHLCV 를 로컬 NumPy 파일(.npy, 메모리 매핑)로 캐시하는 제공자입니다.
+
+    캐시가 조회 구간 시작을 덮고 있으면 마지막 캐시 날짜부터만 내려받아 덧붙이고
+    (마지막 봉은 장중 값일 수 있어 다시 받음), refresh_minutes 이내에 갱신했다면 다운로드 없이 사용합니다.
+    마지막 사용 후 ttl_days 가 지난 종목은 삭제하고, 전체 크기가 max_mb 를 넘으면
+    오래 사용하지 않은 종목부터 삭제합니다.
+    """
+
+    def __init__(self, provider: PriceDataProvider, directory, ttl_days: float = 14,
+                 max_mb: float = 200, refresh_minutes: float = 60):
+        self.provider = provider
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.directory / 'index.json'
+        self.ttl_seconds = ttl_days * 86_400
+        self.max_bytes = max_mb * 1024 * 1024
+        self.refresh_seconds = refresh_minutes * 60
+        self.logger = logging.getLogger(__name__)
+        self.index = self._load_index()
+        self.stats = {'hits': 0, 'refreshed': 0, 'misses': 0}
+
+    def get_info(self, symbols: List[str]) -> Dict[str, dict]:
+        return self.provider.get_info(symbols)
+
+    def get_history(self, symbols: List[str], period: str = '1mo', start=None) -> pd.DataFrame:
+        window_start = pd.Timestamp(start).normalize() if start is not None else period_start(period)
+        now = time.time()
+
+        # 종목별 다운로드 시작 날짜 결정 (같은 시작 날짜끼리 묶어서 일괄 다운로드)
+        cached = {}
+        fetch_groups = {}
+        for symbol in symbols:
+            entry = self.index.get(symbol)
+            frame = self._read(symbol) if entry else None
+            if frame is None or frame.empty or pd.Timestamp(entry['covered_from']) > window_start:
+                self.stats['misses'] += 1
+                fetch_groups.setdefault(window_start, []).append(symbol)
+                continue
+            cached[symbol] = frame
+            if now - entry['fetched_at'] < self.refresh_seconds:
+                self.stats['hits'] += 1
+            else:
+                self.stats['refreshed'] += 1
+                fetch_groups.setdefault(frame.index[-1], []).append(symbol)
+
+        for fetch_start, group in fetch_groups.items():
+            try:
+                fetched = self.provider.get_history(group, period=period, start=fetch_start)
+            except Exception as e:
+                self.logger.error(f"Error downloading history for {len(group)} symbols: {e}")
+                continue
+            for symbol in group:
+                new_rows = history_for(fetched, symbol)
+                if new_rows.empty:
+                    # 새 봉이 없는 경우(휴장일 등)에도 갱신 시각은 기록해 반복 다운로드를 피함
+                    if symbol in cached:
+                        self.index[symbol]['fetched_at'] = now
+                    continue
+                new_rows = self._normalize(new_rows)
+                old_rows = cached.get(symbol)
+                if old_rows is not None:
+                    merged = pd.concat([old_rows[old_rows.index < new_rows.index[0]], new_rows])
+                    covered_from = self.index[symbol]['covered_from']
+                else:
+                    merged = new_rows
+                    covered_from = str(window_start.date())
+                cached[symbol] = merged
+                self._write(symbol, merged, covered_from, now)
+
+        for symbol in cached:
+            if symbol in self.index:
+                self.index[symbol]['last_access'] = now
+        self._evict(now)
+        self._save_index()
+
+        frames = {symbol: frame[frame.index >= window_start] for symbol, frame in cached.items()}
+        frames = {symbol: frame for symbol, frame in frames.items() if not frame.empty}
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1)
+
+    def hit_rate(self) -> float:
+        """다운로드 없이 또는 일부 구간만 받아 처리한 비율"""
+        lookups = sum(self.stats.values())
+        if not lookups:
+            return 0.0
+        return (self.stats['hits'] + self.stats['refreshed']) / lookups
+
+    def summary(self) -> dict:
+        return {**self.stats, 'hit_rate': round(self.hit_rate(), 3), 'symbols': len(self.index)}
+
+    def _normalize(self, frame: pd.DataFrame) -> pd.DataFrame:
+        frame = frame.reindex(columns=HISTORY_FIELDS).astype(float)
+        index = pd.DatetimeIndex(frame.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        frame.index = index.normalize()
+        return frame[~frame.index.duplicated(keep='last')].sort_index()
+
+    def _path(self, symbol: str) -> Path:
+        safe = re.sub(r'[^A-Za-z0-9._-]', '_', symbol)
+        return self.directory / f"{safe}.npy"
+
+    def _read(self, symbol: str):
+        path = self._path(symbol)
+        if not path.exists():
+            return None
+        try:
+            data = np.load(path, mmap_mode='r')
+            index = pd.to_datetime(data[:, 0].astype(np.int64), unit='D')
+            return pd.DataFrame(np.array(data[:, 1:]), index=index, columns=HISTORY_FIELDS)
+        except Exception as e:
+            self.logger.warning(f"Corrupted price cache for {symbol}, ignoring: {e}")
+            return None
+
+    def _write(self, symbol: str, frame: pd.DataFrame, covered_from: str, now: float):
+        # 날짜는 epoch 기준 일 수로 저장해 float64 배열 하나로 보관
+        days = (frame.index - EPOCH) // pd.Timedelta(days=1)
+        data = np.column_stack([np.asarray(days, dtype=float), frame.to_numpy(dtype=float)])
+        path = self._path(symbol)
+        np.save(path, data)
+        self.index[symbol] = {
+            'covered_from': covered_from,
+            'fetched_at': now,
+            'last_access': now,
+            'bytes': path.stat().st_size
+        }
+
+    def _evict(self, now: float):
+        expired = [s for s, e in self.index.items() if now - e['last_access'] > self.ttl_seconds]
+        for symbol in expired:
+            self._remove(symbol)
+
+        total = sum(e['bytes'] for e in self.index.values())
+        if total <= self.max_bytes:
+            return
+        for symbol in sorted(self.index, key=lambda s: self.index[s]['last_access']):
+            total -= self.index[symbol]['bytes']
+            self._remove(symbol)
+            if total <= self.max_bytes:
+                break
+
+    def _remove(self, symbol: str):
+        self._path(symbol).unlink(missing_ok=True)
+        self.index.pop(symbol, None)
+
+    def _load_index(self) -> dict:
+        try:
+            return json.loads(self.index_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Price cache index unreadable, starting empty: {e}")
+            return {}
+
+    def _save_index(self):
+        tmp_path = self.index_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(self.index), encoding='utf-8')
+        tmp_path.replace(self.index_path)
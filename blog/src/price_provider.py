@@ -0,0 +1,99 @@
+import pandas as pd
+import logging
+import json
+from pathlib import Path
+from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+import yfinance as yf
+
+HISTORY_FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def history_for(history: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    """(symbol, field) MultiIndex 컬럼 프레임에서 한 종목의 히스토리를 꺼냅니다.
+    다운로드 결과에 없는 종목은 빈 DataFrame 을 반환합니다.
+    """
+    if history.empty or symbol not in history.columns.get_level_values(0):
+        return pd.DataFrame(columns=HISTORY_FIELDS)
+    return history[symbol].dropna(how='all')
+
+
+class PriceDataProvider:
+    """가격 히스토리와 종목 정보(info)를 제공하는 인터페이스입니다.
+    get_history 는 컬럼이 (symbol, field) MultiIndex 인 프레임을 반환해야 합니다.
+    start 가 주어지면 period 대신 start 날짜(포함)부터의 데이터를 반환합니다.
+    """
+
+    def get_history(self, symbols: List[str], period: str = '1mo', start=None) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def get_info(self, symbols: List[str]) -> Dict[str, dict]:
+        raise NotImplementedError
+
+
+class YahooPriceProvider(PriceDataProvider):
+    """yfinance 기반 제공자 (히스토리는 한 번의 다중 종목 다운로드, info 는 병렬 조회)"""
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+
+    def get_history(self, symbols: List[str], period: str = '1mo', start=None) -> pd.DataFrame:
+        if not symbols:
+            return pd.DataFrame()
+        # Ticker.history() 와 같은 수정주가 기준으로 맞춤
+        data = yf.download(
+            tickers=symbols,
+            period=None if start is not None else period,
+            start=start,
+            group_by='ticker',
+            auto_adjust=True,
+            actions=False,
+            threads=True,
+            progress=False
+        )
+        if data is None or data.empty:
+            return pd.DataFrame()
+        # 종목이 하나면 단일 레벨 컬럼이 반환될 수 있으므로 MultiIndex 로 통일
+        if not isinstance(data.columns, pd.MultiIndex):
+            data.columns = pd.MultiIndex.from_product([symbols[:1], data.columns])
+        return data
+
+    def get_info(self, symbols: List[str]) -> Dict[str, dict]:
+        if not symbols:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(symbols))) as executor:
+            results = executor.map(self._fetch_info, symbols)
+            return dict(zip(symbols, results))
+
+    def _fetch_info(self, symbol: str) -> dict:
+        try:
+            return yf.Ticker(symbol).info or {}
+        except Exception as e:
+            self.logger.error(f"Error fetching info for {symbol}: {e}")
+            return {}
+
+
+class FixturePriceProvider(PriceDataProvider):
+    """로컬 파일 기반 제공자 (Yahoo 없이 점검/벤치마크할 때 사용)
+    directory/{symbol}.csv (Date 인덱스, OHLCV 컬럼) 와 directory/info.json ({symbol: info}) 을 읽습니다.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def get_history(self, symbols: List[str], period: str = '1mo', start=None) -> pd.DataFrame:
+        frames = {}
+        for symbol in symbols:
+            path = self.directory / f"{symbol}.csv"
+            if path.exists():
+                frame = pd.read_csv(path, index_col=0, parse_dates=True)
+                frames[symbol] = frame[frame.index >= pd.Timestamp(start)] if start is not None else frame
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1)
+
+    def get_info(self, symbols: List[str]) -> Dict[str, dict]:
+        path = self.directory / 'info.json'
+        infos = json.loads(path.read_text(encoding='utf-8')) if path.exists() else {}
+        return {symbol: infos.get(symbol, {}) for symbol in symbols}
@@ -0,0 +1,275 @@
+import argparse
+import sqlite3
+import json
+import logging
+import random
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+PENDING = 'pending'
+PUBLISHED = 'published'
+FAILED = 'failed'      # 최대 시도 횟수 초과
+EXPIRED = 'expired'    # 발행 유효 기간(max_age_hours) 경과
+UNCONFIRMED = 'unconfirmed'  # 발행 요청을 보낸 뒤 실패 (이미 발행됐을 수 있어 자동 재시도하지 않고 확인 필요)
+
+# 발행 시도 결과 (Publisher.publish 반환값)
+NOT_SENT = 'not_sent'  # 글을 보내기 전에 실패 (다시 시도해도 중복 발행 위험 없음)
+UNKNOWN = 'unknown'    # 글을 보낸 뒤 실패하거나 결과를 확인하지 못함
+
+
+class PublishOutbox:
+    """생성된 글(제목, 본문, 태그, 분석 결과)을 SQLite 에 보관하는 발행 대기열입니다.
+    글 생성과 발행을 분리해서, 발행이 실패해도 데이터 수집/분석을 다시 하지 않고 저장된 글로 재시도합니다.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_date TEXT NOT NULL,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                tags TEXT NOT NULL,
+                analysis TEXT,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                published_at REAL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, next_attempt_at)")
+        self.conn.commit()
+
+    def enqueue(self, run_date: str, title: str, content: str, tags: List[str], analysis: dict = None) -> int:
+        """글을 대기열에 추가하고 작업 번호를 반환합니다. (분석 결과의 numpy/날짜 값은 문자열로 저장)"""
+        now = time.time()
+        cursor = self.conn.execute(
+            "INSERT INTO jobs (run_date, title, content, tags, analysis, status, next_attempt_at, created_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (run_date, title, content, json.dumps(tags, ensure_ascii=False),
+             json.dumps(analysis or {}, ensure_ascii=False, default=str), PENDING, now, now)
+        )
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def get(self, job_id: int) -> Optional[dict]:
+        row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def find(self, run_date: str, statuses=(PENDING, PUBLISHED, UNCONFIRMED)) -> Optional[dict]:
+        """해당 날짜의 작업 중 가장 최근 것을 반환합니다. (같은 날 글을 다시 생성하지 않기 위해 사용)"""
+        placeholders = ','.join('?' * len(statuses))
+        row = self.conn.execute(
+            f"SELECT * FROM jobs WHERE run_date = ? AND status IN ({placeholders}) ORDER BY id DESC LIMIT 1",
+            (run_date, *statuses)
+        ).fetchone()
+        return self._to_job(row) if row else None
+
+    def due(self, now: float = None) -> List[dict]:
+        """재시도 시각이 지난 대기 작업을 오래된 순서로 반환합니다."""
+        rows = self.conn.execute(
+            "SELECT * FROM jobs WHERE status = ? AND next_attempt_at <= ? ORDER BY id",
+            (PENDING, now if now is not None else time.time())
+        ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def mark_published(self, job_id: int):
+        self.conn.execute(
+            "UPDATE jobs SET status = ?, attempts = attempts + 1, last_error = NULL, published_at = ? WHERE id = ?",
+            (PUBLISHED, time.time(), job_id)
+        )
+        self.conn.commit()
+
+    def mark_failed(self, job_id: int, error: str, retry_in: Optional[float]):
+        """실패를 기록합니다. retry_in 이 None 이면 더 이상 재시도하지 않습니다."""
+        if retry_in is None:
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, last_error = ? WHERE id = ?",
+                (FAILED, error, job_id)
+            )
+        else:
+            self.conn.execute(
+                "UPDATE jobs SET attempts = attempts + 1, last_error = ?, next_attempt_at = ? WHERE id = ?",
+                (error, time.time() + retry_in, job_id)
+            )
+        self.conn.commit()
+
+    def mark_unconfirmed(self, job_id: int, error: str):
+        self.conn.execute(
+            "UPDATE jobs SET status = ?, attempts = attempts + 1, last_error = ? WHERE id = ?",
+            (UNCONFIRMED, error, job_id)
+        )
+        self.conn.commit()
+
+    def resolve(self, job_id: int, published: bool) -> bool:
+        """확인이 필요한 작업을 블로그에서 확인한 결과로 정리합니다.
+        발행됐으면 published 로 기록하고, 아니면 대기 작업으로 되돌려 바로 다시 발행합니다. 정리했으면 True
+        """
+        if published:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET status = ?, last_error = NULL, published_at = ? WHERE id = ? AND status = ?",
+                (PUBLISHED, time.time(), job_id, UNCONFIRMED)
+            )
+        else:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET status = ?, next_attempt_at = ? WHERE id = ? AND status = ?",
+                (PENDING, time.time(), job_id, UNCONFIRMED)
+            )
+        self.conn.commit()
+        return cursor.rowcount > 0
+
+    def jobs(self, statuses=None, limit: int = 20) -> List[dict]:
+        """최근 작업 목록 (statuses 를 주면 해당 상태만)"""
+        query, params = "SELECT * FROM jobs", []
+        if statuses:
+            query += f" WHERE status IN ({','.join('?' * len(statuses))})"
+            params += list(statuses)
+        rows = self.conn.execute(query + " ORDER BY id DESC LIMIT ?", (*params, limit)).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def expire(self, max_age_seconds: float) -> int:
+        """생성 후 max_age_seconds 가 지난 대기 작업을 만료 처리하고 건수를 반환합니다."""
+        cursor = self.conn.execute(
+            "UPDATE jobs SET status = ? WHERE status = ? AND created_at < ?",
+            (EXPIRED, PENDING, time.time() - max_age_seconds)
+        )
+        self.conn.commit()
+        return cursor.rowcount
+
+    def counts(self) -> dict:
+        rows = self.conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def close(self):
+        self.conn.close()
+
+    def _to_job(self, row) -> dict:
+        job = dict(row)
+        job['tags'] = json.loads(job['tags'])
+        job['analysis'] = json.loads(job['analysis']) if job['analysis'] else {}
+        return job
+
+
+class PublishWorker:
+    """대기열에서 재시도 시각이 된 글을 발행합니다.
+    글을 보내기 전에 실패(NOT_SENT)한 경우에만 지수 백오프(jitter 적용)로 다음 시도를 예약하고,
+    보낸 뒤 실패했거나 결과를 알 수 없는 경우(UNKNOWN)는 중복 발행을 피하려고 확인 필요(unconfirmed)로 남깁니다.
+    발행 백엔드(브라우저 등)는 작업마다 새로 만들고 발행 후 바로 정리합니다.
+    """
+
+    def __init__(self, outbox: PublishOutbox, publisher_factory: Callable, max_attempts: int = 5,
+                 backoff_base: float = 300, backoff_max: float = 3600, max_age_hours: float = 12):
+        self.outbox = outbox
+        self.publisher_factory = publisher_factory
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_age_seconds = max_age_hours * 3600
+        self.logger = logging.getLogger(__name__)
+
+    def retry_delay(self, attempts: int) -> Optional[float]:
+        """attempts 번 실패한 뒤의 대기 시간 (최대 시도 횟수에 도달하면 None)"""
+        if attempts >= self.max_attempts:
+            return None
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempts - 1)))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def run_once(self) -> dict:
+        """대기 중인 글을 발행하고 결과 건수({'published', 'retry', 'failed', 'unconfirmed', 'expired'})를 반환합니다."""
+        result = {'published': 0, 'retry': 0, 'failed': 0, 'unconfirmed': 0,
+                  'expired': self.outbox.expire(self.max_age_seconds)}
+        if result['expired']:
+            self.logger.warning(f"발행 유효 기간이 지난 글 {result['expired']}건 만료 처리")
+            print(f"- 발행 유효 기간이 지난 글 {result['expired']}건 만료 처리")
+
+        for job in self.outbox.due():
+            print(f"- 발행 대기열 작업 #{job['id']} ({job['run_date']}, 시도 {job['attempts'] + 1}회차): {job['title']}")
+            publisher = None
+            outcome = NOT_SENT
+            error = None
+            try:
+                publisher = self.publisher_factory()
+                print(f"- 발행 방식: {publisher.name}")
+                outcome = publisher.publish(job['title'], job['content'], job['tags'])
+                if outcome == PUBLISHED:
+                    self.outbox.mark_published(job['id'])
+                    self.logger.info(f"포스팅 성공: '{job['title']}' (작업 #{job['id']})")
+                    result['published'] += 1
+                    continue
+                error = f"publish outcome: {outcome}"
+            except Exception as e:
+                # 백엔드 생성 중 오류는 보내기 전, 발행 중 오류는 보냈을 수도 있는 것으로 취급
+                outcome = NOT_SENT if publisher is None else UNKNOWN
+                self.logger.error(f"발행 작업 #{job['id']} 오류: {e}", exc_info=True)
+                error = str(e)
+            finally:
+                self._close(publisher)
+
+            if outcome != NOT_SENT:
+                self.outbox.mark_unconfirmed(job['id'], error)
+                self.logger.error(f"포스팅 결과 확인 불가 (자동 재시도 안 함): '{job['title']}' (작업 #{job['id']}), {error}")
+                print(f"✗ 작업 #{job['id']} 발행 결과를 확인할 수 없습니다. 블로그에서 글을 확인한 뒤 정리하세요: "
+                      f"python publish_outbox.py resolve {job['id']} --published | --retry")
+                result['unconfirmed'] += 1
+                continue
+
+            retry_in = self.retry_delay(job['attempts'] + 1)
+            self.outbox.mark_failed(job['id'], error, retry_in)
+            if retry_in is None:
+                self.logger.error(f"포스팅 실패 (최대 시도 횟수 초과): '{job['title']}' (작업 #{job['id']})")
+                print(f"✗ 작업 #{job['id']} 발행 실패: 최대 시도 횟수({self.max_attempts}) 초과")
+                result['failed'] += 1
+            else:
+                self.logger.error(f"포스팅 실패: '{job['title']}' (작업 #{job['id']}), {retry_in:.0f}초 후 재시도")
+                print(f"✗ 작업 #{job['id']} 발행 실패: {retry_in / 60:.1f}분 후 재시도")
+                result['retry'] += 1
+        return result
+
+    def _close(self, publisher):
+        if publisher is None:
+            return
+        try:
+            publisher.close()
+        except Exception as e:
+            self.logger.error(f"발행 백엔드 정리 중 오류: {e}")
+            print(f"✗ 발행 백엔드 정리 중 오류: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발행 대기열 확인/정리")
+    parser.add_argument('--path', default=str(Path(__file__).parent.parent / 'cache' / 'outbox.sqlite'))
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    list_parser = subparsers.add_parser('list', help="최근 작업 목록")
+    list_parser.add_argument('--status', nargs='+', help="표시할 상태 (예: unconfirmed)")
+    list_parser.add_argument('--limit', type=int, default=20)
+    resolve_parser = subparsers.add_parser('resolve', help="확인 필요(unconfirmed) 작업 정리")
+    resolve_parser.add_argument('job_id', type=int)
+    outcome = resolve_parser.add_mutually_exclusive_group(required=True)
+    outcome.add_argument('--published', action='store_true', help="블로그에 발행된 것을 확인함")
+    outcome.add_argument('--retry', action='store_true', help="발행되지 않았음을 확인함 (다시 발행)")
+    args = parser.parse_args()
+
+    outbox = PublishOutbox(args.path)
+    try:
+        if args.command == 'list':
+            for job in outbox.jobs(args.status, args.limit):
+                print(f"#{job['id']:>4} {job['run_date']} {job['status']:>11} 시도 {job['attempts']}회  "
+                      f"{job['title']}  {job['last_error'] or ''}")
+        elif outbox.resolve(args.job_id, published=args.published):
+            print(f"작업 #{args.job_id}: {'발행 완료로 기록' if args.published else '대기열로 되돌림'}")
+        else:
+            print(f"작업 #{args.job_id} 는 확인 필요(unconfirmed) 상태가 아닙니다.")
+    finally:
+        outbox.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import logging
+import os
+import xmlrpc.client
+from typing import List
+from urllib.parse import urlsplit
+import requests
+from urllib3.exceptions import NewConnectionError
+from blog_poster import NaverBlogPoster
+from browser_pool import BrowserDaemon
+from http_client import get_http_client
+from markdown_html import markdown_to_html
+from publish_outbox import NOT_SENT, PUBLISHED, UNKNOWN
+
+
+class Publisher:
+    """블로그 발행 백엔드의 기본 클래스입니다.
+    publish 는 발행 결과(PUBLISHED, 보내기 전 실패 NOT_SENT, 보낸 뒤 실패/확인 불가 UNKNOWN)를 반환합니다.
+    """
+    name = 'base'
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+
+    def publish(self, title: str, content: str, tags: List[str]) -> str:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SeleniumPublisher(Publisher):
+    """브라우저로 글쓰기 화면을 조작해 발행합니다. (NaverBlogPoster 사용)"""
+    name = 'selenium'
+
+    def __init__(self, config: dict, daemon: BrowserDaemon = None):
+        super().__init__(config)
+        self.poster = NaverBlogPoster(config, daemon=daemon)
+
+    def publish(self, title: str, content: str, tags: List[str]) -> str:
+        print("- 웹드라이버 설정 중...")
+        if not self.poster.setup_driver():
+            self.logger.error("웹드라이버 설정 실패")
+            print("✗ 웹드라이버 설정 실패.")
+            return NOT_SENT
+
+        print("- 네이버 로그인 시도 중...")
+        if not self.poster.ensure_login():
+            self.logger.error("네이버 로그인 실패")
+            print("✗ 네이버 로그인 실패.")
+            return NOT_SENT
+
+        print("- 블로그 글 작성 및 발행 중...")
+        if self.poster.create_post(title, content, tags):
+            return PUBLISHED
+        # 최종 발행 버튼을 누른 뒤의 실패(페이지 이동 없음 등)는 이미 발행됐을 수 있음
+        return UNKNOWN if self.poster.publish_submitted else NOT_SENT
+
+    def close(self):
+        self.poster.close()
+
+
+class _HttpClientTransport(xmlrpc.client.Transport):
+    """XML-RPC 요청을 공용 HTTP 클라이언트(커넥션 풀, 지연 시간 기록)로 보냅니다.
+    글 작성 요청은 중복 발행을 피하려고 재시도하지 않습니다.
+    """
+
+    def __init__(self, scheme: str, timeout: float):
+        super().__init__()
+        self.scheme = scheme
+        self.timeout = timeout
+
+    def request(self, host, handler, request_body, verbose=False):
+        response = get_http_client().post(
+            f"{self.scheme}://{host}{handler}",
+            data=request_body,
+            headers={'Content-Type': 'text/xml', 'User-Agent': self.user_agent},
+            timeout=self.timeout,
+            max_retries=0
+        )
+        if response.status_code != 200:
+            raise xmlrpc.client.ProtocolError(host + handler, response.status_code, response.reason, response.headers)
+        parser, unmarshaller = self.getparser()
+        parser.feed(response.content)
+        parser.close()
+        return unmarshaller.close()
+
+
+def _failed_before_send(error: Exception) -> bool:
+    """요청이 서버에 전달되기 전에 실패했는지 판단합니다. (연결 실패, 인증/주소 오류 응답)
+    응답 대기 시간 초과, 연결 끊김, 5xx 응답은 서버가 글을 만들었을 수 있으므로 False
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    if isinstance(error, xmlrpc.client.ProtocolError):
+        return 400 <= error.errcode < 500
+    return False
+
+
+class MetaWeblogPublisher(Publisher):
+    """MetaWeblog API(XML-RPC)의 metaWeblog.newPost 한 번으로 발행합니다.
+    본문 Markdown 은 HTML 로 변환해서 보내고, 태그는 mt_keywords 로 전달합니다.
+    """
+    name = 'metaweblog'
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        settings = config.get('blog_settings', {}).get('metaweblog', {})
+        self.endpoint = settings.get('endpoint', 'https://api.blog.naver.com/xmlrpc')
+        self.blog_id = settings.get('blog_id', 'gongnyangi')
+        self.category = settings.get('category')
+        self.username = os.getenv(settings.get('username_env', 'NAVER_USERNAME'))
+        self.api_key = os.getenv(settings.get('api_key_env', 'NAVER_BLOG_API_KEY'))
+        if not self.username or not self.api_key:
+            self.logger.error("MetaWeblog credentials not found in environment variables")
+            raise ValueError("블로그 API 사용자 또는 API 키가 환경변수에 설정되지 않았습니다.")
+        transport = _HttpClientTransport(urlsplit(self.endpoint).scheme, settings.get('timeout', 30))
+        self.proxy = xmlrpc.client.ServerProxy(self.endpoint, transport=transport, allow_none=True)
+
+    def publish(self, title: str, content: str, tags: List[str]) -> str:
+        post = {
+            'title': title,
+            'description': markdown_to_html(content),
+            'mt_keywords': ','.join(tags or [])
+        }
+        if self.category:
+            post['categories'] = [self.category]
+        try:
+            print("- 블로그 API 로 글 발행 중...")
+            post_id = self.proxy.metaWeblog.newPost(self.blog_id, self.username, self.api_key, post, True)
+            print(f"✓ 블로그 API 발행 완료 (글 번호: {post_id})")
+            return PUBLISHED
+        except xmlrpc.client.Fault as e:
+            # 서버가 요청을 처리하고 거부함 (글은 만들어지지 않음)
+            self.logger.error(f"MetaWeblog fault {e.faultCode}: {e.faultString}")
+            print(f"✗ 블로그 API 발행 실패: {e.faultString}")
+            return NOT_SENT
+        except Exception as e:
+            outcome = NOT_SENT if _failed_before_send(e) else UNKNOWN
+            self.logger.error(f"MetaWeblog publish failed ({outcome}): {e}", exc_info=True)
+            print(f"✗ 블로그 API 발행 실패: {e}")
+            return outcome
+
+
+def create_publisher(config: dict, daemon: BrowserDaemon = None) -> Publisher:
+    """설정(blog_settings.backend)에 맞는 발행 백엔드를 생성합니다."""
+    backend = config.get('blog_settings', {}).get('backend', SeleniumPublisher.name)
+    if backend == MetaWeblogPublisher.name:
+        return MetaWeblogPublisher(config)
+    if backend != SeleniumPublisher.name:
+        logging.getLogger(__name__).warning(f"Unknown publish backend '{backend}', using selenium")
+    return SeleniumPublisher(config, daemon=daemon)
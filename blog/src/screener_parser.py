@@ -0,0 +1,116 @@
+import codecs
+import re
+import time
+import pandas as pd
+from html.parser import HTMLParser
+from typing import Iterable, List, Optional
+
+# 스크리너 표에서 사용하는 컬럼 (헤더 이름 → 결과 컬럼 이름)
+COLUMN_PATTERNS = [
+    ('Symbol', lambda header: header == 'Symbol'),
+    ('Name', lambda header: header == 'Name'),
+    ('Price', lambda header: 'Price' in header),
+    ('% Change', lambda header: 'Change %' in header or '% Change' in header),
+    ('Volume', lambda header: 'Volume' in header)
+]
+
+NUMBER_PATTERN = re.compile(r'[-+]?\d[\d,]*\.?\d*')
+
+
+def _to_float(text: str) -> float:
+    """셀 텍스트의 첫 번째 숫자를 float 로 변환합니다. ('92.17 -2.14 (-2.27%)' → 92.17)"""
+    match = NUMBER_PATTERN.search(text or '')
+    if not match:
+        return float('nan')
+    return float(match.group(0).replace(',', ''))
+
+
+class FirstTableParser(HTMLParser):
+    """문서의 첫 번째 <table> 만 읽고 멈추는 증분 파서입니다.
+    feed() 로 조각을 넣다가 done 이 True 가 되면 더 이상 넣을 필요가 없습니다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.headers: List[str] = []
+        self.rows: List[List[str]] = []
+        self.done = False
+        self._depth = 0
+        self._row: Optional[List[str]] = None
+        self._cell: Optional[List[str]] = None
+        self._cell_is_header = False
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == 'table':
+            self._depth += 1
+        elif self._depth == 1:
+            if tag == 'tr':
+                self._row = []
+            elif tag in ('td', 'th') and self._row is not None:
+                self._cell = []
+                self._cell_is_header = tag == 'th'
+
+    def handle_endtag(self, tag):
+        if self.done or self._depth == 0:
+            return
+        if tag == 'table':
+            self._depth -= 1
+            if self._depth == 0:
+                self.done = True
+        elif self._depth == 1:
+            if tag in ('td', 'th') and self._cell is not None:
+                self._row.append(' '.join(''.join(self._cell).split()))
+                self._cell = None
+            elif tag == 'tr' and self._row is not None:
+                if self._cell_is_header and not self.headers:
+                    self.headers = self._row
+                elif self._row:
+                    self.rows.append(self._row)
+                self._row = None
+
+    def handle_data(self, data):
+        if self._cell is not None and self._depth == 1:
+            self._cell.append(data)
+
+
+def parse_screener_stream(chunks: Iterable[bytes], encoding: str = 'utf-8',
+                          deadline: float = None) -> pd.DataFrame:
+    """HTML 바이트 조각을 받아 첫 번째 표의 Symbol/Name/Price/% Change/Volume 만 추출합니다.
+    Price 와 % Change 는 float 로 변환하고, Volume 은 'K/M/B' 접미사가 붙은 원문을 유지합니다.
+    deadline(time.monotonic 기준 시각)을 넘기면 TimeoutError 를 발생시킵니다.
+    """
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    parser = FirstTableParser()
+    for chunk in chunks:
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError("Screener page download exceeded deadline")
+        parser.feed(decoder.decode(chunk))
+        if parser.done:
+            break
+    else:
+        parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+
+    if not parser.headers:
+        raise ValueError("No table found in screener page")
+
+    column_index = {}
+    for name, matches in COLUMN_PATTERNS:
+        index = next((i for i, header in enumerate(parser.headers) if matches(header)), None)
+        if index is not None:
+            column_index[name] = index
+
+    missing_cols = {'Symbol', 'Name'} - set(column_index)
+    if missing_cols:
+        raise ValueError(f"Missing required columns: {missing_cols}")
+    if 'Price' not in column_index or '% Change' not in column_index:
+        raise ValueError(f"Could not find price or change columns in {parser.headers}")
+
+    width = len(parser.headers)
+    rows = [row + [''] * (width - len(row)) for row in parser.rows]
+    result_df = pd.DataFrame({name: [row[index] for row in rows] for name, index in column_index.items()})
+    result_df['Price'] = result_df['Price'].map(_to_float).astype('float64')
+    result_df['% Change'] = result_df['% Change'].map(_to_float).astype('float64')
+    return result_df
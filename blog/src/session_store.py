@@ -0,0 +1,124 @@
+import pickle
+import logging
+import time
+from pathlib import Path
+import requests
+from http_client import get_http_client
+
+
+class NaverSessionStore:
+    """로그인 후 브라우저 쿠키와 localStorage 를 파일로 저장하고 다음 실행에서 복원합니다.
+
+    세션 유효성은 저장된 쿠키로 check_url 에 리다이렉트 없이 한 번 요청해서 판단합니다.
+    로그인 페이지(login_marker 포함)로 리다이렉트되면 만료된 것으로 봅니다.
+    """
+
+    def __init__(self, path, check_url: str, login_marker: str = 'nidlogin', timeout: float = 5,
+                 user_agent: str = None):
+        self.path = Path(path)
+        self.headers = {'User-Agent': user_agent} if user_agent else {}
+        self.check_url = check_url
+        self.login_marker = login_marker
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+
+    def save(self, driver) -> bool:
+        """현재 브라우저의 쿠키와 현재 origin 의 localStorage 를 저장합니다."""
+        try:
+            origin, local_storage = driver.execute_script(
+                "return [window.location.origin, Object.assign({}, window.localStorage)];"
+            )
+            state = {
+                'cookies': driver.get_cookies(),
+                'origin': origin,
+                'local_storage': local_storage or {},
+                'saved_at': time.time()
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(state, f)
+            tmp_path.replace(self.path)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to save Naver session: {e}")
+            return False
+
+    def load(self):
+        """저장된 세션을 읽습니다. 없거나 손상되었으면 None"""
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                state = pickle.load(f)
+            return state if state.get('cookies') else None
+        except Exception as e:
+            self.logger.warning(f"Saved Naver session unreadable, ignoring: {e}")
+            return None
+
+    def clear(self):
+        self.path.unlink(missing_ok=True)
+
+    def is_valid(self, cookies) -> bool:
+        """쿠키로 check_url 에 한 번 요청해 로그인 페이지로 돌려보내지 않으면 유효한 세션으로 판단합니다."""
+        jar = requests.cookies.RequestsCookieJar()
+        for cookie in cookies:
+            jar.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        try:
+            response = get_http_client().get(
+                self.check_url, headers=self.headers, cookies=jar, allow_redirects=False, timeout=self.timeout, max_retries=0
+            )
+        except Exception as e:
+            self.logger.warning(f"Session check request failed: {e}")
+            return False
+        location = response.headers.get('Location', '')
+        response.close()
+        if response.is_redirect and self.login_marker in location:
+            return False
+        return response.status_code < 400
+
+    def restore(self, driver, state: dict) -> bool:
+        """저장된 쿠키를 브라우저에 넣고, localStorage 가 있으면 해당 origin 으로 이동해 복원합니다."""
+        cookies = state['cookies']
+        try:
+            # CDP 로 넣으면 도메인별로 페이지를 열 필요가 없음
+            driver.execute_cdp_cmd('Network.setCookies', {'cookies': [self._cdp_cookie(c) for c in cookies]})
+            if state.get('local_storage'):
+                driver.get(state['origin'])
+        except Exception as e:
+            self.logger.info(f"CDP cookie restore unavailable, falling back to add_cookie: {e}")
+            try:
+                driver.get(state['origin'])
+                for cookie in cookies:
+                    try:
+                        driver.add_cookie({k: v for k, v in cookie.items() if k != 'sameSite'})
+                    except Exception:
+                        continue  # 현재 도메인과 맞지 않는 쿠키
+            except Exception as e:
+                self.logger.warning(f"Failed to restore Naver session cookies: {e}")
+                return False
+
+        if state.get('local_storage'):
+            try:
+                driver.execute_script(
+                    "for (const [k, v] of Object.entries(arguments[0])) { window.localStorage.setItem(k, v); }",
+                    state['local_storage']
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to restore localStorage: {e}")
+        return True
+
+    def _cdp_cookie(self, cookie: dict) -> dict:
+        result = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie['domain'],
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False)
+        }
+        if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+            result['sameSite'] = cookie['sameSite']
+        if 'expiry' in cookie:
+            result['expires'] = cookie['expiry']
+        return result
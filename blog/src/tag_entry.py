@@ -0,0 +1,86 @@
+from selenium.webdriver.common.keys import Keys
+import logging
+from typing import List
+
+# 발행 설정 창에 표시된 태그 항목 선택자 (태그 입력창의 상위 영역 안에서 찾음)
+TAG_CHIP_SELECTOR = '[class*="tag_item"], [class*="tag_text"]'
+
+# 입력창에 태그를 하나씩 넣고 Enter 키 이벤트를 보내 한 번의 스크립트 호출로 모두 추가
+# React 가 값 변경을 감지하도록 네이티브 value setter 로 값을 넣고 input 이벤트를 발생시킴
+BULK_TAG_SCRIPT = """
+    var input = arguments[0], tags = arguments[1];
+    var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    input.focus();
+    for (var i = 0; i < tags.length; i++) {
+        setter.call(input, tags[i]);
+        input.dispatchEvent(new Event('input', {bubbles: true}));
+        ['keydown', 'keypress', 'keyup'].forEach(function (type) {
+            input.dispatchEvent(new KeyboardEvent(type, {
+                key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true, cancelable: true
+            }));
+        });
+    }
+    setter.call(input, '');
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+"""
+
+# 태그 입력창 주변에 표시된 태그 텍스트 목록을 반환 ('#' 제거)
+READ_TAGS_SCRIPT = """
+    var input = arguments[0], selector = arguments[1];
+    var root = input.parentElement;
+    while (root && root !== document.body && !root.querySelector(selector)) {
+        root = root.parentElement;
+    }
+    var chips = (root || document).querySelectorAll(selector);
+    var texts = [];
+    for (var i = 0; i < chips.length; i++) {
+        texts.push((chips[i].textContent || '').trim().replace(/^#/, ''));
+    }
+    return texts;
+"""
+
+
+def normalize_tag(tag: str) -> str:
+    """비교용 태그 표기 (에디터가 공백과 '#' 을 제거하므로 동일하게 처리)"""
+    return ''.join(tag.split()).lstrip('#')
+
+
+def read_tags(driver, tag_input, chip_selector: str = TAG_CHIP_SELECTOR) -> List[str]:
+    return driver.execute_script(READ_TAGS_SCRIPT, tag_input, chip_selector) or []
+
+
+def missing_tags(tags: List[str], rendered: List[str]) -> List[str]:
+    accepted = {normalize_tag(tag) for tag in rendered}
+    return [tag for tag in tags if normalize_tag(tag) not in accepted]
+
+
+def enter_tags_bulk(driver, tag_input, tags: List[str], waits, retries: int = 2,
+                    chip_selector: str = TAG_CHIP_SELECTOR) -> List[str]:
+    """태그를 한 번의 스크립트 호출로 모두 입력하고, 표시된 태그를 읽어 빠진 태그만 다시 입력합니다.
+    재시도 후에도 표시되지 않은 태그 목록을 반환합니다.
+    """
+    logger = logging.getLogger(__name__)
+    pending = list(tags)
+    for attempt in range(retries + 1):
+        driver.execute_script(BULK_TAG_SCRIPT, tag_input, pending)
+        waits.dom_quiet(f'태그 반영 ({attempt + 1}차, {len(pending)}개)', quiet_ms=300, timeout=3)
+        rendered = read_tags(driver, tag_input, chip_selector)
+        if not rendered:
+            # 선택자가 맞지 않아 확인할 수 없는 경우 중복 입력을 피하려고 재시도하지 않음
+            logger.warning(f"Rendered tags not found with selector '{chip_selector}', cannot verify tags")
+            return pending
+        pending = missing_tags(pending, rendered)
+        if not pending:
+            return []
+        if attempt < retries:
+            logger.info(f"태그 {len(pending)}개 미반영, 재시도 ({attempt + 1}/{retries}): {pending}")
+    return pending
+
+
+def enter_tags_typing(tag_input, tags: List[str], waits):
+    """태그를 하나씩 키 입력으로 추가합니다. (기존 방식)"""
+    for tag in tags:
+        tag_input.clear()
+        tag_input.send_keys(tag)
+        tag_input.send_keys(Keys.ENTER)
+        waits.dom_quiet(f'태그 반영 ({tag})', quiet_ms=200, timeout=2)
@@ -63,6 +63,26 @@ def parse_price_string(price_str):
         logging.error(f"Error parsing price string '{price_str}': {e}")
         return 0.0, '0'
 
+def format_price(price) -> str:
+    """숫자 가격을 표시용 문자열로 변환합니다. 예: 1234.5 -> "1,234.50" """
+    try:
+        return f"{float(price):,.2f}"
+    except (TypeError, ValueError):
+        return str(price)
+
+def format_volume(volume) -> str:
+    """숫자 거래량을 K/M/B 접미사 문자열로 변환합니다. 예: 12345678 -> "12.35M" """
+    try:
+        volume = float(volume)
+    except (TypeError, ValueError):
+        return str(volume)
+    if volume != volume:  # NaN
+        return 'N/A'
+    for suffix, unit in (('B', 1_000_000_000), ('M', 1_000_000), ('K', 1_000)):
+        if abs(volume) >= unit:
+            return f"{volume / unit:.2f}{suffix}"
+    return f"{volume:.0f}"
+
 def confirm_action(message: str) -> bool:
     """사용자 확인을 항상 True로 반환합니다."""
     return True
@@ -0,0 +1,112 @@
+import logging
+import time
+from typing import Callable, List, Tuple
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+# 문서 전체의 DOM 변경 시각을 기록하는 MutationObserver 를 (한 번만) 설치하고 마지막 변경 후 경과 시간(ms)을 반환
+DOM_QUIET_SCRIPT = """
+if (!window.__waitEngineObserver) {
+    window.__waitEngineLastMutation = performance.now();
+    window.__waitEngineObserver = new MutationObserver(function () {
+        window.__waitEngineLastMutation = performance.now();
+    });
+    window.__waitEngineObserver.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+return performance.now() - window.__waitEngineLastMutation;
+"""
+
+# Resource Timing 기준으로 [완료된 요청 수, 마지막 응답 완료 후 경과 시간(ms)] 을 반환
+NETWORK_IDLE_SCRIPT = """
+if (!window.__waitEngineTimingBuffer) {
+    performance.setResourceTimingBufferSize(10000);
+    window.__waitEngineTimingBuffer = true;
+}
+var entries = performance.getEntriesByType('resource');
+var last = 0;
+for (var i = 0; i < entries.length; i++) {
+    last = Math.max(last, entries[i].responseEnd || entries[i].startTime);
+}
+return [entries.length, performance.now() - last];
+"""
+
+
+class WaitEngine:
+    """고정 sleep 대신 명시적 조건(요소 상태, URL 변경, DOM 변경 없음, 네트워크 유휴)을 기다립니다.
+    모든 대기는 단계 이름과 제한 시간을 가지며, 실제로 기다린 시간을 기록해 실행 로그에 남깁니다.
+    """
+
+    def __init__(self, driver, poll: float = 0.1):
+        self.driver = driver
+        self.poll = poll
+        self.logger = logging.getLogger(__name__)
+        self.records: List[Tuple[str, str, float, float, bool]] = []
+
+    def until(self, step: str, condition: Callable, timeout: float, kind: str = 'condition'):
+        """condition(driver) 가 참 값을 반환할 때까지 기다려 그 값을 반환합니다. 시간 초과 시 TimeoutException"""
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=self.poll).until(condition)
+            self._record(step, kind, time.monotonic() - start, timeout, True)
+            return result
+        except TimeoutException:
+            self._record(step, kind, time.monotonic() - start, timeout, False)
+            raise
+
+    def element(self, step: str, locator: Tuple[str, str], timeout: float, clickable: bool = False):
+        """요소가 나타날(clickable=True 면 클릭 가능해질) 때까지 기다립니다."""
+        condition = EC.element_to_be_clickable(locator) if clickable else EC.presence_of_element_located(locator)
+        return self.until(step, condition, timeout, kind='clickable' if clickable else 'element')
+
+    def present(self, step: str, locator: Tuple[str, str], timeout: float) -> bool:
+        """요소가 나타날 때까지 기다립니다. 시간 초과 시 예외 대신 False"""
+        return self._soft(step, EC.presence_of_element_located(locator), timeout, 'element')
+
+    def gone(self, step: str, locator: Tuple[str, str], timeout: float) -> bool:
+        """요소가 사라지거나 보이지 않게 될 때까지 기다립니다. 시간 초과 시 False"""
+        return self._soft(step, EC.invisibility_of_element_located(locator), timeout, 'gone')
+
+    def url_change(self, step: str, away_from: str, timeout: float) -> bool:
+        """현재 URL 에 away_from 이 더 이상 포함되지 않을 때까지 기다립니다. 시간 초과 시 False"""
+        return self._soft(step, lambda d: away_from not in d.current_url, timeout, 'url')
+
+    def dom_quiet(self, step: str, quiet_ms: float = 500, timeout: float = 5) -> bool:
+        """quiet_ms 동안 DOM 변경이 없을 때까지 기다립니다. 시간 초과 시 False"""
+        return self._soft(step, lambda d: d.execute_script(DOM_QUIET_SCRIPT) >= quiet_ms, timeout, 'dom-quiet')
+
+    def network_idle(self, step: str, idle_ms: float = 500, timeout: float = 10) -> bool:
+        """idle_ms 동안 새로 완료된 요청이 없을 때까지 기다립니다. 시간 초과 시 False"""
+        seen = {'count': None}
+
+        def idle(driver):
+            count, since_last = driver.execute_script(NETWORK_IDLE_SCRIPT)
+            unchanged = count == seen['count']
+            seen['count'] = count
+            return unchanged and since_last >= idle_ms
+
+        return self._soft(step, idle, timeout, 'network-idle')
+
+    def total_waited(self) -> float:
+        return sum(record[2] for record in self.records)
+
+    def log_summary(self):
+        """단계별 대기 시간을 실행 로그에 기록합니다. (오래 기다린 순)"""
+        if not self.records:
+            return
+        for step, kind, waited, timeout, ok in sorted(self.records, key=lambda r: r[2], reverse=True):
+            self.logger.info(
+                f"대기 [{step}] {kind}: {waited:.2f}s / {timeout:g}s{'' if ok else ' (시간 초과)'}"
+            )
+        self.logger.info(f"대기 합계: {self.total_waited():.2f}s ({len(self.records)}단계)")
+        print(f"- 대기 시간 합계: {self.total_waited():.1f}초 ({len(self.records)}단계, 상세 내역은 로그 참고)")
+
+    def _soft(self, step: str, condition: Callable, timeout: float, kind: str) -> bool:
+        try:
+            self.until(step, condition, timeout, kind=kind)
+            return True
+        except TimeoutException:
+            return False
+
+    def _record(self, step: str, kind: str, waited: float, timeout: float, ok: bool):
+        self.records.append((step, kind, waited, timeout, ok))